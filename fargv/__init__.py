@@ -36,28 +36,34 @@ import sys
 from .version import __version__
 from .fargv_legacy import fargv
 from .parse import parse, parse_and_launch, parse_here
-from .namespace import FargvNamespace, FargvBackend, FargvConfigBackend, FargvTkBackend
+from .sweep import sweep, Sweep
+from .digest import result_digest
+from .namespace import (
+    FargvNamespace, FargvBackend, FargvAsyncDispatcher, FargvConfigBackend, FargvWatchBackend, FargvSqliteBackend,
+    FargvSharedMemoryBackend, FargvSocketBackend, FargvTkBackend,
+)
 from .parameters import (
     FargvError, FargvParameter, REQUIRED,
     FargvInt, FargvFloat, FargvBool, FargvBoolHelp,
     FargvHelp, FargvVerbosity, FargvBashAutocomplete, FargvConfig,
     FargvUserInterface,
     FargvStr, FargvChoice, FargvVariadic, FargvPositional,
-    FargvStream, FargvInputStream, FargvOutputStream,
+    FargvStream, FargvInputStream, FargvOutputStream, FargvBinaryInput,
     FargvPath, FargvExistingFile, FargvNonExistingFile, FargvFile,
     FargvTuple, FargvSubcommand,
 )
 from .parser import ArgumentParser
 
 __all__ = [
-    "fargv", "parse", "parse_and_launch", "parse_here",
+    "fargv", "parse", "parse_and_launch", "parse_here", "sweep", "Sweep", "result_digest",
     "FargvError", "FargvParameter", "REQUIRED",
     "FargvInt", "FargvFloat", "FargvBool", "FargvBoolHelp",
     "FargvHelp", "FargvVerbosity", "FargvBashAutocomplete", "FargvConfig",
     "FargvUserInterface",
-    "FargvNamespace", "FargvBackend", "FargvConfigBackend", "FargvTkBackend",
+    "FargvNamespace", "FargvBackend", "FargvAsyncDispatcher", "FargvConfigBackend", "FargvWatchBackend",
+    "FargvSqliteBackend", "FargvSharedMemoryBackend", "FargvSocketBackend", "FargvTkBackend",
     "FargvStr", "FargvChoice", "FargvVariadic", "FargvPositional",
-    "FargvStream", "FargvInputStream", "FargvOutputStream",
+    "FargvStream", "FargvInputStream", "FargvOutputStream", "FargvBinaryInput",
     "FargvPath", "FargvExistingFile", "FargvNonExistingFile", "FargvFile",
     "FargvTuple", "FargvSubcommand",
     "ArgumentParser",
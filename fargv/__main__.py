@@ -9,6 +9,7 @@ Usage
 ::
 
     python -m fargv <target> [--param=value ...]
+    python -m fargv --serve <module> [--socket=PATH]
 
 ``target`` is a dotted Python path to a **callable** or a **module**:
 
@@ -32,9 +33,19 @@ Examples
 
     # --help always works
     python -m fargv mypackage.train --help
+
+    # Reuse the result of an identical earlier call (see fargv.memo)
+    python -m fargv mypackage.features --src=data.csv --fargv_memo=.memo
+    FARGV_MEMO=.memo python -m fargv mypackage.features --src=data.csv
+
+    # Import mypackage once; later calls into it fork from the warm server
+    # (see fargv.forkserver)
+    python -m fargv --serve mypackage &
+    python -m fargv mypackage.train --lr=0.001
 """
 import importlib
 import inspect
+import os
 import sys
 
 
@@ -101,9 +112,12 @@ def _call_target(target, target_spec: str, rest_argv: list) -> None:
     :param rest_argv:   Remaining ``sys.argv`` tokens after the target spec.
     """
     import fargv
+    from .memo import MEMO_ENV, MemoCache
+    from .sweep import _pop_control_flags
 
     # first_is_name=True (default) consumes target_spec as progname
-    argv = [target_spec] + rest_argv
+    argv, control = _pop_control_flags([target_spec] + rest_argv, "--", ("fargv_memo",), ())
+    memo_dir = control.get("fargv_memo", [os.environ.get(MEMO_ENV)])[-1]
 
     try:
         p, _ = fargv.parse(
@@ -136,21 +150,13 @@ def _call_target(target, target_spec: str, rest_argv: list) -> None:
             except (ValueError, SyntaxError):
                 pass
         kwargs[k] = v
-    result = target(**kwargs)
+    result = MemoCache(memo_dir).call(target, kwargs) if memo_dir else target(**kwargs)
     if result is not None:
         print(result)
 
 
-def main() -> None:
-    """Entry point for ``python -m fargv``."""
-    # ── no target: print usage ──────────────────────────────────────────────
-    if len(sys.argv) < 2 or sys.argv[1].startswith("-"):
-        print(__doc__)
-        sys.exit(0)
-
-    target_spec = sys.argv[1]
-    rest_argv   = sys.argv[2:]
-
+def _run(target_spec: str, rest_argv: list) -> None:
+    """Resolve *target_spec* and run it with *rest_argv* (a module runs its ``main``)."""
     target = _resolve_target(target_spec)
 
     # ── module target: look for main() or list callables ───────────────────
@@ -174,4 +180,45 @@ def main() -> None:
     sys.exit(1)
 
 
+def _serve(argv: list) -> None:
+    """``--serve <module> [--socket=PATH]``: run a fork server for *module*."""
+    from .forkserver import serve
+    from .parameters.base import FargvError
+    args = [a for a in argv if not a.startswith("--socket=")]
+    sockets = [a.split("=", 1)[1] for a in argv if a.startswith("--socket=")]
+    if len(args) != 1 or args[0].startswith("-"):
+        sys.stderr.write("usage: python -m fargv --serve <module> [--socket=PATH]\n")
+        sys.exit(2)
+    try:
+        serve(args[0], _run, sockets[-1] if sockets else None)
+    except (FargvError, ImportError, OSError) as exc:
+        sys.stderr.write(f"fargv: {exc}\n")
+        sys.exit(1)
+
+
+def main() -> None:
+    """Entry point for ``python -m fargv``."""
+    if len(sys.argv) >= 2 and sys.argv[1] == "--serve":
+        _serve(sys.argv[2:])
+        return
+
+    # ── no target: print usage ──────────────────────────────────────────────
+    if len(sys.argv) < 2 or sys.argv[1].startswith("-"):
+        print(__doc__)
+        sys.exit(0)
+
+    target_spec = sys.argv[1]
+    rest_argv   = sys.argv[2:]
+
+    # ── a fork server covering the target runs the call in a warm process ──
+    from .forkserver import find_server, run_remote
+    server = find_server(target_spec)
+    if server is not None:
+        status = run_remote(server, target_spec, rest_argv)
+        if status is not None:
+            sys.exit(status)
+
+    _run(target_spec, rest_argv)
+
+
 main()
@@ -17,6 +17,14 @@ gives JSON a pseudo-comment mechanism::
 
     {"fargv_comment_lr": "learning rate", "lr": 0.01}
 
+Layered configs
+---------------
+:func:`load_config_layers` merges several config files in order (later files
+win).  A file may pull in others with an ``include`` / ``fargv_include`` key
+(a path or a list of paths, relative to the including file); included files
+are merged first so the including file's own keys override them.  Each file
+is merged at most once per load and cycles are rejected.
+
 Unknown-key policy (``unknown_keys`` parameter)
 ------------------------------------------------
 ``"ignore_dict_and_warn"`` (default)
@@ -28,11 +36,12 @@ Unknown-key policy (``unknown_keys`` parameter)
 ``"raise"``
     Raise :class:`~fargv.parameters.FargvError` on the first unknown key.
 """
+import copy
 import json
 import os
 import sys
 from pathlib import Path
-from typing import Any, Dict, Literal, Optional
+from typing import Any, Dict, Iterator, List, Literal, Optional, Tuple
 
 
 # ---------------------------------------------------------------------------
@@ -70,17 +79,208 @@ def _detect_format(path: Path) -> str:
 # Config loading
 # ---------------------------------------------------------------------------
 
-def load_config(path: Optional[Path]) -> Dict[str, Any]:
+# Process-level cache: realpath → (mtime_ns, size, flat dict).  An entry is
+# reused only while the file's mtime and size are unchanged.
+_CONFIG_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+_SIDECAR_VERSION = 1
+
+
+def _sidecar_dir_from_env() -> Optional[Path]:
+    """``FARGV_CONFIG_SIDECAR``: unset / ``0`` → off, ``1`` → default dir, else a directory."""
+    val = os.environ.get("FARGV_CONFIG_SIDECAR", "")
+    if val in ("", "0"):
+        return None
+    if val == "1":
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        return Path(base) / "fargv" / "config"
+    return Path(val).expanduser()
+
+
+_sidecar_dir: Optional[Path] = _sidecar_dir_from_env()
+
+
+def set_config_sidecar(cache_dir) -> None:
+    """Enable compiled config sidecars under *cache_dir*, or disable them with ``None``.
+
+    When enabled, every config parsed by :func:`load_config` (JSON, INI, TOML
+    or YAML) is also stored as a :mod:`marshal` file holding the flattened
+    dict.  Later processes load the sidecar instead of re-parsing the source
+    as long as the source's realpath, ``mtime_ns`` and size still match; a
+    stale, corrupt or unwritable sidecar silently falls back to parsing.
+
+    The initial setting comes from the ``FARGV_CONFIG_SIDECAR`` environment
+    variable (``1`` selects ``$XDG_CACHE_HOME/fargv/config``).
+    """
+    global _sidecar_dir
+    _sidecar_dir = None if cache_dir is None else Path(cache_dir).expanduser()
+
+
+def _sidecar_path(real: str) -> Path:
+    import hashlib
+    return _sidecar_dir / (hashlib.sha256(real.encode("utf-8", "surrogateescape")).hexdigest()[:32] + ".marshal")
+
+
+def _read_sidecar(real: str, st) -> Optional[Dict[str, Any]]:
+    """Return the sidecar dict for *real* if it matches *st*, else ``None``."""
+    import marshal
+    try:
+        with open(_sidecar_path(real), "rb") as fh:
+            version, src, mtime_ns, size, data = marshal.load(fh)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if (version, src, mtime_ns, size) != (_SIDECAR_VERSION, real, st.st_mtime_ns, st.st_size):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _write_sidecar(real: str, st, data: Dict[str, Any]) -> None:
+    """Atomically write the sidecar for *real*; failures are ignored."""
+    import marshal
+    import tempfile
+    try:
+        blob = marshal.dumps((_SIDECAR_VERSION, real, st.st_mtime_ns, st.st_size, data))
+    except ValueError:
+        return   # e.g. TOML datetimes — not marshallable
+    target = _sidecar_path(real)
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=str(target.parent), suffix=".tmp")
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(blob)
+        os.replace(tmp, target)
+    except OSError:
+        pass
+
+
+def clear_config_cache() -> None:
+    """Forget every parsed config held by the :func:`load_config` cache.
+
+    Sidecar files on disk are left alone; they are revalidated on use.
+    """
+    _CONFIG_CACHE.clear()
+
+
+def load_config(path: Optional[Path], use_cache: bool = True) -> Dict[str, Any]:
     """Load a config file and return a flat ``Dict[str, Any]``.
 
     ``fargv_comment*`` keys are silently dropped.
     Returns ``{}`` when *path* is ``None`` or the file does not exist.
+
+    Parsed results are cached per process, keyed by
+    ``(realpath, mtime_ns, size)``; repeated loads of an unchanged file return
+    a fresh deep copy of the cached dict without re-reading it, so callers may
+mutate nested lists and dicts freely.  Use
+    :func:`clear_config_cache` to drop the cache, or ``use_cache=False`` to
+    bypass it (and any sidecar, see :func:`set_config_sidecar`).
     """
     if not path:
         return {}
     path = Path(path)
-    if not path.exists() or not path.is_file():
+    try:
+        st = path.stat()
+    except OSError:
         return {}
+    if not path.is_file():
+        return {}
+    if not use_cache:
+        return _load_uncached(path)
+    real = os.path.realpath(path)
+    hit = _CONFIG_CACHE.get(real)
+    if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        return copy.deepcopy(hit[2])
+    data = _read_sidecar(real, st) if _sidecar_dir is not None else None
+    if data is None:
+        data = _load_uncached(path)
+        if _sidecar_dir is not None:
+            _write_sidecar(real, st, data)
+    _CONFIG_CACHE[real] = (st.st_mtime_ns, st.st_size, data)
+    return copy.deepcopy(data)
+
+
+INCLUDE_KEYS = ("fargv_include", "include")
+"""Config keys treated as include directives by :func:`load_config_layers`."""
+
+
+def load_config_layers(
+    paths,
+    include_keys=INCLUDE_KEYS,
+    use_cache: bool = True,
+) -> Dict[str, Any]:
+    """Load *paths* in order, expand include directives and merge into one flat dict.
+
+    Every file goes through :func:`load_config`, so a base file shared by
+    many layers (or by many jobs in one process) is parsed once.  Within a
+    single call each file is merged at most once, at its first occurrence;
+    a diamond of includes therefore does not re-apply the shared base over
+    a layer that overrode it.
+
+    :param paths:        Config file paths, lowest priority first.
+    :param include_keys: Keys holding include directives; they are removed
+                         from the merged result.
+    :param use_cache:    Forwarded to :func:`load_config`.
+    :return: Merged flat ``{key: value}`` dict.
+    :raises ValueError: On an include cycle or an unparsable file.
+    """
+    merged: Dict[str, Any] = {}
+    merged_files: set = set()
+    for path in paths:
+        if path:
+            _merge_config_layer(Path(path), merged, merged_files, (), include_keys, use_cache)
+    return merged
+
+
+SWEEP_KEYS = ("fargv_sweep", "fargv_zip")
+"""Config keys (and ``fargv_sweep.<name>`` entries) that describe a sweep for
+:func:`fargv.sweep`; :func:`fargv.parse` ignores them."""
+
+
+def pop_sweep_keys(cfg: Dict[str, Any]) -> Dict[str, Any]:
+    """Remove the sweep directives from the flat config *cfg* and return them.
+
+    :param cfg: Flat ``{key: value}`` dict, modified in place.
+    :return: The removed entries; a nested ``fargv_sweep`` section comes back
+             as ``fargv_sweep.<name>`` keys.
+    """
+    found = [k for k in cfg if k in SWEEP_KEYS or k.startswith(SWEEP_KEYS[0] + ".")]
+    out: Dict[str, Any] = {}
+    for key in found:
+        value = cfg.pop(key)
+        if key == SWEEP_KEYS[0] and isinstance(value, dict):
+            out.update((f"{key}.{name}", expr) for name, expr in value.items())
+        else:
+            out[key] = value
+    return out
+
+
+def _merge_config_layer(path: Path, merged: Dict[str, Any], merged_files: set,
+                        stack: Tuple[str, ...], include_keys, use_cache: bool) -> None:
+    real = os.path.realpath(path)
+    if real in stack:
+        raise ValueError(f"Config include cycle: {' -> '.join(stack + (real,))}")
+    if real in merged_files:
+        return
+    data = load_config(path, use_cache=use_cache)
+    includes: List[str] = []
+    for key in include_keys:
+        val = data.pop(key, None)
+        if val is None:
+            continue
+        includes.extend([val] if isinstance(val, (str, Path)) else val)
+    for inc in includes:
+        inc_path = Path(os.path.expanduser(str(inc)))
+        if not inc_path.is_absolute():
+            inc_path = path.parent / inc_path
+        if not inc_path.is_file():
+            print(f"fargv: {path}: included config '{inc}' not found", file=sys.stderr)
+            continue
+        _merge_config_layer(inc_path, merged, merged_files, stack + (real,), include_keys, use_cache)
+    merged_files.add(real)
+    merged.update(data)
+
+
+def _load_uncached(path: Path) -> Dict[str, Any]:
+    """Dispatch to the format-specific loader for *path*."""
     fmt = _detect_format(path)
     if fmt == "json":
         return _load_json(path)
@@ -174,26 +374,80 @@ def _load_yaml(path: Path) -> Dict[str, Any]:
 # Flat parameter lookup
 # ---------------------------------------------------------------------------
 
+class FlatLookup:
+    """Index of every parameter reachable from a ``{name: FargvParameter}`` mapping.
+
+    Built once per :func:`~fargv.parse.parse` call and shared by the config,
+    env-var and dump paths, so the parameter tree (including every
+    subcommand parser) is walked a single time.
+
+    Each entry is ``(parts, top, param)`` where *parts* is the key path, e.g.
+    ``("train", "lr")`` for param ``lr`` of subcommand branch ``train``, and
+    *top* is the top-level name the entry hangs from (``"cmd"`` here).
+    Subcommand *field* names (e.g. ``cmd``) are NOT included — only branch
+    names are used as prefixes.  Nested subcommands are handled recursively.
+
+    * :attr:`dotted`      — ``{"train.lr": param}`` (config files)
+    * :attr:`underscored` — ``{"train_lr": param}`` (env vars)
+    """
+
+    def __init__(self, name2parameters: Dict[str, Any]) -> None:
+        self.entries: List[Tuple[Tuple[str, ...], str, Any]] = []
+        self._walk(name2parameters, (), None)
+        self.dotted: Dict[str, Any] = {".".join(parts): p for parts, _, p in self.entries}
+        self.underscored: Dict[str, Any] = {"_".join(parts): p for parts, _, p in self.entries}
+        self._env_indices: Dict[str, Dict[str, List[str]]] = {}
+
+    def _walk(self, name2parameters: Dict[str, Any], prefix: Tuple[str, ...],
+              top: Optional[str]) -> None:
+        for name, param in name2parameters.items():
+            if getattr(param, "is_subcommand", False):
+                param._ensure_sub_parsers()
+                for branch_name, sub_parser in param._sub_parsers.items():
+                    self._walk(sub_parser._name2parameters, prefix + (branch_name,), top or name)
+            else:
+                self.entries.append((prefix + (name,), top or name, param))
+
+    def env_index(self, prefix: str) -> Dict[str, List[str]]:
+        """Return ``{ENV_VAR_NAME: [underscored_key, ...]}`` for *prefix* (cached).
+
+        Several keys may map to one name when they differ only by case.
+        """
+        index = self._env_indices.get(prefix)
+        if index is None:
+            index = {}
+            for key in self.underscored:
+                index.setdefault(prefix + key.upper(), []).append(key)
+            self._env_indices[prefix] = index
+        return index
+
+    def by_separator(self, separator: str) -> Dict[str, Any]:
+        """Return the ``{flat_key: param}`` mapping for *separator*."""
+        if separator == ".":
+            return self.dotted
+        if separator == "_":
+            return self.underscored
+        return {separator.join(parts): p for parts, _, p in self.entries}
+
+    def iter_dump(self, exclude=None, separator: str = ".") -> Iterator[Tuple[str, Any]]:
+        """Yield ``(flat_key, param)`` for dumping: skips *exclude*d top-level names
+        and ``filter_out`` params."""
+        exclude = set(exclude or [])
+        for parts, top, param in self.entries:
+            if top in exclude or getattr(param, "filter_out", False):
+                continue
+            yield separator.join(parts), param
+
+
 def _build_flat_lookup(name2parameters, separator=".") -> Dict[str, Any]:
     """Build a ``{flat_key: FargvParameter}`` mapping for all params.
 
     Top-level param ``lr``  →  key ``lr``
     Subcommand branch ``train``, param ``lr``  →  key ``train{sep}lr``
-    Nested subcommands are handled recursively.
-    Subcommand *field* names (e.g. ``cmd``) are NOT included — only branch
-    names are used as prefixes.
+
+    Convenience wrapper around :class:`FlatLookup` for one-off lookups.
     """
-    lookup: Dict[str, Any] = {}
-    for name, param in name2parameters.items():
-        if getattr(param, "is_subcommand", False):
-            param._ensure_sub_parsers()
-            for branch_name, sub_parser in param._sub_parsers.items():
-                sub_lookup = _build_flat_lookup(sub_parser._name2parameters, separator)
-                for sub_key, sub_param in sub_lookup.items():
-                    lookup[f"{branch_name}{separator}{sub_key}"] = sub_param
-        else:
-            lookup[name] = param
-    return lookup
+    return FlatLookup(name2parameters).by_separator(separator)
 
 
 # ---------------------------------------------------------------------------
@@ -206,6 +460,7 @@ def apply_overrides(
     source: str,
     unknown_keys: Literal["raise", "ignore_key_and_warn", "ignore_dict_and_warn"] = "ignore_dict_and_warn",
     separator: str = ".",
+    lookup: Optional[FlatLookup] = None,
 ) -> None:
     """Validate *overrides* against *name2parameters* and apply each value.
 
@@ -218,13 +473,15 @@ def apply_overrides(
     :param unknown_keys:    Policy when a key is not found in the parser.
     :param separator:       Key separator used to resolve subcommand branch params
                             (``"."`` for config files, ``"_"`` for env vars).
+    :param lookup:          Pre-built :class:`FlatLookup` for *name2parameters*;
+                            built on demand when omitted.
     """
     from .parameters import FargvError
 
     if not overrides:
         return
 
-    lookup = _build_flat_lookup(name2parameters, separator)
+    lookup = (lookup or FlatLookup(name2parameters)).by_separator(separator)
     unknown = [k for k in overrides if k not in lookup]
 
     if unknown:
@@ -258,6 +515,7 @@ def apply_config(
     config: Dict[str, Any],
     config_path,
     unknown_keys: Literal["raise", "ignore_key_and_warn", "ignore_dict_and_warn"] = "ignore_dict_and_warn",
+    lookup: Optional[FlatLookup] = None,
 ) -> None:
     """Apply a flat config dict to *name2parameters*.
 
@@ -270,6 +528,7 @@ def apply_config(
         source=f"config file '{config_path}'",
         unknown_keys=unknown_keys,
         separator=".",
+        lookup=lookup,
     )
 
 
@@ -277,6 +536,7 @@ def apply_env_vars(
     name2parameters: Dict[str, Any],
     progname: str,
     unknown_keys: Literal["raise", "ignore_key_and_warn", "ignore_dict_and_warn"] = "ignore_dict_and_warn",
+    lookup: Optional[FlatLookup] = None,
 ) -> None:
     """Apply matching environment variable overrides to *name2parameters*.
 
@@ -287,22 +547,48 @@ def apply_env_vars(
 
     The expected env var name is stamped onto each param as
     ``param._env_var_name`` for display in ``--help``.
+
+    ``os.environ`` is scanned once and filtered by the app prefix; each
+    prefixed name is matched against the lookup's precomputed env-var index.
+    Prefixed variables that match no parameter but closely resemble one are
+    reported on stderr as likely typos (they are otherwise ignored).
     """
     prefix = _app_name(progname).upper() + "_"
     separator = "_"
-    lookup = _build_flat_lookup(name2parameters, separator)
+    lookup = lookup or FlatLookup(name2parameters)
+    index = lookup.env_index(prefix)
 
     # Stamp every param with its expected env var name (for help display)
-    for key, param in lookup.items():
-        param._env_var_name = prefix + key.upper()
-
-    overrides = {
-        key: os.environ[prefix + key.upper()]
-        for key in lookup
-        if (prefix + key.upper()) in os.environ
-    }
+    for env_name, keys in index.items():
+        for key in keys:
+            lookup.underscored[key]._env_var_name = env_name
+
+    overrides: Dict[str, str] = {}
+    strays: List[str] = []
+    for env_name, val in os.environ.items():
+        if not env_name.startswith(prefix):
+            continue
+        keys = index.get(env_name)
+        if keys is None:
+            strays.append(env_name)
+            continue
+        for key in keys:
+            overrides[key] = val
+    if strays:
+        _warn_env_typos(strays, index)
     if overrides:
-        apply_overrides(name2parameters, overrides, "environment", unknown_keys, separator)
+        apply_overrides(name2parameters, overrides, "environment", unknown_keys, separator, lookup)
+
+
+def _warn_env_typos(names: List[str], index: Dict[str, List[str]]) -> None:
+    """Print a stderr hint for each prefixed env var that looks like a misspelt key."""
+    import difflib
+    known = list(index)
+    for name in sorted(names):
+        close = difflib.get_close_matches(name, known, n=1, cutoff=0.8)
+        if close:
+            print(f"fargv: environment: unknown variable {name!r}, "
+                  f"did you mean {close[0]!r}?", file=sys.stderr)
 
 
 # ---------------------------------------------------------------------------
@@ -310,31 +596,19 @@ def apply_env_vars(
 # ---------------------------------------------------------------------------
 
 def _serialise_value(param):
-    """Return ``(value, include)``; streams yield ``(None, False)``."""
+    """Return ``(value, include)``; streams and mapped buffers yield ``(None, False)``."""
     import io as _io
     val = param.value
-    if isinstance(val, _io.IOBase):
+    if isinstance(val, (_io.IOBase, memoryview)):
         return None, False
     if isinstance(val, Path):
         return str(val), True
     return val, True
 
 
-def _collect_flat_params(parser, exclude, separator="."):
+def _collect_flat_params(parser, exclude, separator=".", lookup: Optional[FlatLookup] = None):
     """Yield ``(flat_key, param)`` for all non-filtered parameters."""
-    exclude = set(exclude or [])
-    for name, param in parser._name2parameters.items():
-        if name in exclude or getattr(param, "filter_out", False):
-            continue
-        if getattr(param, "is_subcommand", False):
-            param._ensure_sub_parsers()
-            for branch_name, sub_parser in param._sub_parsers.items():
-                for pname, pparam in sub_parser._name2parameters.items():
-                    if getattr(pparam, "filter_out", False):
-                        continue
-                    yield f"{branch_name}{separator}{pname}", pparam
-        else:
-            yield name, param
+    yield from (lookup or FlatLookup(parser._name2parameters)).iter_dump(exclude, separator)
 
 
 def supported_dump_formats():
@@ -356,7 +630,8 @@ def supported_dump_formats():
     return fmts
 
 
-def dump_config(parser, fmt: str = "json", exclude=None, progname: Optional[str] = None) -> str:
+def dump_config(parser, fmt: str = "json", exclude=None, progname: Optional[str] = None,
+                lookup: Optional[FlatLookup] = None) -> str:
     """Serialise current parameter values as a config file string.
 
     Each parameter is preceded by a comment containing its full help line
@@ -370,28 +645,27 @@ def dump_config(parser, fmt: str = "json", exclude=None, progname: Optional[str]
     :param exclude:  Parameter names to omit.
     :param progname: When provided, env-var names are stamped onto params so
                      they appear in the help comments.
+    :param lookup:   Pre-built :class:`FlatLookup` for *parser*'s parameters.
     :raises ValueError:   Unknown format.
     :raises ImportError:  Required third-party library not installed.
     """
+    lookup = lookup or FlatLookup(parser._name2parameters)
     if progname:
         # Stamp expected env-var names so they show in docstring() output
         _prefix = _app_name(progname).upper() + "_"
-        for _key, _param in _build_flat_lookup(
-            {k: v for k, v in parser._name2parameters.items()
-             if k not in set(exclude or [])},
-            separator="_",
-        ).items():
-            if not getattr(_param, "_env_var_name", None):
-                _param._env_var_name = _prefix + _key.upper()
+        _exclude = set(exclude or [])
+        for _parts, _top, _param in lookup.entries:
+            if _top not in _exclude and not getattr(_param, "_env_var_name", None):
+                _param._env_var_name = _prefix + "_".join(_parts).upper()
 
     if fmt == "json":
-        return _dump_json(parser, exclude)
+        return _dump_json(parser, exclude, lookup)
     elif fmt == "ini":
-        return _dump_ini(parser, exclude)
+        return _dump_ini(parser, exclude, lookup)
     elif fmt == "toml":
-        return _dump_toml(parser, exclude)
+        return _dump_toml(parser, exclude, lookup)
     elif fmt == "yaml":
-        return _dump_yaml(parser, exclude)
+        return _dump_yaml(parser, exclude, lookup)
     else:
         raise ValueError(
             f"Unsupported config format: {fmt!r}. "
@@ -420,13 +694,13 @@ def _sep(cc: str, label: str = "") -> str:
 # Format-specific dump functions
 # ---------------------------------------------------------------------------
 
-def _dump_json(parser, exclude) -> str:
+def _dump_json(parser, exclude, lookup: Optional[FlatLookup] = None) -> str:
     """Flat JSON dump.  ``fargv_comment_*`` keys carry per-param help text.
     Subcommand sections get a ``fargv_comment__section_*`` separator entry."""
     data: Dict[str, Any] = {}
     current_branch: Optional[str] = None
 
-    for key, param in _collect_flat_params(parser, exclude, separator="."):
+    for key, param in _collect_flat_params(parser, exclude, ".", lookup):
         branch = key.split(".")[0] if "." in key else None
 
         if branch != current_branch:
@@ -445,7 +719,7 @@ def _dump_json(parser, exclude) -> str:
     return json.dumps(data, indent=2, default=str)
 
 
-def _dump_ini(parser, exclude) -> str:
+def _dump_ini(parser, exclude, lookup: Optional[FlatLookup] = None) -> str:
     """Single-``[main]``-section INI dump.  Flat dot-keys (e.g. ``train.lr``).
     Each param has a ``;`` comment line above it.  Variadic params are
     commented out with a note at the top.  Subcommand branches get a
@@ -455,7 +729,7 @@ def _dump_ini(parser, exclude) -> str:
     current_branch: Optional[str] = None
     has_body = False
 
-    for key, param in _collect_flat_params(parser, exclude, separator="."):
+    for key, param in _collect_flat_params(parser, exclude, ".", lookup):
         val, include = _serialise_value(param)
         if not include:
             continue
@@ -516,7 +790,7 @@ def _to_toml_literal(val) -> str:
     return json.dumps(str(val))
 
 
-def _dump_toml(parser, exclude) -> str:
+def _dump_toml(parser, exclude, lookup: Optional[FlatLookup] = None) -> str:
     """Flat TOML dump.  Dotted keys are quoted (``"train.lr" = 0.001``) so
     TOML does not interpret the dot as a table separator.  Variadic params
     are commented out.  Subcommand branches get a separator block."""
@@ -525,7 +799,7 @@ def _dump_toml(parser, exclude) -> str:
     current_branch = None
     has_body = False
 
-    for key, param in _collect_flat_params(parser, exclude, separator="."):
+    for key, param in _collect_flat_params(parser, exclude, ".", lookup):
         val, include = _serialise_value(param)
         if not include:
             continue
@@ -580,7 +854,7 @@ def _to_yaml_scalar(val) -> str:
     return s
 
 
-def _dump_yaml(parser, exclude) -> str:
+def _dump_yaml(parser, exclude, lookup: Optional[FlatLookup] = None) -> str:
     """Flat YAML dump.  Dotted keys are written as plain strings
     (``commit.message: ""``\u2014dots are not special in YAML keys).
     Variadic params are commented out.  Subcommand branches get a separator."""
@@ -589,7 +863,7 @@ def _dump_yaml(parser, exclude) -> str:
     current_branch = None
     has_body = False
 
-    for key, param in _collect_flat_params(parser, exclude, separator="."):
+    for key, param in _collect_flat_params(parser, exclude, ".", lookup):
         val, include = _serialise_value(param)
         if not include:
             continue
@@ -653,11 +927,25 @@ def scan_config_path(argv, prefix: str, key: str = "config") -> Optional[str]:
     :param argv:   Argument list (without the program name).
     :param prefix: Flag prefix — ``"--"`` for long form, ``"-"`` for short form.
     :param key:    Parameter name to scan for (default ``"config"``).
+    :return: The first path found, or ``None``.
+    """
+    paths = scan_config_paths(argv, prefix, key)
+    return paths[0] if paths else None
+
+
+def scan_config_paths(argv, prefix: str, key: str = "config",
+                      short_name: Optional[str] = None) -> List[str]:
+    """Like :func:`scan_config_path` but return every occurrence, in order.
+
+    :param short_name: Also match ``-<short_name>=path`` / ``-<short_name> path``
+                       in the same pass, so mixed spellings keep their order.
     """
-    full_key = f"{prefix}{key}"
+    flags = [f"{prefix}{key}"] + ([f"-{short_name}"] if short_name else [])
+    paths: List[str] = []
     for i, token in enumerate(argv):
-        if token.startswith(f"{full_key}="):
-            return token[len(full_key) + 1:]
-        if token == full_key and i + 1 < len(argv):
-            return argv[i + 1]
-    return None
+        for flag in flags:
+            if token.startswith(f"{flag}="):
+                paths.append(token[len(flag) + 1:])
+            elif token == flag and i + 1 < len(argv):
+                paths.append(argv[i + 1])
+    return paths
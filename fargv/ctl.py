@@ -0,0 +1,118 @@
+"""python -m fargv.ctl — talk to a running program's control socket.
+
+The program exposes its :class:`~fargv.namespace.FargvNamespace` with
+:class:`~fargv.namespace.FargvSocketBackend`; this module is the client.
+
+Usage
+-----
+::
+
+    python -m fargv.ctl <socket> list
+    python -m fargv.ctl <socket> get <name>
+    python -m fargv.ctl <socket> set <name>=<value> [<name>=<value> ...]
+    python -m fargv.ctl <socket> watch
+
+Values given to ``set`` are sent as strings and converted by the running
+program's parameter types, exactly as if they had been typed on its command
+line.  Several ``name=value`` pairs are applied together or not at all.
+
+Examples
+--------
+::
+
+    python -m fargv.ctl /tmp/train.sock set lr=0.001
+    python -m fargv.ctl /tmp/train.sock get lr
+    python -m fargv.ctl /tmp/train.sock watch      # one JSON line per change
+"""
+import json
+import socket
+import sys
+from typing import Any, Dict, Iterator, Optional
+
+
+def _connect(path, timeout: Optional[float]) -> socket.socket:
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    conn.settimeout(timeout)
+    conn.connect(str(path))
+    return conn
+
+
+def request(path, message: Dict[str, Any], timeout: Optional[float] = 10.0) -> Dict[str, Any]:
+    """Send one request to the control socket at *path* and return the response.
+
+    :param path:    Socket path.
+    :param message: Request object, e.g. ``{"op": "get", "name": "lr"}``.
+    :param timeout: Seconds to wait for the connection and the answer.
+    :return: The decoded response object.
+    """
+    with _connect(path, timeout) as conn, conn.makefile("rb") as lines:
+        conn.sendall(json.dumps(message).encode() + b"\n")
+        return json.loads(lines.readline())
+
+
+def watch(path, timeout: Optional[float] = 10.0) -> Iterator[Dict[str, Any]]:
+    """Yield the ``{name: value}`` changes reported by the control socket at *path*.
+
+    :param timeout: Seconds to wait for the subscription to be acknowledged;
+                    events are then awaited indefinitely.
+    """
+    with _connect(path, timeout) as conn, conn.makefile("rb") as lines:
+        conn.sendall(b'{"op": "watch"}\n')
+        ack = json.loads(lines.readline())
+        if not ack.get("ok"):
+            raise RuntimeError(ack.get("error", "watch refused"))
+        conn.settimeout(None)
+        for line in lines:
+            yield json.loads(line)["changes"]
+
+
+def _usage() -> None:
+    print(__doc__)
+    sys.exit(0)
+
+
+def main(argv=None) -> int:
+    """Entry point for ``python -m fargv.ctl``."""
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if len(argv) < 2 or argv[0].startswith("-"):
+        _usage()
+    path, op, args = argv[0], argv[1], argv[2:]
+
+    if op == "list":
+        message = {"op": "list"}
+    elif op == "get" and len(args) == 1:
+        message = {"op": "get", "name": args[0]}
+    elif op == "set" and args and all("=" in a for a in args):
+        message = {"op": "set", "values": dict(a.split("=", 1) for a in args)}
+    elif op == "watch":
+        try:
+            for changes in watch(path):
+                print(json.dumps(changes, default=str), flush=True)
+        except KeyboardInterrupt:
+            pass
+        except OSError as exc:
+            sys.stderr.write(f"fargv.ctl: {path}: {exc}\n")
+            return 1
+        return 0
+    else:
+        sys.stderr.write(f"fargv.ctl: bad command {' '.join([op] + args)!r} (see --help)\n")
+        return 2
+
+    try:
+        response = request(path, message)
+    except OSError as exc:
+        sys.stderr.write(f"fargv.ctl: {path}: {exc}\n")
+        return 1
+    if not response.get("ok"):
+        sys.stderr.write(f"fargv.ctl: {response.get('error')}\n")
+        return 1
+    if op == "get":
+        print(response["value"])
+    else:
+        for name, value in response["values"].items():
+            print(f"{name}={value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,261 @@
+"""Canonical encoding and hashing of resolved parameter values.
+
+:func:`canonical_bytes` maps a value to bytes that depend only on what the
+value means, not on how it was produced, so that equal configurations hash
+equally across runs, machines and Python versions:
+
+================================  ==============================================
+value                             encoding
+================================  ==============================================
+``None`` / ``True`` / ``False``   ``N`` / ``T`` / ``F``
+``int``                           ``i<decimal>;``
+``float``                         ``f<float.hex()>;`` — exact, no repr rounding
+``str``, :class:`pathlib.Path`    ``s<len>:<utf-8>`` — a path encodes as its string
+``bytes``, ``memoryview``         ``b<len>:<bytes>``
+mapped file input                 ``m<path>i<st_dev>;i<st_ino>;`` — not its bytes
+``list``, ``tuple``               ``l<count>:`` followed by the items
+``dict``                          ``d<count>:`` then key/value pairs sorted by encoded key
+``set``, ``frozenset``            ``e<count>:`` then the items, sorted by encoding
+open file                         its ``name``, encoded as a path
+variadic source                   its tokens, encoded as a list
+================================  ==============================================
+
+With ``paths="content"`` a path (or an open file's name) that is a regular
+file additionally encodes the SHA-256 of its content, as ``p<path><digest>``,
+so editing an input file changes the digest.  The same holds for the list
+file behind an ``@path`` token of a variadic source, encoded as ``@`` and
+the path.  A mapped file input (the whole-file ``memoryview`` of a
+:class:`~fargv.parameters.FargvBinaryInput` with ``mmap=True``) is
+identified by its path, device and inode, never by its mapped bytes; with
+``paths="content"`` it encodes as ``m`` and the path plus content digest.
+
+File content digests are memoised on ``(path, mtime, size)`` for the
+:data:`CONTENT_CACHE_SIZE` most recently hashed files.
+
+:func:`digest`, :func:`key_digest` and :func:`update` stream the encoding
+into the hash, so a large buffer (an mmap'd ``memoryview``) is hashed in
+1 MiB chunks without being copied.
+
+:func:`result_digest` fingerprints a whole parse result.  Each parameter
+gets a 32-byte *key digest*, ``SHA-256(canonical(name) + canonical(value))``,
+and the result digest is the SHA-256 of ``r<count>:`` followed by the key
+digests in name order.  Combining per-key digests lets a
+:class:`~fargv.namespace.FargvNamespace` re-hash only the parameters that
+changed since its last call.  Parameters marked ``filter_out`` (``help``,
+``bash_autocomplete``, ``user_interface``) never take part.
+"""
+import dataclasses
+import hashlib
+import io
+import math
+import os
+import threading
+import types
+from collections import OrderedDict
+from pathlib import PurePath
+from typing import Any, Dict, Literal, Mapping, Union
+
+from .parameters.collection import VariadicSource
+from .parameters.stream import mapped_file
+
+PathMode = Literal["path", "content"]
+
+_CHUNK = 1 << 20
+
+CONTENT_CACHE_SIZE = 1024
+"""Number of file content digests kept by the LRU memo of :func:`_file_digest`."""
+
+_content_cache: "OrderedDict[Any, bytes]" = OrderedDict()
+_content_lock = threading.Lock()
+
+
+def _str(text: str) -> bytes:
+    data = text.encode("utf-8", "surrogatepass")
+    return b"s%d:" % len(data) + data
+
+
+def _file_digest(path: str) -> bytes:
+    """SHA-256 of the file at *path*, memoised on (path, mtime, size)."""
+    st = os.stat(path)
+    key = (os.path.realpath(path), st.st_mtime_ns, st.st_size)
+    with _content_lock:
+        cached = _content_cache.get(key)
+        if cached is not None:
+            _content_cache.move_to_end(key)
+            return cached
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(_CHUNK), b""):
+            h.update(block)
+    with _content_lock:
+        _content_cache[key] = h.digest()
+        while len(_content_cache) > CONTENT_CACHE_SIZE:
+            _content_cache.popitem(last=False)
+    return h.digest()
+
+
+class _HashSink:
+    """Stands in for the output ``bytearray`` of :func:`_encode`, feeding a hash instead."""
+
+    __slots__ = ("hash",)
+
+    def __init__(self, h: Any) -> None:
+        self.hash = h
+
+    def __iadd__(self, data) -> "_HashSink":
+        self.hash.update(data)
+        return self
+
+
+def _path(text: str, paths: PathMode) -> bytes:
+    if paths == "content" and os.path.isfile(text):
+        return b"p" + _str(text) + _file_digest(text)
+    return _str(text)
+
+
+def canonical_bytes(value: Any, paths: PathMode = "path") -> bytes:
+    """Return the canonical encoding of *value* (see the module docstring).
+
+    :param value: A resolved parameter value or a container of them.
+    :param paths: ``"path"`` encodes paths by name; ``"content"`` adds the
+                  content hash of existing regular files.
+    :raises TypeError: For values with no canonical form.
+    """
+    out = bytearray()
+    _encode(value, paths, out)
+    return bytes(out)
+
+
+def update(h: Any, value: Any, paths: PathMode = "path") -> None:
+    """Feed the canonical encoding of *value* into the hash object *h*.
+
+    Equivalent to ``h.update(canonical_bytes(value, paths))`` without
+    building the encoding in memory.
+    """
+    _encode(value, paths, _HashSink(h))
+
+
+def _encode(value: Any, paths: PathMode, out: Union[bytearray, _HashSink]) -> None:
+    if value is None:
+        out += b"N"
+    elif value is True:
+        out += b"T"
+    elif value is False:
+        out += b"F"
+    elif isinstance(value, int):
+        out += b"i%d;" % value
+    elif isinstance(value, float):
+        text = value.hex() if math.isfinite(value) else repr(value)
+        out += b"f" + text.encode() + b";"
+    elif isinstance(value, str):
+        out += _str(value)
+    elif isinstance(value, PurePath):
+        out += _path(str(value), paths)
+    elif isinstance(value, memoryview) and mapped_file(value) is not None:
+        name, dev, ino = mapped_file(value)
+        if paths == "content":
+            out += b"m" + _path(name, paths)
+        else:
+            out += b"m" + _str(name) + b"i%d;i%d;" % (dev, ino)
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        data = memoryview(value)
+        data = data.cast("B") if data.c_contiguous else memoryview(data.tobytes())
+        out += b"b%d:" % data.nbytes
+        for start in range(0, data.nbytes, _CHUNK):
+            out += data[start:start + _CHUNK]
+    elif isinstance(value, (list, tuple)):
+        out += b"l%d:" % len(value)
+        for item in value:
+            _encode(item, paths, out)
+    elif isinstance(value, dict):
+        keyed = [(canonical_bytes(k, paths), v) for k, v in value.items()]
+        out += b"d%d:" % len(keyed)
+        if len({key for key, _ in keyed}) == len(keyed):   # values need not be encoded to sort
+            for key, item in sorted(keyed, key=lambda pair: pair[0]):
+                out += key
+                _encode(item, paths, out)
+        else:   # keys that encode alike (``"a"`` and ``Path("a")``) are ordered by value
+            for key, item in sorted((key, canonical_bytes(v, paths)) for key, v in keyed):
+                out += key + item
+    elif isinstance(value, (set, frozenset)):
+        items = sorted(canonical_bytes(item, paths) for item in value)
+        out += b"e%d:" % len(items) + b"".join(items)
+    elif isinstance(value, io.IOBase) and isinstance(getattr(value, "name", None), str):
+        out += _path(value.name, paths)
+    elif isinstance(value, VariadicSource):
+        out += b"l%d:" % len(value.tokens)
+        for token in value.tokens:
+            if paths == "content" and isinstance(token, str) and token.startswith("@") and len(token) > 1:
+                out += b"@" + _path(token[1:], paths)
+            else:
+                _encode(token, paths, out)
+    else:
+        raise TypeError(f"no canonical encoding for {type(value).__name__} value {value!r}")
+
+
+def digest(value: Any, paths: PathMode = "path") -> str:
+    """Return the hex SHA-256 of :func:`canonical_bytes` of *value*."""
+    h = hashlib.sha256()
+    update(h, value, paths)
+    return h.hexdigest()
+
+
+_FROZEN = (type(None), bool, int, float, str, bytes, PurePath)
+
+
+def is_frozen(value: Any) -> bool:
+    """``True`` when *value* cannot change in place, so its digest can be reused."""
+    if isinstance(value, (tuple, frozenset)):
+        return all(map(is_frozen, value))
+    return isinstance(value, _FROZEN)
+
+
+def key_digest(name: str, value: Any, paths: PathMode = "path") -> bytes:
+    """Return the 32-byte digest of one ``name = value`` entry."""
+    h = hashlib.sha256(canonical_bytes(name))
+    update(h, value, paths)
+    return h.digest()
+
+
+def combine_digests(key_digests: Mapping[str, bytes]) -> str:
+    """Combine ``{name: key_digest}`` into the hex result digest."""
+    h = hashlib.sha256(b"r%d:" % len(key_digests))
+    for name in sorted(key_digests):
+        h.update(key_digests[name])
+    return h.hexdigest()
+
+
+def result_digest(result: Any, paths: PathMode = "path") -> str:
+    """Return the stable fingerprint of a parse result (see the module docstring).
+
+    :param result: What :func:`fargv.parse` returned — a dict,
+                   ``SimpleNamespace``, namedtuple, dataclass instance or
+                   :class:`~fargv.namespace.FargvNamespace` — or an
+                   :class:`~fargv.parser.ArgumentParser` after parsing.
+    :param paths:  ``"path"`` or ``"content"``, as for :func:`canonical_bytes`.
+    :raises TypeError: For an unsupported *result* or an unencodable value.
+    """
+    method = getattr(result, "result_digest", None)
+    if callable(method):
+        return method(paths)
+    return combine_digests({name: key_digest(name, value, paths)
+                            for name, value in result_values(result).items()})
+
+
+def result_values(result: Any) -> Dict[str, Any]:
+    """Return the ``{name: value}`` dict of a parse result of any return type.
+
+    :raises TypeError: When *result* is not a parse result.
+    """
+    if isinstance(result, Mapping):
+        return dict(result)
+    if dataclasses.is_dataclass(result) and not isinstance(result, type):
+        return {f.name: getattr(result, f.name) for f in dataclasses.fields(result)}
+    if isinstance(result, types.SimpleNamespace):
+        return dict(vars(result))
+    if isinstance(result, tuple) and hasattr(result, "_asdict"):
+        return dict(result._asdict())
+    as_dict = getattr(result, "as_dict", None)
+    if callable(as_dict):
+        return as_dict()
+    raise TypeError(f"expected a parse result, got a {type(result).__name__}")
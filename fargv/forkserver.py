@@ -0,0 +1,296 @@
+"""Fork server for ``python -m fargv``: pay the import cost once.
+
+``python -m fargv --serve pkg.module`` imports ``pkg.module`` (and with it
+numpy, torch, ...) once and listens on a Unix socket.  From then on a plain
+``python -m fargv pkg.module.fn --x=1`` finds the socket and, instead of
+importing the target itself, forwards the call:
+
+1. the client sends its argv, environment, working directory and umask, and
+   passes its stdin, stdout and stderr descriptors over the socket
+   (``SCM_RIGHTS``);
+2. the server forks; the child installs those descriptors as 0, 1 and 2,
+   adopts the environment, directory and umask, drops the server's
+   :mod:`atexit` handlers, and runs the call as ``python -m fargv`` would,
+   in the already warm interpreter, including the ``atexit`` handlers the
+   call registers;
+3. the child reports its pid (so Ctrl-C in the client interrupts it) and,
+   when done, its exit status, which the client exits with.  Each report is
+   a tagged message (``P`` or ``S`` and a 32-bit integer).
+
+Pipelines and redirections work unchanged, because the child writes straight
+to the client's descriptors.  When no server is listening the client runs
+the call itself.  ``FARGV_SERVER=off`` disables forwarding; ``FARGV_SERVER``
+set to a socket path forces that server.
+
+The socket is created with mode ``0600`` in ``$XDG_RUNTIME_DIR/fargv`` (or
+``/tmp/fargv-<uid>``).  That directory must belong to the current user and
+have mode ``0700``, and a socket must belong to the current user; otherwise
+the server refuses to start and clients refuse to connect.  Children are forked from the state the server was
+in after importing: module-level caches are shared, and the ``random`` and
+``numpy.random`` global generators are reseeded in each child so calls do
+not repeat each other's random streams.  Resource limits (``ulimit``) and
+the controlling terminal are the server's, not the client's.  Linux and
+macOS only.
+"""
+import atexit
+import json
+import os
+import signal
+import socket
+import stat
+import struct
+import sys
+import tempfile
+import traceback
+from pathlib import Path
+from typing import Callable, List, Optional
+
+SERVER_ENV = "FARGV_SERVER"
+"""``off`` disables forwarding; a socket path selects a specific server."""
+
+_HEADER  = struct.Struct("!I")
+_MESSAGE = struct.Struct("!ci")   # tag, number
+_PID     = b"P"
+_STATUS  = b"S"
+
+
+def available() -> bool:
+    """``True`` where the fork server can run (Unix sockets, ``fork``, fd passing)."""
+    return hasattr(socket, "AF_UNIX") and hasattr(os, "fork") and hasattr(socket, "send_fds")
+
+
+def default_socket_path(spec: str) -> Path:
+    """Return the socket path a server for module *spec* listens on by default."""
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    base = Path(runtime) / "fargv" if runtime else Path(tempfile.gettempdir()) / f"fargv-{os.getuid()}"
+    return base / f"{spec}.sock"
+
+
+def _owned(path: Path, private_dir: bool = False) -> bool:
+    """``True`` when *path* (not following symlinks) belongs to the current user
+    and, with *private_dir*, is a directory of mode ``0700``."""
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    if st.st_uid != os.getuid():
+        return False
+    return not private_dir or (stat.S_ISDIR(st.st_mode) and stat.S_IMODE(st.st_mode) == 0o700)
+
+
+def find_server(target_spec: str) -> Optional[Path]:
+    """Return the socket of a server covering *target_spec*, or ``None``.
+
+    The longest dotted prefix of *target_spec* with a socket file wins.
+    Sockets not owned by the current user, or in a default directory that is
+    not private to it, are ignored with a note on stderr.
+    """
+    setting = os.environ.get(SERVER_ENV, "")
+    if setting.lower() in ("off", "0", "no", "false") or not available():
+        return None
+    if setting:
+        candidates = [Path(setting)]
+    else:
+        parts = target_spec.split(".")
+        candidates = [default_socket_path(".".join(parts[:split]))
+                      for split in range(len(parts), 0, -1)]
+    for path in candidates:
+        if not os.path.lexists(path):
+            continue
+        if _owned(path) and (setting or _owned(path.parent, private_dir=True)):
+            return path
+        sys.stderr.write(f"fargv: ignoring fork server socket {path}: not private to this user\n")
+        return None
+    return None
+
+
+def _recv_exact(conn: socket.socket, size: int) -> bytes:
+    data = bytearray()
+    while len(data) < size:
+        chunk = conn.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("connection closed")
+        data += chunk
+    return bytes(data)
+
+
+# ── client ──────────────────────────────────────────────────────────────────
+
+def run_remote(path, target_spec: str, argv: List[str]) -> Optional[int]:
+    """Run ``python -m fargv <target_spec> <argv...>`` on the server at *path*.
+
+    :return: The call's exit status, or ``None`` when no server answered
+             (the caller should then run the call itself).
+    """
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.connect(str(path))
+    except OSError:
+        conn.close()
+        return None
+    with conn:
+        from .parameters.stream import _read_umask
+        payload = json.dumps({"target": target_spec, "argv": argv, "env": dict(os.environ),
+                              "cwd": os.getcwd(), "umask": _read_umask()}).encode("utf-8")
+        sys.stdout.flush()
+        sys.stderr.flush()
+        try:
+            socket.send_fds(conn, [_HEADER.pack(len(payload))], [0, 1, 2])
+            conn.sendall(payload)
+        except OSError:
+            return None     # server went away before the child started
+        pid: Optional[int] = None
+        interrupted = False
+        while True:
+            try:
+                tag, number = _MESSAGE.unpack(_recv_exact(conn, _MESSAGE.size))
+            except KeyboardInterrupt:
+                interrupted = True
+            except OSError:
+                if pid is None:
+                    return None     # server went away before the child started
+                sys.stderr.write("fargv: the fork server's child died without reporting a status\n")
+                return 1
+            else:
+                if tag == _STATUS:
+                    return number
+                if tag != _PID:
+                    sys.stderr.write(f"fargv: unexpected message {tag!r} from the fork server\n")
+                    return 1
+                pid = number
+            if interrupted and pid is not None:
+                interrupted = False
+                try:
+                    os.kill(pid, signal.SIGINT)
+                except OSError:     # already gone, or no longer ours
+                    pass
+
+
+# ── server ──────────────────────────────────────────────────────────────────
+
+def serve(spec: str, handler: Callable[[str, List[str]], None], path=None) -> None:
+    """Import module *spec*, then serve calls on *path* until interrupted.
+
+    :param spec:    Dotted module (or package) to pre-import.
+    :param handler: ``handler(target_spec, argv)`` runs one call in the child;
+                    ``python -m fargv`` passes its own dispatcher.
+    :param path:    Socket path; defaults to :func:`default_socket_path`.
+    :raises FargvError: When the default socket directory is not private to
+                        the current user, or *path* belongs to someone else.
+    """
+    from .parameters.base import FargvError
+    if not available():
+        raise FargvError("the fork server needs Unix sockets and fork()")
+    import importlib
+    importlib.import_module(spec)
+    default = path is None
+    path = default_socket_path(spec) if default else Path(path)
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if default and not _owned(path.parent, private_dir=True):
+        raise FargvError(f"{path.parent} must belong to you and have mode 0700")
+    if os.path.lexists(path) and not _owned(path):
+        raise FargvError(f"{path} exists and does not belong to you")
+    if path.exists():
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(path))
+        except OSError:
+            path.unlink()              # stale socket left by a dead server
+        else:
+            probe.close()
+            raise FargvError(f"a fork server is already listening on {path}")
+        finally:
+            probe.close()
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)
+    try:
+        server.bind(str(path))
+    finally:
+        os.umask(old_umask)
+    server.listen(64)
+    previous = signal.signal(signal.SIGCHLD, signal.SIG_IGN)   # children reap themselves
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    sys.stderr.write(f"fargv: serving {spec} on {path}\n")
+    sys.stderr.flush()
+    try:
+        while True:
+            conn, _ = server.accept()
+            sys.stdout.flush()
+            sys.stderr.flush()
+            if os.fork() == 0:
+                server.close()
+                _child(conn, handler)   # never returns
+            conn.close()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        signal.signal(signal.SIGCHLD, previous)
+        server.close()
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+def _child(conn: socket.socket, handler: Callable[[str, List[str]], None]) -> None:
+    """Body of a forked child: adopt the client's stdio and context, run, report."""
+    status = 1
+    atexit._clear()   # the server's handlers are not this call's
+    try:
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        header, fds, _, _ = socket.recv_fds(conn, _HEADER.size, 3)
+        if len(header) != _HEADER.size or len(fds) != 3:
+            raise ConnectionError("malformed request")
+        request = json.loads(_recv_exact(conn, _HEADER.unpack(header)[0]))
+        for target_fd, fd in enumerate(fds):
+            os.dup2(fd, target_fd)
+            os.close(fd)
+        os.environ.clear()
+        os.environ.update(request["env"])
+        os.chdir(request["cwd"])
+        if "umask" in request:
+            os.umask(request["umask"])
+        _reseed()
+        conn.sendall(_MESSAGE.pack(_PID, os.getpid()))
+        sys.argv = ["fargv", request["target"]] + request["argv"]
+        try:
+            handler(request["target"], request["argv"])
+            status = 0
+        except SystemExit as exc:
+            if exc.code is None or isinstance(exc.code, int):
+                status = exc.code or 0
+            else:
+                sys.stderr.write(f"{exc.code}\n")
+        except KeyboardInterrupt:
+            status = 130
+        except BaseException:
+            traceback.print_exc()
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        try:
+            atexit._run_exitfuncs()
+        except BaseException:
+            traceback.print_exc()
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        except Exception:
+            pass
+        try:
+            conn.sendall(_MESSAGE.pack(_STATUS, status))
+        except OSError:
+            pass
+        os._exit(status)
+
+
+def _reseed() -> None:
+    import random
+    random.seed()
+    np = sys.modules.get("numpy")
+    if np is not None:
+        try:
+            np.random.seed()
+        except Exception:
+            pass
@@ -0,0 +1,160 @@
+"""Hand a resolved parse result to child processes.
+
+A parent that has already resolved its parameters (defaults, config files,
+environment, command line) can pass the values to fargv-based children so
+that they skip re-reading config files and re-scanning the environment::
+
+    p, _ = fargv.parse(train)
+    env = fargv.handoff.child_env(train, p)
+    subprocess.run([sys.executable, "train.py", "--epochs=1"], env=env)
+
+The child's :func:`fargv.parse` finds :data:`RESOLVED_ENV` and applies the
+values in place of its config and env-var layers, in one step; its own
+command line still overrides them, and a ``--config`` given explicitly on
+that command line is still loaded.
+
+The blob is compact JSON carrying a *definition hash*, the SHA-256 of every
+parameter's dotted name and class.  A child whose definition hashes
+differently ignores the blob, with a note on stderr, and resolves as usual.
+Stream, subcommand and auto parameters are not handed off.
+
+Blobs too large for the environment (Linux caps one variable at 128 KiB)
+travel through an inherited file descriptor instead::
+
+    fd = fargv.handoff.write_fd(train, p)
+    subprocess.run(cmd, env={**os.environ, RESOLVED_ENV: f"fd:{fd}"}, pass_fds=[fd])
+
+A child that reads the descriptor replaces the ``fd:<n>`` spec in its own
+environment with the blob itself, or removes it when the blob is too large,
+so its children never look for a descriptor they did not inherit.
+"""
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from pathlib import PurePath
+from typing import Any, Dict, Mapping, Optional
+
+from .config import FlatLookup
+
+RESOLVED_ENV = "FARGV_RESOLVED"
+"""Environment variable holding a resolved blob, or ``fd:<n>`` naming a descriptor."""
+
+_VERSION = 1
+
+_ENV_MAX = 120 * 1024
+"""Largest blob, in bytes, kept inline in the environment (Linux allows 128 KiB)."""
+
+
+class _Unsupported(Exception):
+    pass
+
+
+def definition_hash(name2parameters: Mapping[str, Any]) -> str:
+    """Return the hex SHA-256 of the dotted names and classes of *name2parameters*.
+
+    Auto parameters (``help``, ``config``, ...) are ignored, so a parser hashes
+    the same before and after :func:`fargv.parse` adds them.
+    """
+    from .parse import _AUTO_PARAMS
+    lookup = FlatLookup({k: p for k, p in name2parameters.items() if k not in _AUTO_PARAMS})
+    h = hashlib.sha256()
+    for key in sorted(lookup.dotted):
+        param = lookup.dotted[key]
+        h.update(f"{key}\0{type(param).__module__}.{type(param).__qualname__}\n".encode())
+    return h.hexdigest()
+
+
+def _jsonable(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, PurePath):
+        return str(value)
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    raise _Unsupported
+
+
+def encode(definition: Any, result: Any) -> str:
+    """Return the handoff blob for *result*, parsed from *definition*.
+
+    :param definition: The definition *result* came from (dict, callable,
+                       dataclass or :class:`~fargv.parser.ArgumentParser`).
+    :param result:     The parse result, of any return type.
+    """
+    from .digest import result_values
+    from .parse import _AUTO_PARAMS
+    from .type_detection import definition_to_parser
+    params = definition_to_parser(definition)._name2parameters
+    values = {}
+    for name, value in result_values(result).items():
+        param = params.get(name)
+        if param is None or name in _AUTO_PARAMS or getattr(param, "is_subcommand", False):
+            continue
+        try:
+            values[name] = _jsonable(value)
+        except _Unsupported:   # open streams, mapped buffers, lazy sources
+            continue
+    blob = {"v": _VERSION, "def": definition_hash(params), "values": values}
+    return json.dumps(blob, separators=(",", ":"), ensure_ascii=False)
+
+
+def child_env(definition: Any, result: Any, env: Optional[Mapping[str, str]] = None) -> Dict[str, str]:
+    """Return a copy of *env* (default :data:`os.environ`) carrying *result*
+    in :data:`RESOLVED_ENV`."""
+    out = dict(os.environ if env is None else env)
+    out[RESOLVED_ENV] = encode(definition, result)
+    return out
+
+
+def write_fd(definition: Any, result: Any) -> int:
+    """Write the blob for *result* to an unlinked temporary file and return
+    its inheritable descriptor.
+
+    Children read it without moving the shared offset, so one descriptor
+    serves any number of them; close it when they have started.
+    """
+    fd, path = tempfile.mkstemp(prefix="fargv-resolved-")
+    os.unlink(path)
+    os.write(fd, encode(definition, result).encode("utf-8"))
+    os.set_inheritable(fd, True)
+    return fd
+
+
+def _read(spec: str) -> str:
+    if not spec.startswith("fd:"):
+        return spec
+    fd = int(spec[3:])
+    return os.pread(fd, os.fstat(fd).st_size, 0).decode("utf-8")
+
+
+def accept(name2parameters: Mapping[str, Any]) -> Optional[Dict[str, Any]]:
+    """Return the values handed down in :data:`RESOLVED_ENV` for this
+    definition, or ``None`` when there are none or they do not fit.
+
+    :param name2parameters: The child's parameters.
+    """
+    spec = os.environ.get(RESOLVED_ENV)
+    if not spec:
+        return None
+    try:
+        text = _read(spec)
+        if spec.startswith("fd:"):
+            # Our own children do not inherit the descriptor: hand them the
+            # blob inline when it fits, and nothing otherwise.
+            if len(text.encode("utf-8")) <= _ENV_MAX:
+                os.environ[RESOLVED_ENV] = text
+            else:
+                del os.environ[RESOLVED_ENV]
+        blob = json.loads(text)
+        if not isinstance(blob, dict) or blob.get("v") != _VERSION:
+            raise ValueError("unknown format")
+    except (OSError, ValueError) as exc:
+        print(f"fargv: ignoring {RESOLVED_ENV}: {exc}", file=sys.stderr)
+        return None
+    if blob.get("def") != definition_hash(name2parameters):
+        print(f"fargv: ignoring {RESOLVED_ENV}: it was resolved for a different definition",
+              file=sys.stderr)
+        return None
+    return blob["values"]
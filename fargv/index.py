@@ -0,0 +1,585 @@
+"""python -m fargv.index — query a directory tree of saved parameter dumps.
+
+Each run of a program stores its resolved parameters with
+``dump_config(parser, fmt="json")`` (or ``--config=//json > run/params.json``).
+:class:`RunIndex` scans a tree of such files once and keeps their values in a
+compact columnar store next to them (``<root>/.fargv_index``), so a question
+like "which runs used ``lr<1e-3`` with ``mode=eval``" reads one file instead
+of every dump.  The store is plain JSON with the arrays base64-encoded, so
+opening an index found in a shared directory never executes code; a file
+that does not validate is ignored and the index rebuilt.
+
+* Updating is incremental: a file whose mtime and size are unchanged is not
+  re-read, new files are appended and vanished files dropped.
+* Every key is one column backed by an :class:`array.array` — ``bool``,
+  ``int`` (int64), ``float`` (double), or dictionary-encoded ``str`` / ``json``
+  (codes into a table of distinct values).  Column types come from the
+  parameter classes: from a *definition* when one is given, otherwise from the
+  ``<type>`` hint in each dump's ``fargv_comment_*`` help line, and only then
+  from the JSON values.  A column that meets a value it cannot hold is
+  widened (``int`` → ``float`` → ``json``).
+* Nested config sections are flattened to dotted keys (``train.lr``).
+
+Usage
+-----
+::
+
+    python -m fargv.index <root> update
+    python -m fargv.index <root> select <cond> [<cond> ...]
+    python -m fargv.index <root> show <run>
+    python -m fargv.index <root> diff <run> <run>
+    python -m fargv.index <root> columns
+
+A condition is ``<key><op><value>`` with ``op`` one of ``= == != < <= > >=``;
+the value is converted to the column's type.  A run without the key never
+matches.  Commands other than ``update`` build the index on first use.
+
+Examples
+--------
+::
+
+    python -m fargv.index runs/ update
+    python -m fargv.index runs/ select 'lr<1e-3' mode=eval
+    python -m fargv.index runs/ diff 0412/params.json 0413/params.json
+"""
+import base64
+import fnmatch
+import json
+import operator
+import os
+import re
+import sys
+import tempfile
+from array import array
+from pathlib import Path, PurePath
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .parameters.base import FargvError
+
+INDEX_NAME = ".fargv_index"
+"""File name of the stored index, inside the indexed root."""
+
+_VERSION = 2
+_ARRAY_CODES = {"bool": "b", "int": "q", "float": "d", "str": "i", "json": "i"}
+_HINT_KINDS = {"bool": "bool", "int": "int", "float": "float", "str": "str", "Path": "str"}
+_HINT_RE = re.compile(r"<(\w+)>")
+_COND_RE = re.compile(r"^\s*([^\s<>=!]+)\s*(<=|>=|==|!=|=|<|>)\s*(.*?)\s*$")
+_OPS: Dict[str, Callable[[Any, Any], bool]] = {
+    "=": operator.eq, "==": operator.eq, "!=": operator.ne,
+    "<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge,
+}
+
+
+def _kind_of_class(cls: type) -> str:
+    """Column kind for a parameter's ``_get_class_type()``."""
+    if issubclass(cls, bool):
+        return "bool"
+    if issubclass(cls, int):
+        return "int"
+    if issubclass(cls, float):
+        return "float"
+    if issubclass(cls, (str, PurePath)):
+        return "str"
+    return "json"
+
+
+def _kind_of_value(value: Any) -> str:
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int"
+    if isinstance(value, float):
+        return "float"
+    if isinstance(value, str):
+        return "str"
+    return "json"
+
+
+def _widen(kind: str, value: Any) -> str:
+    """Smallest kind holding both *kind*'s values and *value*."""
+    if kind == "int" and _kind_of_value(value) == "float":
+        return "float"
+    return "json"
+
+
+class _Column:
+    """One key's values: a typed array, a presence mask and, for
+    ``str``/``json``, the table of distinct values the codes point into."""
+    __slots__ = ("kind", "data", "mask", "levels", "codes")
+
+    def __init__(self, kind: str, rows: int = 0) -> None:
+        self.kind   = kind
+        self.data   = array(_ARRAY_CODES[kind], bytes(array(_ARRAY_CODES[kind]).itemsize * rows))
+        self.mask   = bytearray(rows)
+        self.levels: List[str] = []
+        self.codes:  Dict[str, int] = {}
+
+    def to_json(self) -> Dict[str, Any]:
+        return {"kind": self.kind, "data": _b64(self.data), "mask": _b64(self.mask),
+                "levels": self.levels}
+
+    @classmethod
+    def from_json(cls, state: Any, rows: int, swap: bool) -> "_Column":
+        """Rebuild a column saved by :meth:`to_json`; raise ``ValueError`` when invalid."""
+        kind, levels = state["kind"], state["levels"]
+        if kind not in _ARRAY_CODES or not isinstance(levels, list) \
+                or not all(isinstance(level, str) for level in levels):
+            raise ValueError("malformed column")
+        column = cls(kind)
+        column.data = _unb64_array(_ARRAY_CODES[kind], state["data"], rows, swap)
+        column.mask = bytearray(base64.b64decode(state["mask"], validate=True))
+        if len(column.mask) != rows:
+            raise ValueError("malformed column")
+        if kind in ("str", "json") and any(m and not 0 <= c < len(levels)
+                                           for c, m in zip(column.data, column.mask)):
+            raise ValueError("malformed column")
+        column.levels = levels
+        column.codes = {text: code for code, text in enumerate(levels)}
+        return column
+
+    def _code(self, text: str) -> int:
+        code = self.codes.get(text)
+        if code is None:
+            code = self.codes[text] = len(self.levels)
+            self.levels.append(text)
+        return code
+
+    def _store(self, value: Any):
+        """Return the array item for *value*, or raise ``TypeError``/``OverflowError``."""
+        kind = self.kind
+        if kind == "bool":
+            if not isinstance(value, bool):
+                raise TypeError
+            return int(value)
+        if kind == "int":
+            if isinstance(value, bool) or not isinstance(value, int) or not -(1 << 63) <= value < (1 << 63):
+                raise TypeError
+            return value
+        if kind == "float":
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise TypeError
+            return float(value)
+        if kind == "str":
+            if not isinstance(value, str):
+                raise TypeError
+            return self._code(value)
+        return self._code(json.dumps(value, sort_keys=True, default=str))
+
+    def set(self, row: int, value: Any) -> None:
+        """Set *row* to *value* (``None`` marks it missing), appending when ``row == len``."""
+        if value is None:
+            item, present = 0, 0
+        else:
+            try:
+                item, present = self._store(value), 1
+            except (TypeError, OverflowError):
+                self._retype(_widen(self.kind, value))
+                return self.set(row, value)
+        if row == len(self.mask):
+            self.data.append(item)
+            self.mask.append(present)
+        else:
+            self.data[row] = item
+            self.mask[row] = present
+
+    def get(self, row: int) -> Any:
+        if not self.mask[row]:
+            return None
+        item = self.data[row]
+        if self.kind == "bool":
+            return bool(item)
+        if self.kind == "str":
+            return self.levels[item]
+        if self.kind == "json":
+            return json.loads(self.levels[item])
+        return item
+
+    def _retype(self, kind: str) -> None:
+        values = [self.get(row) for row in range(len(self.mask))]
+        self.__init__(kind)
+        for row, value in enumerate(values):
+            self.set(row, value)
+
+    def take(self, rows: Sequence[int]) -> None:
+        """Keep only *rows*, in that order."""
+        self.data = array(self.data.typecode, (self.data[r] for r in rows))
+        self.mask = bytearray(self.mask[r] for r in rows)
+
+    def convert(self, text: str) -> Any:
+        """Convert a condition's value string to this column's type."""
+        if self.kind == "bool":
+            lowered = text.lower()
+            if lowered not in ("true", "false", "1", "0", "yes", "no"):
+                raise FargvError(f"expected a boolean, got {text!r}")
+            return lowered in ("true", "1", "yes")
+        if self.kind in ("int", "float"):
+            try:
+                number = float(text)
+            except ValueError:
+                raise FargvError(f"expected a number, got {text!r}") from None
+            return int(number) if self.kind == "int" and number.is_integer() else number
+        if self.kind == "json":
+            try:
+                return json.loads(text)
+            except ValueError:
+                return text
+        return text
+
+    def matching(self, op: str, value: Any, rows: Iterable[int]) -> List[int]:
+        """Return the *rows* whose value satisfies ``value_at_row <op> value``."""
+        data, mask = self.data, self.mask
+        if self.kind in ("str", "json") and op in ("=", "==", "!="):
+            text = value if self.kind == "str" else json.dumps(value, sort_keys=True, default=str)
+            code = self.codes.get(text, -1)
+            if op == "!=":
+                return [r for r in rows if mask[r] and data[r] != code]
+            return [r for r in rows if mask[r] and data[r] == code]
+        compare = _OPS[op]
+        if self.kind in ("str", "json"):
+            decoded = [self.get(r) for r in range(len(self.levels))] if self.kind == "json" else self.levels
+            hits = set()
+            for code, level in enumerate(decoded):
+                try:
+                    if compare(level, value):
+                        hits.add(code)
+                except TypeError:
+                    pass
+            return [r for r in rows if mask[r] and data[r] in hits]
+        if self.kind == "bool":
+            value = int(value)
+        return [r for r in rows if mask[r] and compare(data[r], value)]
+
+
+def _b64(data) -> str:
+    return base64.b64encode(bytes(data)).decode("ascii")
+
+
+def _unb64_array(typecode: str, text: Any, length: int, swap: bool) -> array:
+    """Decode an :class:`array.array` of *length* items saved by :func:`_b64`."""
+    out = array(typecode)
+    out.frombytes(base64.b64decode(text, validate=True))
+    if len(out) != length:
+        raise ValueError("malformed array")
+    if swap:
+        out.byteswap()
+    return out
+
+
+def parse_condition(text: str) -> Tuple[str, str, str]:
+    """Split ``"lr<1e-3"`` into ``("lr", "<", "1e-3")``.
+
+    :raises FargvError: When *text* is not ``<key><op><value>``.
+    """
+    match = _COND_RE.match(text)
+    if match is None:
+        raise FargvError(f"bad condition {text!r}; expected <key><op><value> with op one of = != < <= > >=")
+    return match.group(1), match.group(2), match.group(3)
+
+
+def _flatten(data: Dict[str, Any], prefix: str = "") -> Iterator[Tuple[str, Any]]:
+    for key, value in data.items():
+        if key.startswith("fargv_comment_"):
+            continue
+        if isinstance(value, dict):
+            yield from _flatten(value, f"{prefix}{key}.")
+        else:
+            yield prefix + key, value
+
+
+def _hints(data: Dict[str, Any]) -> Dict[str, str]:
+    """Column kinds from the ``fargv_comment_<key>`` help lines of a JSON dump."""
+    hints = {}
+    for key, text in data.items():
+        if key.startswith("fargv_comment_") and isinstance(text, str):
+            match = _HINT_RE.search(text)
+            if match:
+                hints[key[len("fargv_comment_"):]] = _HINT_KINDS.get(match.group(1), "json")
+    return hints
+
+
+class RunIndex:
+    """Columnar index over the parameter dumps under *root*.
+
+    Opening an index loads ``<root>/.fargv_index`` when it exists;
+    :meth:`update` brings it up to date with the files on disk and saves it.
+
+    :param root:       Directory tree holding one JSON dump per run.
+    :param pattern:    ``fnmatch`` pattern selecting dump files by name.
+    :param definition: Optional parser definition (anything :func:`fargv.parse`
+                       accepts); its parameter classes type the columns.
+    :param path:       Where the index is stored; defaults to ``<root>/.fargv_index``.
+    """
+
+    def __init__(self, root: Union[str, os.PathLike], pattern: str = "*.json",
+                 definition: Any = None, path: Optional[Union[str, os.PathLike]] = None) -> None:
+        self.root    = Path(root)
+        self.pattern = pattern
+        self.path    = Path(path) if path is not None else self.root / INDEX_NAME
+        self.runs:    List[str] = []                  # row -> path relative to root
+        self.columns: Dict[str, _Column] = {}
+        self._rows:   Dict[str, int] = {}
+        self._mtime   = array("q")
+        self._size    = array("q")
+        self._bad:    Dict[str, Tuple[int, int]] = {}  # unreadable files, by stamp
+        self._kinds   = self._definition_kinds(definition) if definition is not None else {}
+        if self.path.exists():
+            self._load()
+
+    @staticmethod
+    def _definition_kinds(definition: Any) -> Dict[str, str]:
+        from .type_detection import definition_to_parser
+        from .config import FlatLookup
+        parser = definition_to_parser(definition)
+        return {key: _kind_of_class(param._get_class_type())
+                for key, param in FlatLookup(parser._name2parameters).dotted.items()}
+
+    # ── persistence ──────────────────────────────────────────────────────────
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "rb") as fh:
+                state = json.load(fh)
+            if not isinstance(state, dict) or state.get("version") != _VERSION \
+                    or state.get("pattern") != self.pattern:
+                raise ValueError("stale format or different pattern")
+            runs = state["runs"]
+            if not isinstance(runs, list) or not all(isinstance(run, str) for run in runs):
+                raise ValueError("malformed run list")
+            swap = state["byteorder"] != sys.byteorder
+            mtime = _unb64_array("q", state["mtime"], len(runs), swap)
+            size = _unb64_array("q", state["size"], len(runs), swap)
+            columns = {str(key): _Column.from_json(col, len(runs), swap)
+                       for key, col in state["columns"].items()}
+            bad = {str(run): (int(m), int(n)) for run, (m, n) in state["bad"].items()}
+        except Exception as exc:   # corrupt or foreign file: rebuild from scratch
+            print(f"fargv.index: rebuilding {self.path}: {exc}", file=sys.stderr)
+            return
+        self.runs, self.columns = runs, columns
+        self._mtime, self._size, self._bad = mtime, size, bad
+        self._rows = {run: row for row, run in enumerate(self.runs)}
+
+    def save(self) -> None:
+        """Write the index atomically to :attr:`path`."""
+        state = {"version": _VERSION, "pattern": self.pattern, "byteorder": sys.byteorder,
+                 "runs": self.runs, "mtime": _b64(self._mtime), "size": _b64(self._size),
+                 "bad": {run: list(stamp) for run, stamp in self._bad.items()},
+                 "columns": {key: col.to_json() for key, col in self.columns.items()}}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(state, fh, separators=(",", ":"))
+            os.replace(tmp, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except FileNotFoundError:
+                pass
+            raise
+
+    # ── scanning ─────────────────────────────────────────────────────────────
+
+    def _scan(self) -> Iterator[Tuple[str, int, int]]:
+        """Yield ``(relative_path, mtime_ns, size)`` for every dump under the root,
+        directory by directory in name order."""
+        stack = [(str(self.root), "")]
+        while stack:
+            directory, prefix = stack.pop()
+            try:
+                entries = sorted(os.scandir(directory), key=lambda e: e.name)
+            except OSError as exc:
+                print(f"fargv.index: cannot list {exc.filename}: {exc.strerror}", file=sys.stderr)
+                continue
+            stack.extend((e.path, prefix + e.name + os.sep)
+                         for e in reversed(entries) if e.is_dir(follow_symlinks=False))
+            for entry in entries:
+                if entry.is_file() and fnmatch.fnmatchcase(entry.name, self.pattern):
+                    st = entry.stat()
+                    yield prefix + entry.name, st.st_mtime_ns, st.st_size
+
+    def update(self, save: bool = True) -> Tuple[int, int, int]:
+        """Re-scan the root, reading only new or modified dumps.
+
+        :param save: Write the index afterwards (when anything changed).
+        :return: ``(added, changed, removed)`` run counts.
+        """
+        added = changed = 0
+        seen = set()
+        for run, mtime, size in self._scan():
+            seen.add(run)
+            row = self._rows.get(run)
+            if row is not None and self._mtime[row] == mtime and self._size[row] == size:
+                continue
+            if row is None and self._bad.get(run) == (mtime, size):
+                continue
+            try:
+                with open(self.root / run, encoding="utf-8") as fh:
+                    data = json.load(fh)
+                if not isinstance(data, dict):
+                    raise ValueError(f"top level is a {type(data).__name__}, not an object")
+            except (OSError, ValueError) as exc:
+                print(f"fargv.index: skipping {run}: {exc}", file=sys.stderr)
+                self._bad[run] = (mtime, size)
+                continue
+            self._bad.pop(run, None)
+            if row is None:
+                row = len(self.runs)
+                self.runs.append(run)
+                self._rows[run] = row
+                self._mtime.append(mtime)
+                self._size.append(size)
+                added += 1
+            else:
+                self._mtime[row], self._size[row] = mtime, size
+                changed += 1
+            self._set_row(row, data)
+        gone = [run for run in self.runs if run not in seen]
+        for run in [run for run in self._bad if run not in seen]:
+            del self._bad[run]
+        if gone:
+            self._drop(gone)
+        if save and (added or changed or gone or not self.path.exists()):
+            self.save()
+        return added, changed, len(gone)
+
+    def _set_row(self, row: int, data: Dict[str, Any]) -> None:
+        values = dict(_flatten(data))
+        hints = _hints(data)
+        for key, value in values.items():
+            column = self.columns.get(key)
+            if column is None:
+                if value is None:
+                    continue
+                kind = self._kinds.get(key) or hints.get(key) or _kind_of_value(value)
+                column = self.columns[key] = _Column(kind, len(self.runs))
+            column.set(row, value)
+        for key, column in self.columns.items():
+            if key not in values:
+                column.set(row, None)
+
+    def _drop(self, runs: Iterable[str]) -> None:
+        dropped = {self._rows[run] for run in runs}
+        keep = [row for row in range(len(self.runs)) if row not in dropped]
+        self.runs = [self.runs[row] for row in keep]
+        self._rows = {run: row for row, run in enumerate(self.runs)}
+        self._mtime = array("q", (self._mtime[row] for row in keep))
+        self._size = array("q", (self._size[row] for row in keep))
+        for column in self.columns.values():
+            column.take(keep)
+
+    # ── queries ──────────────────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return len(self.runs)
+
+    def _row(self, run: Union[str, int]) -> int:
+        if isinstance(run, int):
+            if not 0 <= run < len(self.runs):
+                raise FargvError(f"no run #{run} in the index ({len(self.runs)} runs)")
+            return run
+        for key in (os.path.normpath(run), os.path.relpath(run, self.root)):
+            if key in self._rows:
+                return self._rows[key]
+        raise FargvError(f"run {run!r} is not in the index of {self.root}")
+
+    def kinds(self) -> Dict[str, str]:
+        """Return ``{key: column_kind}`` for every indexed key."""
+        return {key: column.kind for key, column in self.columns.items()}
+
+    def record(self, run: Union[str, int]) -> Dict[str, Any]:
+        """Return the ``{key: value}`` stored for *run* (a path or a row number)."""
+        row = self._row(run)
+        return {key: column.get(row) for key, column in self.columns.items() if column.mask[row]}
+
+    def column(self, key: str) -> List[Any]:
+        """Return every run's value for *key* (``None`` where missing), in row order."""
+        column = self.columns.get(key)
+        if column is None:
+            raise FargvError(f"no column {key!r} in the index")
+        return [column.get(row) for row in range(len(self.runs))]
+
+    def select(self, *conditions: Union[str, Tuple[str, str, Any]]) -> List[str]:
+        """Return the runs satisfying every condition, in row order.
+
+        :param conditions: ``"key<op>value"`` strings (see :func:`parse_condition`)
+                           or ``(key, op, value)`` tuples with a typed value.
+        :raises FargvError: On a malformed condition, unknown key or a value
+                            that does not fit the column.
+        """
+        rows: Iterable[int] = range(len(self.runs))
+        for condition in conditions:
+            if isinstance(condition, str):
+                key, op, text = parse_condition(condition)
+                column = self.columns.get(key)
+                if column is None:
+                    raise FargvError(f"no column {key!r} in the index")
+                value = column.convert(text)
+            else:
+                key, op, value = condition
+                column = self.columns.get(key)
+                if column is None:
+                    raise FargvError(f"no column {key!r} in the index")
+                if op not in _OPS:
+                    raise FargvError(f"unknown operator {op!r}")
+            rows = column.matching(op, value, rows)
+        return [self.runs[row] for row in rows]
+
+    def diff(self, a: Union[str, int], b: Union[str, int]) -> Dict[str, Tuple[Any, Any]]:
+        """Return ``{key: (value_in_a, value_in_b)}`` for every key that differs.
+
+        A key missing from one run shows as ``None`` on that side.
+        """
+        ra, rb = self._row(a), self._row(b)
+        out = {}
+        for key, column in self.columns.items():
+            va, vb = column.get(ra), column.get(rb)
+            if va != vb or column.mask[ra] != column.mask[rb]:
+                out[key] = (va, vb)
+        return out
+
+
+def _usage() -> None:
+    print(__doc__)
+    sys.exit(0)
+
+
+def main(argv=None) -> int:
+    """Entry point for ``python -m fargv.index``."""
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if len(argv) < 2 or argv[0].startswith("-"):
+        _usage()
+    root, op, args = argv[0], argv[1], argv[2:]
+    if not os.path.isdir(root):
+        sys.stderr.write(f"fargv.index: {root}: not a directory\n")
+        return 1
+    index = RunIndex(root)
+    try:
+        if op == "update" and not args:
+            added, changed, removed = index.update()
+            print(f"{len(index)} runs ({added} added, {changed} changed, {removed} removed)")
+            return 0
+        if not index.path.exists():
+            index.update()
+        if op == "select":
+            for run in index.select(*args):
+                print(run)
+        elif op == "show" and len(args) == 1:
+            for key, value in index.record(args[0]).items():
+                print(f"{key}={json.dumps(value, default=str)}")
+        elif op == "diff" and len(args) == 2:
+            for key, (va, vb) in index.diff(*args).items():
+                print(f"{key}: {json.dumps(va, default=str)} -> {json.dumps(vb, default=str)}")
+        elif op == "columns" and not args:
+            for key, kind in index.kinds().items():
+                print(f"{key}\t{kind}")
+        else:
+            sys.stderr.write(f"fargv.index: bad command {' '.join([op] + args)!r} (see --help)\n")
+            return 2
+    except FargvError as exc:
+        sys.stderr.write(f"fargv.index: {exc}\n")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
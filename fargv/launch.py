@@ -0,0 +1,221 @@
+"""Run a callable over every configuration of a sweep, in parallel.
+
+Used by :func:`fargv.parse_and_launch` when ``jobs=`` (or ``--fargv_jobs=N``)
+is given.  Each configuration becomes one task: its argument list is parsed
+*inside* the worker, so parse errors are isolated like any other failure and
+nothing but strings has to cross a process boundary on the way in.
+
+* ``executor="process"`` runs tasks on a :class:`~concurrent.futures.ProcessPoolExecutor`
+  (*fn* and its return value must be picklable); ``"thread"`` uses a
+  :class:`~concurrent.futures.ThreadPoolExecutor` for I/O-bound callables.
+* At most ``2 * jobs`` tasks are in flight, so a sweep is consumed lazily.
+* A failing task is recorded and the others carry on.  A worker process
+  that dies breaks its pool: the tasks in flight in it are recorded as
+  failed and a fresh pool runs the rest.
+* ``results=path.jsonl`` appends one JSON object per finished task.
+"""
+import concurrent.futures as _futures
+import heapq
+import json
+import os
+import sys
+import time
+import traceback
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .parameters.base import FargvError
+
+LAUNCH_FLAGS = ("fargv_jobs", "fargv_results", "fargv_memo")
+"""Command-line flags consumed by :func:`fargv.parse_and_launch`."""
+
+
+class TaskResult:
+    """Outcome of one sweep task.
+
+    :param index:      Configuration index in the sweep.
+    :param assignment: The swept ``{name: value_string}`` picks.
+    :param value:      Return value of the callable (``None`` on failure).
+    :param error:      Formatted traceback, or ``None`` on success.
+    :param seconds:    Wall-clock duration of the task.
+    :param pid:        Process that ran it.
+    """
+    __slots__ = ("index", "assignment", "value", "error", "seconds", "pid")
+
+    def __init__(self, index: int, assignment: Dict[str, str], value: Any = None,
+                 error: Optional[str] = None, seconds: float = 0.0, pid: int = 0) -> None:
+        self.index      = index
+        self.assignment = assignment
+        self.value      = value
+        self.error      = error
+        self.seconds    = seconds
+        self.pid        = pid
+
+    @property
+    def ok(self) -> bool:
+        """``True`` when the task returned normally."""
+        return self.error is None
+
+    def to_json(self) -> str:
+        """Return the JSON line written to the results sink."""
+        return json.dumps({
+            "index": self.index, "params": self.assignment, "ok": self.ok,
+            "result": self.value, "error": self.error,
+            "seconds": round(self.seconds, 6), "pid": self.pid,
+        }, default=str)
+
+    def __repr__(self) -> str:
+        state = "ok" if self.ok else "failed"
+        return f"TaskResult(index={self.index}, {state}, value={self.value!r})"
+
+
+def _pin_worker(counter, cpu_sets: Sequence[Sequence[int]]) -> None:
+    """Pool initializer: pin the calling worker to the next CPU set in turn."""
+    with counter.get_lock():
+        slot = counter.value
+        counter.value += 1
+    try:
+        os.sched_setaffinity(0, cpu_sets[slot % len(cpu_sets)])
+    except (AttributeError, OSError) as exc:
+        print(f"fargv: cannot set CPU affinity: {exc}", file=sys.stderr)
+
+
+def _cpu_sets(cpu_affinity) -> Optional[List[List[int]]]:
+    if cpu_affinity is None:
+        return None
+    if cpu_affinity == "pin":
+        if not hasattr(os, "sched_getaffinity"):
+            print("fargv: CPU pinning is not supported on this platform", file=sys.stderr)
+            return None
+        return [[cpu] for cpu in sorted(os.sched_getaffinity(0))]
+    if isinstance(cpu_affinity, str) or not cpu_affinity:
+        raise FargvError(f"cpu_affinity must be 'pin' or a list of CPU sets, got {cpu_affinity!r}")
+    return [[int(cpu) for cpu in cpus] for cpus in cpu_affinity]
+
+
+def _run_task(fn: Callable, argv: List[str], parse_kwargs: Dict[str, Any]) -> Tuple[Any, Optional[str], float, int]:
+    """Worker body: parse *argv* for *fn*, call it, and never raise."""
+    from .parse import parse_and_launch
+    start = time.perf_counter()
+    try:
+        value = parse_and_launch(fn, argv, **parse_kwargs)
+        error = None
+    except (Exception, SystemExit):   # SystemExit from --help or a bad value included
+        value, error = None, traceback.format_exc()
+    return value, error, time.perf_counter() - start, os.getpid()
+
+
+def run_sweep(
+    fn: Callable,
+    sweep,
+    jobs: int = 1,
+    executor: str = "process",
+    ordered: bool = True,
+    results: Optional[Union[str, os.PathLike]] = None,
+    cpu_affinity=None,
+    task_kwargs: Optional[Dict[str, Any]] = None,
+) -> List[TaskResult]:
+    """Call *fn* once per configuration of *sweep*.
+
+    :param fn:           The callable; its signature is the parser definition.
+    :param sweep:        A :class:`~fargv.sweep.Sweep` built over *fn*.
+    :param jobs:         Concurrent tasks; ``0`` means one per CPU.  With
+                         ``1`` tasks run in this thread, one after another.
+    :param executor:     ``"process"`` or ``"thread"``.
+    :param ordered:      Return (and write) results in configuration order;
+                         otherwise in completion order.
+    :param results:      Append one JSON line per task to this file.
+    :param cpu_affinity: ``"pin"`` to pin each worker to one CPU (round
+                         robin over the CPUs this process may use), or a
+                         list of CPU sets handed to workers in turn.
+                         Linux only; ignored with a warning elsewhere.
+    :param task_kwargs:  Extra keyword arguments for the
+                         :func:`fargv.parse_and_launch` call of each task
+                         (e.g. ``memo=``).
+    :return: One :class:`TaskResult` per configuration.
+    """
+    if executor not in ("process", "thread"):
+        raise FargvError(f"executor must be 'process' or 'thread', got {executor!r}")
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    if jobs < 0:
+        raise FargvError(f"jobs must not be negative, got {jobs}")
+    cpu_sets = _cpu_sets(cpu_affinity)
+    tasks = ((position, index, assignment, sweep.argv_for(assignment))
+             for position, (index, assignment) in enumerate(sweep.indexed_assignments()))
+
+    sink = open(results, "a", encoding="utf-8") if results is not None else None
+    collected: List[TaskResult] = []
+    try:
+        launch_kwargs = {**sweep.parse_kwargs, **(task_kwargs or {})}
+        for result in _ordered(_execute(fn, tasks, launch_kwargs, jobs, executor, cpu_sets),
+                               enabled=ordered):
+            if sink is not None:
+                sink.write(result.to_json() + "\n")
+                sink.flush()
+            collected.append(result)
+    finally:
+        if sink is not None:
+            sink.close()
+    failed = sum(1 for r in collected if not r.ok)
+    if failed:
+        print(f"fargv: {failed} of {len(collected)} tasks failed", file=sys.stderr)
+    return collected
+
+
+def _ordered(results: Iterator[Tuple[int, TaskResult]], enabled: bool) -> Iterator[TaskResult]:
+    """Re-emit ``(position, result)`` pairs in position order when *enabled*,
+    holding back early arrivals; otherwise pass them through as they come."""
+    held: List[Tuple[int, TaskResult]] = []
+    expected = 0
+    for position, result in results:
+        if not enabled:
+            yield result
+            continue
+        heapq.heappush(held, (position, result))
+        while held and held[0][0] == expected:
+            yield heapq.heappop(held)[1]
+            expected += 1
+
+
+def _execute(fn, tasks, parse_kwargs, jobs, executor, cpu_sets) -> Iterator[Tuple[int, TaskResult]]:
+    if jobs == 1 and cpu_sets is None:
+        for position, index, assignment, argv in tasks:
+            yield position, TaskResult(index, assignment, *_run_task(fn, argv, parse_kwargs))
+        return
+
+    import multiprocessing
+    pool_cls = _futures.ProcessPoolExecutor if executor == "process" else _futures.ThreadPoolExecutor
+    pool_kwargs: Dict[str, Any] = {"max_workers": jobs}
+    if cpu_sets is not None:
+        pool_kwargs.update(initializer=_pin_worker, initargs=(multiprocessing.Value("i", 0), cpu_sets))
+
+    pool = pool_cls(**pool_kwargs)
+    pending: Dict[_futures.Future, Tuple[int, int, Dict[str, str]]] = {}
+    try:
+        exhausted = False
+        while pending or not exhausted:
+            while not exhausted and len(pending) < 2 * jobs:
+                task = next(tasks, None)
+                if task is None:
+                    exhausted = True
+                    break
+                position, index, assignment, argv = task
+                try:
+                    future = pool.submit(_run_task, fn, argv, parse_kwargs)
+                except _futures.BrokenExecutor:
+                    pool.shutdown(wait=False)
+                    pool = pool_cls(**pool_kwargs)
+                    future = pool.submit(_run_task, fn, argv, parse_kwargs)
+                pending[future] = (position, index, assignment)
+            if not pending:
+                break
+            done, _ = _futures.wait(pending, return_when=_futures.FIRST_COMPLETED)
+            for future in done:
+                position, index, assignment = pending.pop(future)
+                try:
+                    yield position, TaskResult(index, assignment, *future.result())
+                except Exception as exc:   # dead worker, unpicklable fn or result, ...
+                    error = "".join(traceback.format_exception_only(type(exc), exc))
+                    yield position, TaskResult(index, assignment, error=error)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
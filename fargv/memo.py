@@ -0,0 +1,222 @@
+"""On-disk memoisation of :func:`fargv.parse_and_launch` calls.
+
+A call is keyed on the SHA-256 of the canonical encoding
+(:mod:`fargv.digest`) of:
+
+* the callable's qualified name (module + ``__qualname__``),
+* a hash of its source code (of its code object when the source is not
+  available), so editing the function invalidates its entries,
+* the keyword arguments it is about to receive.
+
+The pickled return value is stored as ``<dir>/<key[:2]>/<key>.pkl``; a hit
+unpickles it and skips the call entirely.  Entries are written atomically
+and a hit refreshes the entry's mtime.  Stores add their size to a running
+estimate kept in ``<dir>/usage``; when the estimate exceeds *max_bytes*,
+and every :data:`SCAN_EVERY` stores in any case (other processes may share
+the directory), the directory is scanned and the least recently used
+entries are deleted until it fits.
+
+Only the return value is cached, never side effects, so a call is not
+memoised (it simply runs) when an argument is a writable stream, reads
+standard input, or has no canonical encoding.  The hash covers *fn* alone,
+not the functions it calls.
+"""
+import hashlib
+import inspect
+import marshal
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from .digest import PathMode, canonical_bytes, update
+
+MEMO_ENV = "FARGV_MEMO"
+"""Environment variable naming a memo directory; enables memoisation when set."""
+
+SCAN_EVERY = 64
+"""Stores between full scans of the memo directory."""
+
+
+def default_memo_dir() -> Path:
+    """Return ``$XDG_CACHE_HOME/fargv/memo`` (``~/.cache/fargv/memo`` by default)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+    return Path(base) / "fargv" / "memo"
+
+
+def _source_hash(fn: Callable) -> bytes:
+    target = inspect.unwrap(fn)
+    try:
+        data = inspect.getsource(target).encode("utf-8")
+    except (OSError, TypeError):
+        code = getattr(target, "__code__", None)
+        if code is None:
+            raise TypeError(f"cannot fingerprint {fn!r}: no source or code object")
+        data = marshal.dumps(code)
+    return hashlib.sha256(data).digest()
+
+
+def _uncacheable(value: Any) -> Optional[str]:
+    """Return why *value* must not be memoised, or ``None``."""
+    if any(value is std for std in (sys.stdin, getattr(sys.stdin, "buffer", None))):
+        return "reads standard input"
+    writable = getattr(value, "writable", None)
+    if callable(writable):
+        try:
+            if writable():
+                return "is a writable stream"
+        except ValueError:   # closed file
+            return "is a closed stream"
+    if isinstance(value, (list, tuple)):
+        return next((r for r in map(_uncacheable, value) if r), None)
+    tokens = getattr(value, "tokens", None)
+    if isinstance(tokens, list) and "@-" in tokens:
+        return "reads standard input"
+    return None
+
+
+class MemoCache:
+    """Directory of memoised call results with size-bounded LRU eviction.
+
+    :param directory: Cache directory; defaults to :func:`default_memo_dir`.
+    :param max_bytes: Evict least-recently-used entries beyond this total size.
+    :param paths:     How path arguments are hashed: ``"path"`` by name,
+                      ``"content"`` by name and file content.
+    """
+
+    def __init__(self, directory: Optional[Union[str, os.PathLike]] = None,
+                 max_bytes: int = 1 << 30, paths: PathMode = "path") -> None:
+        self.directory = Path(directory) if directory is not None else default_memo_dir()
+        self.max_bytes = max_bytes
+        self.paths     = paths
+        self.hits      = 0
+        self.misses    = 0
+
+    def key(self, fn: Callable, kwargs: Dict[str, Any]) -> str:
+        """Return the cache key of calling *fn* with *kwargs*.
+
+        :raises TypeError: When an argument has no canonical encoding.
+        """
+        name = f"{getattr(fn, '__module__', '?')}.{getattr(fn, '__qualname__', repr(fn))}"
+        h = hashlib.sha256()
+        h.update(canonical_bytes(name))
+        h.update(_source_hash(fn))
+        update(h, kwargs, self.paths)
+        return h.hexdigest()
+
+    def _entry(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.pkl"
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Return ``(True, value)`` for a stored *key*, else ``(False, None)``."""
+        entry = self._entry(key)
+        try:
+            with open(entry, "rb") as fh:
+                value = pickle.load(fh)
+        except FileNotFoundError:
+            return False, None
+        except Exception as exc:   # truncated or incompatible pickle: drop it
+            print(f"fargv: discarding unreadable memo entry {entry}: {exc}", file=sys.stderr)
+            self._remove(entry)
+            return False, None
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+        return True, value
+
+    def _usage(self) -> Optional[Tuple[int, int]]:
+        """Return the ``(estimated bytes, stores since the last scan)`` record, if readable."""
+        try:
+            size, stores = (self.directory / "usage").read_text().split()
+            return int(size), int(stores)
+        except (OSError, ValueError):
+            return None
+
+    def _set_usage(self, size: int, stores: int) -> None:
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        except OSError:   # no directory yet: nothing to estimate
+            return
+        try:
+            with os.fdopen(fd, "w") as fh:
+                fh.write(f"{size} {stores}\n")
+            os.replace(tmp, self.directory / "usage")
+        except OSError:
+            self._remove(Path(tmp))
+
+    def put(self, key: str, value: Any) -> None:
+        """Store *value* under *key*; evict down to :attr:`max_bytes` when the
+        size estimate exceeds it or a periodic scan is due."""
+        entry = self._entry(key)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=entry.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                pickle.dump(value, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, entry)
+        except BaseException:
+            self._remove(Path(tmp))
+            raise
+        usage = self._usage()
+        try:
+            added = entry.stat().st_size
+        except FileNotFoundError:   # already evicted by another process
+            added = 0
+        if usage is None or usage[1] + 1 >= SCAN_EVERY or usage[0] + added > self.max_bytes:
+            self.evict()
+        else:
+            self._set_usage(usage[0] + added, usage[1] + 1)
+
+    def evict(self) -> None:
+        """Scan the directory, delete least-recently-used entries until the
+        total size fits, and reset the size estimate."""
+        entries = []
+        total = 0
+        for entry in self.directory.glob("*/*.pkl"):
+            try:
+                st = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime_ns, st.st_size, entry))
+            total += st.st_size
+        entries.sort()
+        for _, size, entry in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(entry)
+            total -= size
+        self._set_usage(total, 0)
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def call(self, fn: Callable, kwargs: Dict[str, Any]) -> Any:
+        """Return ``fn(**kwargs)``, from the cache when possible."""
+        reason = next((f"'{name}' {why}" for name, why in
+                       ((n, _uncacheable(v)) for n, v in kwargs.items()) if why), None)
+        if reason is None:
+            try:
+                key = self.key(fn, kwargs)
+            except TypeError as exc:
+                reason = str(exc)
+        if reason is not None:
+            print(f"fargv: not memoising {getattr(fn, '__name__', fn)}: {reason}", file=sys.stderr)
+            return fn(**kwargs)
+        hit, value = self.get(key)
+        if hit:
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = fn(**kwargs)
+        try:
+            self.put(key, value)
+        except (pickle.PicklingError, TypeError, AttributeError, OSError) as exc:
+            print(f"fargv: result of {getattr(fn, '__name__', fn)} not memoised: {exc}", file=sys.stderr)
+        return value
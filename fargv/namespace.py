@@ -4,15 +4,37 @@ FargvNamespace wraps a ``{name: FargvParameter}`` mapping and exposes
 each parameter as a plain attribute.  Writing a value validates it via
 the underlying parameter and notifies all attached backends.
 
+Several assignments can be grouped with :meth:`FargvNamespace.batch`;
+backends are then notified once, with every changed key, when the
+outermost batch exits.  :meth:`FargvNamespace.notify_async` moves backend
+notification off the assigning thread (see :class:`FargvAsyncDispatcher`).
+
 Built-in backends
 -----------------
 * :class:`FargvConfigBackend` — persists values to a JSON file.
+* :class:`FargvWatchBackend`  — hot-reloads changes made to a config file.
+* :class:`FargvSqliteBackend` — shares values between processes via SQLite.
+* :class:`FargvSharedMemoryBackend` — live scalar values for worker processes.
+* :class:`FargvSocketBackend` — Unix-socket control endpoint (see :mod:`fargv.ctl`).
 * :class:`FargvTkBackend`     — opens a Tk dialog; notifies backends on Run.
 """
+import atexit
 import json
+import os
+import queue
+import select
+import socket
+import stat
+import struct
+import sys
+import tempfile
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import deque
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, List
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 
 # ── protocol ─────────────────────────────────────────────────────────────────
@@ -20,6 +42,10 @@ from typing import Any, List
 class FargvBackend(ABC):
     """Abstract base for objects that can be linked to a :class:`FargvNamespace`."""
 
+    #: When ``True`` the backend is pickled along with its namespace (e.g. when
+    #: the namespace is sent to a worker process); other backends stay behind.
+    process_shared: bool = False
+
     @abstractmethod
     def attach(self, namespace: "FargvNamespace") -> None:
         """Called once when :meth:`FargvNamespace.link` is invoked.
@@ -35,6 +61,19 @@ class FargvBackend(ABC):
         Typical uses: write updated values to a file, update a UI widget.
         """
 
+    def on_params_changed(self, namespace: "FargvNamespace",
+                          changes: Dict[str, Any]) -> None:
+        """Called once per :meth:`FargvNamespace.batch` with every changed key.
+
+        The default implementation calls :meth:`on_param_changed` for each
+        entry; override it when one combined update is cheaper (e.g. a single
+        file write).
+
+        :param changes: ``{name: new_value}`` in assignment order.
+        """
+        for name, value in changes.items():
+            self.on_param_changed(namespace, name, value)
+
 
 # ── namespace ─────────────────────────────────────────────────────────────────
 
@@ -53,18 +92,50 @@ class FargvNamespace:
         p.lr = 0.01        # validated, written to file automatically
         print(p.lr)        # 0.01
         print(p.as_dict()) # {"lr": 0.01, "epochs": 10}
+
+    Group assignments with :meth:`batch` to notify backends once::
+
+        with p.batch():
+            p.lr = 0.02
+            p.epochs = 20      # one config-file write for both
     """
 
-    __slots__ = ("_params", "_backends")
+    __slots__ = ("_params", "_backends", "_batch_depth", "_dirty", "_originals", "_shared",
+                 "_dispatcher", "_digests", "_lock")
 
     def __init__(self, name2parameters: dict) -> None:
-        object.__setattr__(self, "_params",   dict(name2parameters))
-        object.__setattr__(self, "_backends", [])
+        object.__setattr__(self, "_params",      dict(name2parameters))
+        object.__setattr__(self, "_backends",    [])
+        object.__setattr__(self, "_batch_depth", 0)
+        object.__setattr__(self, "_dirty",       {})
+        object.__setattr__(self, "_originals",   {})
+        object.__setattr__(self, "_shared",      None)
+        object.__setattr__(self, "_dispatcher",  None)
+        object.__setattr__(self, "_digests",     {})
+        object.__setattr__(self, "_lock",        threading.RLock())
+
+    # ── pickling ─────────────────────────────────────────────────────────────
+
+    def __getstate__(self) -> dict:
+        backends = object.__getattribute__(self, "_backends")
+        return {
+            "params":   object.__getattribute__(self, "_params"),
+            "backends": [b for b in backends if b.process_shared],
+            "shared":   object.__getattribute__(self, "_shared"),
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["params"])
+        object.__setattr__(self, "_backends", list(state["backends"]))
+        object.__setattr__(self, "_shared",   state["shared"])
 
     # ── attribute access ─────────────────────────────────────────────────────
 
     def __getattr__(self, name: str) -> Any:
         params = object.__getattribute__(self, "_params")
+        shared = object.__getattribute__(self, "_shared")
+        if shared is not None:
+            shared.sync(params)
         try:
             return params[name].value
         except KeyError:
@@ -75,8 +146,15 @@ class FargvNamespace:
         params = object.__getattribute__(self, "_params")
         if name not in params:
             raise AttributeError(f"No parameter {name!r} in namespace")
-        params[name].evaluate(value)
-        self._notify(name, params[name].value)  # use coerced value
+        with object.__getattribute__(self, "_lock"):   # waits for other threads' batches
+            if object.__getattribute__(self, "_batch_depth"):
+                object.__getattribute__(self, "_originals").setdefault(name, params[name]._value)
+                params[name].evaluate(value)
+                object.__getattribute__(self, "_dirty")[name] = params[name].value
+                return
+            params[name].evaluate(value)
+            value = params[name].value   # use coerced value
+        self._notify(name, value)
 
     def __dir__(self) -> List[str]:
         return sorted(object.__getattribute__(self, "_params").keys())
@@ -102,19 +180,299 @@ class FargvNamespace:
 
     def _notify(self, name: str, value: Any) -> None:
         """Notify all backends that *name* changed to *value*."""
+        dispatcher = object.__getattribute__(self, "_dispatcher")
+        if dispatcher is not None:
+            dispatcher.submit({name: value})
+            return
         for backend in object.__getattribute__(self, "_backends"):
             backend.on_param_changed(self, name, value)
 
+    def _notify_many(self, changes: Dict[str, Any]) -> None:
+        """Notify all backends of several changes at once."""
+        dispatcher = object.__getattribute__(self, "_dispatcher")
+        if dispatcher is not None:
+            dispatcher.submit(changes)
+            return
+        for backend in object.__getattribute__(self, "_backends"):
+            backend.on_params_changed(self, changes)
+
+    def notify_async(self, queue_size: int = 1024,
+                     coalesce: bool = True) -> "FargvAsyncDispatcher":
+        """Deliver backend notifications on background threads from now on.
+
+        Assignments return as soon as the value is validated; see
+        :class:`FargvAsyncDispatcher` for ordering, coalescing and
+        :meth:`~FargvAsyncDispatcher.flush`.  Calling it again returns the
+        active dispatcher.
+
+        :param queue_size: Pending notifications per backend before an
+                           assignment blocks.
+        :param coalesce:   Merge repeated updates of a key that have not been
+                           delivered yet.
+        :return: The dispatcher (use it to flush, close, or read metrics).
+        """
+        dispatcher = object.__getattribute__(self, "_dispatcher")
+        if dispatcher is None:
+            dispatcher = FargvAsyncDispatcher(self, queue_size, coalesce)
+            object.__setattr__(self, "_dispatcher", dispatcher)
+        return dispatcher
+
+    @contextmanager
+    def batch(self) -> Iterator["FargvNamespace"]:
+        """Group assignments so backends are notified once, on exit.
+
+        Assignments inside the block are validated immediately but the
+        changed (dirty) keys are only delivered, via
+        :meth:`FargvBackend.on_params_changed`, when the outermost ``batch``
+        exits.  If the block raises, every parameter assigned inside it is
+        restored to its value from before the batch and nothing is notified.
+
+        A batch holds the namespace's lock until it exits, so assignments and
+        batches from other threads wait for it instead of joining it.
+        """
+        changes = None
+        with object.__getattribute__(self, "_lock"):
+            object.__setattr__(self, "_batch_depth", object.__getattribute__(self, "_batch_depth") + 1)
+            try:
+                yield self
+            except BaseException:
+                if object.__getattribute__(self, "_batch_depth") == 1:
+                    params = object.__getattribute__(self, "_params")
+                    for name, original in object.__getattribute__(self, "_originals").items():
+                        params[name]._value = original
+                    object.__getattribute__(self, "_dirty").clear()
+                    object.__getattribute__(self, "_originals").clear()
+                raise
+            finally:
+                object.__setattr__(self, "_batch_depth", object.__getattribute__(self, "_batch_depth") - 1)
+            if object.__getattribute__(self, "_batch_depth") == 0:
+                changes = dict(object.__getattribute__(self, "_dirty"))
+                object.__getattribute__(self, "_dirty").clear()
+                object.__getattribute__(self, "_originals").clear()
+        if changes:
+            self._notify_many(changes)
+
     # ── helpers ───────────────────────────────────────────────────────────────
 
     def as_dict(self) -> dict:
         """Return a plain ``{name: value}`` snapshot of current values."""
         params = object.__getattribute__(self, "_params")
+        shared = object.__getattribute__(self, "_shared")
+        if shared is not None:
+            shared.sync(params)
         return {k: p.value for k, p in params.items()}
 
+    def result_digest(self, paths: str = "path") -> str:
+        """Return the stable fingerprint of the current values.
+
+        Equal to :func:`fargv.result_digest` of :meth:`as_dict`.  Per-key
+        digests are cached against the value object they were computed from,
+        so after an assignment only the changed keys are re-hashed.  Mutable
+        values (lists, dicts) and ``paths="content"`` are always re-hashed.
+
+        :param paths: ``"path"`` or ``"content"``; see :mod:`fargv.digest`.
+        """
+        from .digest import combine_digests, is_frozen, key_digest
+        params = object.__getattribute__(self, "_params")
+        shared = object.__getattribute__(self, "_shared")
+        if shared is not None:
+            shared.sync(params)
+        cache = object.__getattribute__(self, "_digests")
+        reuse = paths == "path"
+        digests = {}
+        for name, param in params.items():
+            if getattr(param, "filter_out", False):
+                continue
+            value = param.value
+            cached = cache.get(name) if reuse else None
+            if cached is None or cached[0] is not value:
+                cached = (value, key_digest(name, value, paths))
+                if reuse and is_frozen(value):
+                    cache[name] = cached
+            digests[name] = cached[1]
+        return combine_digests(digests)
+
+
+# ── asynchronous notification ────────────────────────────────────────────────
+
+class _Lane:
+    """Pending notifications of one backend, drained in order by one thread."""
+    __slots__ = ("backend", "items", "busy", "thread")
+
+    def __init__(self, backend: FargvBackend) -> None:
+        self.backend = backend
+        self.items: deque = deque()    # [changes, enqueue_time]
+        self.busy = False
+        self.thread: Optional[threading.Thread] = None
+
+
+class FargvAsyncDispatcher:
+    """Delivers :class:`FargvNamespace` change notifications on background threads.
+
+    Created by :meth:`FargvNamespace.notify_async`.  Each linked backend gets
+    its own bounded queue and daemon thread, so a slow backend never delays
+    the assigning thread or the other backends, and each backend receives
+    its notifications in assignment order.
+
+    With *coalesce* on, an update is merged into the backend's newest
+    undelivered notification: a key assigned 1000 times while the backend
+    was busy is delivered once, with its last value, via
+    :meth:`FargvBackend.on_params_changed`.  When a backend's queue already
+    holds *queue_size* notifications the assignment blocks until it drains.
+
+    Exceptions raised by a backend are counted in :attr:`metrics` and the
+    first one is re-raised by the next :meth:`flush`.
+    """
+
+    def __init__(self, namespace: FargvNamespace, queue_size: int = 1024,
+                 coalesce: bool = True) -> None:
+        self._namespace  = namespace
+        self._queue_size = queue_size
+        self._coalesce   = coalesce
+        self._lanes: Dict[int, _Lane] = {}
+        self._cond   = threading.Condition()
+        self._closed = False
+        self._error: Optional[BaseException] = None
+        self._enqueued = self._delivered = self._coalesced = self._errors = 0
+        self._max_depth = 0
+        self._latency_total = self._latency_max = 0.0
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of queue and delivery statistics.
+
+        Keys: ``depth`` (undelivered notifications), ``max_depth``,
+        ``enqueued``, ``delivered``, ``coalesced``, ``errors``,
+        ``mean_latency`` and ``max_latency`` (seconds from submission to the
+        end of delivery).
+        """
+        with self._cond:
+            return {
+                "depth":        self._depth(),
+                "max_depth":    self._max_depth,
+                "enqueued":     self._enqueued,
+                "delivered":    self._delivered,
+                "coalesced":    self._coalesced,
+                "errors":       self._errors,
+                "mean_latency": self._latency_total / self._delivered if self._delivered else 0.0,
+                "max_latency":  self._latency_max,
+            }
+
+    def _depth(self) -> int:
+        return sum(len(lane.items) for lane in self._lanes.values())
+
+    def submit(self, changes: Dict[str, Any]) -> None:
+        """Queue *changes* for every backend currently linked to the namespace."""
+        backends = object.__getattribute__(self._namespace, "_backends")
+        now = time.monotonic()
+        with self._cond:
+            for backend in backends:
+                lane = self._lane(backend)
+                if self._coalesce and lane.items:
+                    pending = lane.items[-1][0]
+                    for name in changes:
+                        pending.pop(name, None)   # re-append: keeps assignment order
+                    pending.update(changes)
+                    self._coalesced += 1
+                    continue
+                while len(lane.items) >= self._queue_size and not self._closed:
+                    self._cond.wait()
+                lane.items.append([dict(changes), now])
+                self._enqueued += 1
+            self._max_depth = max(self._max_depth, self._depth())
+            self._cond.notify_all()
+
+    def _lane(self, backend: FargvBackend) -> _Lane:
+        lane = self._lanes.get(id(backend))
+        if lane is None:
+            lane = self._lanes[id(backend)] = _Lane(backend)
+            lane.thread = threading.Thread(target=self._drain, args=(lane,),
+                                           name="fargv-notify", daemon=True)
+            lane.thread.start()
+        return lane
+
+    def _drain(self, lane: _Lane) -> None:
+        while True:
+            with self._cond:
+                while not lane.items and not self._closed:
+                    self._cond.wait()
+                if not lane.items:
+                    return
+                changes, submitted = lane.items.popleft()
+                lane.busy = True
+                self._cond.notify_all()
+            error = None
+            try:
+                if len(changes) == 1:
+                    (name, value), = changes.items()
+                    lane.backend.on_param_changed(self._namespace, name, value)
+                else:
+                    lane.backend.on_params_changed(self._namespace, changes)
+            except BaseException as exc:
+                error = exc
+            latency = time.monotonic() - submitted
+            with self._cond:
+                lane.busy = False
+                self._delivered += 1
+                self._latency_total += latency
+                self._latency_max = max(self._latency_max, latency)
+                if error is not None:
+                    self._errors += 1
+                    if self._error is None:
+                        self._error = error
+                self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every queued notification has been delivered.
+
+        :param timeout: Seconds to wait; ``None`` waits indefinitely.
+        :return: ``True`` when drained, ``False`` on timeout.
+        :raises Exception: The first exception raised by a backend since the
+            previous flush.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while any(lane.items or lane.busy for lane in self._lanes.values()):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+        return True
+
+    def close(self) -> None:
+        """Flush, stop the worker threads and return the namespace to synchronous notification."""
+        try:
+            self.flush()
+        finally:
+            with self._cond:
+                self._closed = True
+                self._cond.notify_all()
+            for lane in self._lanes.values():
+                lane.thread.join()
+            if object.__getattribute__(self._namespace, "_dispatcher") is self:
+                object.__setattr__(self._namespace, "_dispatcher", None)
+
 
 # ── built-in backends ─────────────────────────────────────────────────────────
 
+def _atomic_write_text(path: Path, text: str) -> None:
+    """Write *text* to a temp file beside *path*, then rename it over *path*."""
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w") as fh:
+            fh.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
 class FargvConfigBackend(FargvBackend):
     """JSON config-file backend.
 
@@ -122,14 +480,34 @@ class FargvConfigBackend(FargvBackend):
       parameter objects, without triggering further backend notifications
       (the load is treated as initialization, not a user change).
     * **on_param_changed** — writes the full current namespace to the file.
+    * **on_params_changed** — one write for a whole :meth:`FargvNamespace.batch`.
+
+    Every write goes to a temporary file in the same directory which is then
+    renamed onto *path*, so a crash never leaves a truncated config.  With
+    ``debounce`` set, writes are coalesced: the first change schedules a write
+    *debounce* seconds later on a background thread, and further changes
+    until then ride along.  Pending writes are flushed at interpreter exit or
+    by :meth:`flush`; :meth:`close` flushes and drops the exit hook.
 
     Example::
 
         p.link(FargvConfigBackend("~/.myapp.json"))
+        p.link(FargvConfigBackend("~/.myapp.json", debounce=0.5))
     """
 
-    def __init__(self, path) -> None:
-        self._path = Path(path).expanduser()
+    def __init__(self, path, debounce: Optional[float] = None) -> None:
+        """
+        :param path:     JSON file to load from and persist to.
+        :param debounce: Seconds to coalesce writes over; ``None`` writes
+                         synchronously on every notification.
+        """
+        self._path     = Path(path).expanduser()
+        self._debounce = debounce
+        self._lock     = threading.Lock()
+        self._pending: Optional[FargvNamespace] = None
+        self._timer: Optional[threading.Timer] = None
+        if debounce is not None:
+            atexit.register(self.flush)
 
     def attach(self, namespace: FargvNamespace) -> None:
         if not self._path.exists():
@@ -152,11 +530,799 @@ class FargvConfigBackend(FargvBackend):
 
     def on_param_changed(self, namespace: FargvNamespace,
                          name: str, value: Any) -> None:
+        self.on_params_changed(namespace, {name: value})
+
+    def on_params_changed(self, namespace: FargvNamespace,
+                          changes: Dict[str, Any]) -> None:
+        if self._debounce is None:
+            self._write(namespace)
+            return
+        with self._lock:
+            self._pending = namespace
+            if self._timer is None:
+                self._timer = threading.Timer(self._debounce, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        """Write any debounced change now (no-op when nothing is pending)."""
+        with self._lock:
+            namespace, self._pending = self._pending, None
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if namespace is not None:
+            self._write(namespace)
+
+    def close(self) -> None:
+        """Flush any pending write and stop holding the backend alive until exit."""
+        self.flush()
+        if self._debounce is not None:
+            atexit.unregister(self.flush)
+
+    def _write(self, namespace: FargvNamespace) -> None:
+        try:
+            _atomic_write_text(
+                self._path, json.dumps(namespace.as_dict(), indent=2, default=str))
+        except OSError:
+            pass
+
+
+# inotify(7) constants (Linux)
+_IN_MODIFY      = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO    = 0x00000080
+_IN_CREATE      = 0x00000100
+_IN_EVENT_HEADER = struct.Struct("iIII")   # wd, mask, cookie, len
+
+
+def _inotify_open(directory: Path) -> Optional[int]:
+    """Return an inotify fd watching *directory*, or ``None`` when unavailable."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            return None
+        mask = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+        if libc.inotify_add_watch(fd, os.fsencode(directory), mask) < 0:
+            os.close(fd)
+            return None
+        return fd
+    except (OSError, AttributeError):
+        return None
+
+
+def _inotify_names(data: bytes) -> Iterator[bytes]:
+    """Yield the file names carried by a buffer of ``inotify_event`` records."""
+    offset = 0
+    while offset + _IN_EVENT_HEADER.size <= len(data):
+        _, _, _, length = _IN_EVENT_HEADER.unpack_from(data, offset)
+        offset += _IN_EVENT_HEADER.size
+        yield data[offset:offset + length].rstrip(b"\0")
+        offset += length
+
+
+class FargvWatchBackend(FargvBackend):
+    """Hot-reload backend: applies edits of a config file to a live namespace.
+
+    A daemon thread watches *path* (inotify on Linux, ``stat`` polling
+    elsewhere or when inotify is unavailable).  A burst of writes is
+    debounced: the file is reloaded once it has been quiet for *debounce*
+    seconds.  The file is read with :func:`~fargv.config.load_config`, so any
+    supported format works.
+
+    Changed keys are applied inside :meth:`FargvNamespace.batch`, i.e.
+    through each parameter's ``evaluate`` and then one notification to the
+    other backends.  An update containing an unknown key or a value that
+    fails validation is rejected as a whole — the namespace keeps its
+    previous values — and reported on stderr.
+
+    Updates are applied from the watcher thread.
+
+    Example::
+
+        p.link(FargvWatchBackend("/etc/myservice/tunables.json"))
+        ...
+        p.threshold   # reflects the latest valid edit of the file
+    """
+
+    def __init__(self, path, debounce: float = 0.2, poll_interval: float = 1.0,
+                 use_inotify: Optional[bool] = None) -> None:
+        """
+        :param path:          Config file to watch.
+        :param debounce:      Quiet period (seconds) before a reload.
+        :param poll_interval: ``stat`` period (seconds) for the polling fallback.
+        :param use_inotify:   ``False`` forces polling; ``None`` uses inotify
+                              when available.
+        """
+        self._path          = Path(path).expanduser()
+        self._debounce      = debounce
+        self._poll_interval = poll_interval
+        self._use_inotify   = use_inotify
+        self._namespace: Optional[FargvNamespace] = None
+        self._fd: Optional[int] = None
+        self._signature = None
+        self._stop   = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def uses_inotify(self) -> bool:
+        """``True`` when changes are detected with inotify rather than polling."""
+        return self._fd is not None
+
+    def attach(self, namespace: FargvNamespace) -> None:
+        self._namespace = namespace
+        if self._use_inotify is not False:
+            self._fd = _inotify_open(self._path.parent)
+        self._signature = self._stat_signature()
+        self.reload()
+        self._thread = threading.Thread(target=self._run, name="fargv-watch", daemon=True)
+        self._thread.start()
+
+    def on_param_changed(self, namespace: FargvNamespace,
+                         name: str, value: Any) -> None:
+        pass
+
+    def close(self) -> None:
+        """Stop watching (the namespace keeps its current values)."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def reload(self) -> bool:
+        """Read the file now and apply the keys whose values changed.
+
+        :return: ``True`` when the update was applied (or nothing changed),
+                 ``False`` when it was rejected.
+        """
+        from .config import load_config
+        namespace = self._namespace
+        params = object.__getattribute__(namespace, "_params")
+        try:
+            data = load_config(self._path, use_cache=False)
+            unknown = sorted(k for k in data if k not in params)
+            if unknown:
+                raise ValueError(f"unknown key(s) {unknown}")
+            with namespace.batch():
+                for name, value in data.items():
+                    if params[name].value != value:
+                        setattr(namespace, name, value)
+        except Exception as exc:
+            print(f"fargv: ignoring update of '{self._path}': {exc}", file=sys.stderr)
+            return False
+        return True
+
+    # ── change detection ─────────────────────────────────────────────────────
+
+    def _stat_signature(self):
+        try:
+            st = self._path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size, st.st_ino
+
+    def _changed_within(self, timeout: float) -> bool:
+        """Wait up to *timeout* seconds; return ``True`` if the file changed."""
+        deadline = time.monotonic() + timeout
+        while not self._stop.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if self._fd is not None:
+                ready, _, _ = select.select([self._fd], [], [], min(remaining, 0.1))
+                if ready and self._path.name.encode() in _inotify_names(os.read(self._fd, 65536)):
+                    return True
+            else:
+                self._stop.wait(min(remaining, self._poll_interval))
+                signature = self._stat_signature()
+                if signature != self._signature:
+                    self._signature = signature
+                    return True
+        return False
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            if not self._changed_within(self._poll_interval):
+                continue
+            while self._changed_within(self._debounce):
+                pass
+            if not self._stop.is_set():
+                self.reload()
+
+
+class FargvSqliteBackend(FargvBackend):
+    """SQLite backend for sharing a namespace between many local processes.
+
+    Values live in a SQLite database opened in WAL mode, one row per
+    ``(namespace, key)`` holding the JSON-encoded value.  Each change is a
+    per-key upsert inside a short transaction, so concurrent writers of
+    different keys never lose each other's updates.  Every write bumps a
+    per-namespace version counter; :meth:`poll` reads that single counter
+    and only fetches rows newer than the last version it has seen.
+
+    * **attach** — creates the tables if needed, seeds keys missing from the
+      database with the namespace's current values, then loads the stored
+      values (without notifications, like :class:`FargvConfigBackend`).
+    * **on_params_changed** — upserts the changed keys in one transaction.
+    * :meth:`poll` — applies rows changed by other processes through
+      :meth:`FargvNamespace.batch` (validated; the other backends are
+      notified, this one is not).  With ``poll_interval`` set, a daemon
+      thread polls automatically.  The values a poll applied are remembered
+      until their notification comes back, so they are not written back even
+      when :meth:`FargvNamespace.notify_async` delivers it on another thread.
+
+    Example::
+
+        p.link(FargvSqliteBackend("/dev/shm/tunables.db", namespace="job42",
+                                  poll_interval=1.0))
+    """
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS fargv_params ("
+        " ns TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL,"
+        " version INTEGER NOT NULL, PRIMARY KEY (ns, key))",
+        "CREATE INDEX IF NOT EXISTS fargv_params_version ON fargv_params (ns, version)",
+        "CREATE TABLE IF NOT EXISTS fargv_versions ("
+        " ns TEXT PRIMARY KEY, version INTEGER NOT NULL)",
+    )
+
+    def __init__(self, path, namespace: str = "default",
+                 poll_interval: Optional[float] = None, timeout: float = 30.0) -> None:
+        """
+        :param path:          SQLite database file (created if missing).
+        :param namespace:     Name of the namespace inside the database; several
+                              independent namespaces can share one file.
+        :param poll_interval: Seconds between automatic :meth:`poll` calls on a
+                              daemon thread; ``None`` leaves polling to the caller.
+        :param timeout:       Seconds to wait for a database lock.
+        """
+        self._path          = Path(path).expanduser()
+        self._ns_name       = namespace
+        self._poll_interval = poll_interval
+        self._timeout       = timeout
+        self._version       = 0
+        self._namespace: Optional[FargvNamespace] = None
+        self._local  = threading.local()
+        self._lock   = threading.Lock()
+        self._applied: Dict[str, str] = {}   # key -> encoded value poll() applied
+        self._stop   = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def version(self) -> int:
+        """Last namespace version applied by :meth:`attach` or :meth:`poll`."""
+        return self._version
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            import sqlite3
+            conn = sqlite3.connect(str(self._path), timeout=self._timeout,
+                                   isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def attach(self, namespace: FargvNamespace) -> None:
+        self._namespace = namespace
+        conn = self._conn()
+        for statement in self._SCHEMA:
+            conn.execute(statement)
+        params = object.__getattribute__(namespace, "_params")
+        with _sqlite_transaction(conn):
+            version = self._bump(conn)
+            conn.executemany(
+                "INSERT OR IGNORE INTO fargv_params (ns, key, value, version) VALUES (?, ?, ?, ?)",
+                [(self._ns_name, name, _json_value(p.value), version) for name, p in params.items()],
+            )
+            rows = conn.execute("SELECT key, value FROM fargv_params WHERE ns = ?",
+                                (self._ns_name,)).fetchall()
+        for name, encoded in rows:
+            if name in params:
+                try:
+                    params[name].evaluate(json.loads(encoded))
+                except Exception:
+                    pass
+        self._version = version
+        if self._poll_interval is not None:
+            self._thread = threading.Thread(target=self._run, name="fargv-sqlite", daemon=True)
+            self._thread.start()
+
+    def on_param_changed(self, namespace: FargvNamespace,
+                         name: str, value: Any) -> None:
+        self.on_params_changed(namespace, {name: value})
+
+    def on_params_changed(self, namespace: FargvNamespace,
+                          changes: Dict[str, Any]) -> None:
+        rows = []
+        with self._lock:
+            for name, value in changes.items():
+                encoded = _json_value(value)
+                if self._applied.pop(name, None) != encoded:
+                    rows.append((name, encoded))
+        if not rows:
+            return   # every change came from poll() and is already in the database
+        conn = self._conn()
+        with _sqlite_transaction(conn):
+            version = self._bump(conn)
+            conn.executemany(
+                "INSERT INTO fargv_params (ns, key, value, version) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (ns, key) DO UPDATE SET value = excluded.value, version = excluded.version",
+                [(self._ns_name, name, encoded, version) for name, encoded in rows],
+            )
+
+    def _bump(self, conn) -> int:
+        conn.execute(
+            "INSERT INTO fargv_versions (ns, version) VALUES (?, 1) "
+            "ON CONFLICT (ns) DO UPDATE SET version = version + 1",
+            (self._ns_name,),
+        )
+        return conn.execute("SELECT version FROM fargv_versions WHERE ns = ?",
+                            (self._ns_name,)).fetchone()[0]
+
+    def poll(self) -> bool:
+        """Apply changes other processes made since the last poll.
+
+        :return: ``True`` if the namespace version moved, ``False`` otherwise.
+        """
+        conn = self._conn()
+        row = conn.execute("SELECT version FROM fargv_versions WHERE ns = ?",
+                           (self._ns_name,)).fetchone()
+        if row is None or row[0] <= self._version:
+            return False
+        latest = row[0]
+        rows = conn.execute(
+            "SELECT key, value FROM fargv_params WHERE ns = ? AND version > ? AND version <= ?",
+            (self._ns_name, self._version, latest),
+        ).fetchall()
+        self._version = latest
+        namespace = self._namespace
+        params = object.__getattribute__(namespace, "_params")
+        applied = []
         try:
-            self._path.write_text(
-                json.dumps(namespace.as_dict(), indent=2, default=str))
+            with namespace.batch():
+                for name, encoded in rows:
+                    value = json.loads(encoded)
+                    if name in params and params[name].value != value:
+                        setattr(namespace, name, value)
+                        applied.append(name)
+                        with self._lock:
+                            self._applied[name] = _json_value(params[name].value)
+        except Exception as exc:
+            with self._lock:
+                for name in applied:
+                    self._applied.pop(name, None)
+            print(f"fargv: ignoring update from '{self._path}' [{self._ns_name}]: {exc}",
+                  file=sys.stderr)
+        return True
+
+    def close(self) -> None:
+        """Stop the polling thread and close this thread's connection."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._poll_interval):
+            try:
+                self.poll()
+            except Exception as exc:   # keep polling through transient lock errors
+                print(f"fargv: polling '{self._path}' failed: {exc}", file=sys.stderr)
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+
+
+@contextmanager
+def _sqlite_transaction(conn) -> Iterator[None]:
+    """``BEGIN IMMEDIATE`` … ``COMMIT`` (``ROLLBACK`` on error) on an autocommit connection."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+def _json_value(value: Any) -> str:
+    return json.dumps(value, default=str)
+
+
+_SHM_SEQ = struct.Struct("<Q")   # seqlock counter at offset 0: odd while a write is in progress
+
+
+def _open_shared_memory(name: str):
+    """Attach to an existing block; only its creator is responsible for unlinking it."""
+    from multiprocessing import shared_memory
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)   # Python >= 3.13
+    except TypeError:
+        # Children share the creator's resource tracker, where registration
+        # is idempotent, so attaching does not take over the cleanup.
+        return shared_memory.SharedMemory(name=name)
+
+
+class FargvSharedMemoryBackend(FargvBackend):
+    """Shares scalar parameter values with worker processes through shared memory.
+
+    On :meth:`attach` every ``int``, ``float``, ``bool`` and ``str`` parameter
+    gets a fixed slot in a :class:`multiprocessing.shared_memory.SharedMemory`
+    block (strings hold up to *str_size* UTF-8 bytes).  The backend is
+    pickled along with the namespace, so a namespace handed to
+    ``multiprocessing`` / DataLoader-style workers stays connected to the
+    block: assignments anywhere are validated by the parameter classes as
+    usual and published to the block, and attribute reads everywhere see
+    the latest published values.
+
+    Consistency uses a seqlock: a writer makes the counter odd, writes the
+    slots, then makes it even; readers retry until they see the same even
+    counter before and after copying.  A read whose counter is unchanged
+    since the last one costs a single 8-byte unpack.  Only one process
+    should write at a time (typically the parent).  Other parameter types
+    stay process-local.
+
+    The creating process unlinks the block on :meth:`close` or at exit.
+
+    Example::
+
+        p.link(FargvSharedMemoryBackend())
+        pool = multiprocessing.Pool(8, initializer=init_worker, initargs=(p,))
+        p.lr = 1e-4          # seen by every worker on its next read of p.lr
+    """
+
+    process_shared = True
+
+    _FORMATS = {"bool": "?", "int": "q", "float": "d"}
+
+    def __init__(self, str_size: int = 64) -> None:
+        """
+        :param str_size: Bytes reserved for each string parameter.
+        """
+        self._str_size = str_size
+        self._layout: Dict[str, Tuple[int, struct.Struct, str]] = {}
+        self._shm = None
+        self._shm_name: Optional[str] = None
+        self._owner = False
+        self._seen  = -1
+
+    @property
+    def shared_names(self) -> List[str]:
+        """Names of the parameters held in shared memory."""
+        return list(self._layout)
+
+    def attach(self, namespace: FargvNamespace) -> None:
+        from multiprocessing import shared_memory
+        params = object.__getattribute__(namespace, "_params")
+        offset = _SHM_SEQ.size
+        for name, param in params.items():
+            kind = _shared_kind(param)
+            if kind is None:
+                continue
+            fmt = f"<?H{self._str_size}s" if kind == "str" else "<?" + self._FORMATS[kind]
+            slot = struct.Struct(fmt)
+            self._layout[name] = (offset, slot, kind)
+            offset += slot.size
+        self._shm = shared_memory.SharedMemory(create=True, size=offset)
+        self._shm_name = self._shm.name
+        self._owner = True
+        atexit.register(self.close)
+        object.__setattr__(namespace, "_shared", self)
+        self._publish({name: params[name]._value for name in self._layout})
+
+    def on_param_changed(self, namespace: FargvNamespace,
+                         name: str, value: Any) -> None:
+        self.on_params_changed(namespace, {name: value})
+
+    def on_params_changed(self, namespace: FargvNamespace,
+                          changes: Dict[str, Any]) -> None:
+        params = object.__getattribute__(namespace, "_params")
+        self._publish({name: params[name]._value for name in changes if name in self._layout})
+
+    def _buf(self):
+        if self._shm is None:
+            self._shm = _open_shared_memory(self._shm_name)
+        return self._shm.buf
+
+    def _encode(self, name: str, value: Any) -> bytes:
+        """Pack *value* into the bytes of *name*'s slot (before any write starts)."""
+        from .parameters import FargvError
+        _, slot, kind = self._layout[name]
+        if value is None:
+            fields = (True, 0, b"") if kind == "str" else (True, 0)
+        elif kind == "str":
+            data = str(value).encode("utf-8")
+            if len(data) > self._str_size:
+                raise FargvError(
+                    f"Parameter '{name}': {len(data)} bytes exceed the shared slot "
+                    f"of {self._str_size} (raise str_size)")
+            fields = (False, len(data), data)
+        else:
+            fields = (False, value)
+        try:
+            return slot.pack(*fields)
+        except struct.error as exc:
+            raise FargvError(f"Parameter '{name}': cannot share {value!r}: {exc}") from exc
+
+    def _publish(self, values: Dict[str, Any]) -> None:
+        if not values:
+            return
+        encoded = {name: self._encode(name, value) for name, value in values.items()}
+        buf = self._buf()
+        seq = _SHM_SEQ.unpack_from(buf, 0)[0]
+        _SHM_SEQ.pack_into(buf, 0, seq + 1)
+        try:
+            for name, packed in encoded.items():
+                offset = self._layout[name][0]
+                buf[offset:offset + len(packed)] = packed
+        finally:
+            _SHM_SEQ.pack_into(buf, 0, seq + 2)
+        self._seen = seq + 2
+
+    def sync(self, params: Dict[str, Any]) -> None:
+        """Copy the published values into *params* if anything changed since the last sync."""
+        buf = self._buf()
+        if _SHM_SEQ.unpack_from(buf, 0)[0] == self._seen:
+            return
+        while True:
+            before = _SHM_SEQ.unpack_from(buf, 0)[0]
+            if before & 1:
+                time.sleep(0)
+                continue
+            values = {name: slot.unpack_from(buf, offset)
+                      for name, (offset, slot, _) in self._layout.items()}
+            if _SHM_SEQ.unpack_from(buf, 0)[0] == before:
+                break
+        for name, fields in values.items():
+            kind = self._layout[name][2]
+            if fields[0]:
+                value = None
+            elif kind == "str":
+                value = fields[2][:fields[1]].decode("utf-8")
+            else:
+                value = fields[1]
+            params[name]._value = value
+        self._seen = before
+
+    def close(self) -> None:
+        """Detach from the block; the creating process also unlinks it."""
+        atexit.unregister(self.close)
+        if self._shm is None:
+            return
+        shm, self._shm = self._shm, None
+        shm.close()
+        if self._owner:
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+
+    def __getstate__(self) -> dict:
+        return {"str_size": self._str_size, "shm_name": self._shm_name,
+                "layout": {n: (off, slot.format, kind) for n, (off, slot, kind) in self._layout.items()}}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["str_size"])
+        self._shm_name = state["shm_name"]
+        self._layout = {n: (off, struct.Struct(fmt), kind)
+                        for n, (off, fmt, kind) in state["layout"].items()}
+
+
+def _shared_kind(param) -> Optional[str]:
+    """Return the shared-memory slot kind for *param*, or ``None`` if it is not a scalar."""
+    target = param._get_class_type()
+    for kind, cls in (("bool", bool), ("int", int), ("float", float), ("str", str)):
+        if target is cls:
+            return kind
+    return None
+
+
+class FargvSocketBackend(FargvBackend):
+    """Control endpoint exposing a live namespace on a Unix domain socket.
+
+    A daemon thread accepts connections on *path*; each connection speaks a
+    line-based JSON protocol, one request object per line, one response
+    object per line:
+
+    ==========================================  =====================================
+    request                                     response
+    ==========================================  =====================================
+    ``{"op": "list"}``                          ``{"ok": true, "values": {...}}``
+    ``{"op": "get", "name": "lr"}``             ``{"ok": true, "value": 0.001}``
+    ``{"op": "set", "values": {"lr": "1e-4"}}``  ``{"ok": true, "values": {"lr": 0.0001}}``
+    ``{"op": "watch"}``                         ``{"ok": true}``, then one
+                                                ``{"changes": {...}}`` line per change
+    ==========================================  =====================================
+
+    Failures answer ``{"ok": false, "error": "..."}``.  A ``set`` goes through
+    :meth:`FargvNamespace.batch`: every value is validated by its parameter's
+    ``evaluate`` and either all keys are applied (and the other backends
+    notified once) or none.  Attribute reads never touch the server.
+
+    The socket is created with mode ``0600``.  Use :mod:`fargv.ctl` as the
+    client: ``python -m fargv.ctl /tmp/job.sock set lr=0.001``.
+    """
+
+    def __init__(self, path, watch_queue_size: int = 1024) -> None:
+        """
+        :param path:             Socket path.  A stale socket of the current user
+                                 is replaced; any other existing file is an error.
+        :param watch_queue_size: Undelivered events per watcher before that
+                                 watcher is disconnected.
+        """
+        self._path = Path(path).expanduser()
+        self._watch_queue_size = watch_queue_size
+        self._namespace: Optional[FargvNamespace] = None
+        self._watchers: List[_Watcher] = []
+        self._lock   = threading.Lock()
+        self._stop   = threading.Event()
+        self._server: Optional[socket.socket] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def path(self) -> Path:
+        """Filesystem path of the control socket."""
+        return self._path
+
+    def attach(self, namespace: FargvNamespace) -> None:
+        self._namespace = namespace
+        if os.path.lexists(self._path):
+            st = os.lstat(self._path)
+            if not stat.S_ISSOCK(st.st_mode) or st.st_uid != os.getuid():
+                raise OSError(f"'{self._path}' exists and is not a socket of yours; not replacing it")
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(str(self._path))
+            except OSError:
+                self._path.unlink()      # stale socket left by a dead process
+            else:
+                probe.close()
+                raise OSError(f"Control socket '{self._path}' is already in use")
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        old_umask = os.umask(0o177)
+        try:
+            server.bind(str(self._path))
+        finally:
+            os.umask(old_umask)
+        server.listen()
+        server.settimeout(0.1)
+        self._server = server
+        self._thread = threading.Thread(target=self._serve, name="fargv-ctl", daemon=True)
+        self._thread.start()
+
+    def on_param_changed(self, namespace: FargvNamespace,
+                         name: str, value: Any) -> None:
+        self.on_params_changed(namespace, {name: value})
+
+    def on_params_changed(self, namespace: FargvNamespace,
+                          changes: Dict[str, Any]) -> None:
+        with self._lock:
+            for watcher in list(self._watchers):
+                try:
+                    watcher.events.put_nowait(dict(changes))
+                except queue.Full:       # the watcher fell behind: drop it
+                    self._watchers.remove(watcher)
+                    watcher.closed.set()
+
+    def close(self) -> None:
+        """Stop serving and remove the socket file."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        with self._lock:
+            for watcher in self._watchers:
+                watcher.closed.set()
+            self._watchers.clear()
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+            try:
+                self._path.unlink()
+            except OSError:
+                pass
+
+    # ── server side ──────────────────────────────────────────────────────────
+
+    def _serve(self) -> None:
+        while not self._stop.is_set():
+            try:
+                conn, _ = self._server.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            conn.settimeout(None)
+            threading.Thread(target=self._handle, args=(conn,),
+                             name="fargv-ctl-conn", daemon=True).start()
+
+    def _handle(self, conn: socket.socket) -> None:
+        with conn, conn.makefile("rb") as lines:
+            for line in lines:
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                    if request.get("op") == "watch":
+                        self._send(conn, {"ok": True})
+                        self._watch(conn)
+                        return
+                    response = self._dispatch(request)
+                except Exception as exc:
+                    response = {"ok": False, "error": str(exc)}
+                try:
+                    self._send(conn, response)
+                except OSError:
+                    return
+
+    @staticmethod
+    def _send(conn: socket.socket, message: Dict[str, Any]) -> None:
+        conn.sendall(json.dumps(message, default=str).encode() + b"\n")
+
+    def _dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        namespace = self._namespace
+        params = object.__getattribute__(namespace, "_params")
+        op = request.get("op")
+        if op == "list":
+            return {"ok": True, "values": namespace.as_dict()}
+        if op == "get":
+            name = request.get("name")
+            if name not in params:
+                return {"ok": False, "error": f"No parameter {name!r} in namespace"}
+            return {"ok": True, "value": getattr(namespace, name)}
+        if op == "set":
+            values = request.get("values")
+            if not isinstance(values, dict) or not values:
+                return {"ok": False, "error": "'set' needs a non-empty 'values' object"}
+            unknown = sorted(k for k in values if k not in params)
+            if unknown:
+                return {"ok": False, "error": f"Unknown parameter(s): {unknown}"}
+            with namespace.batch():
+                for name, value in values.items():
+                    setattr(namespace, name, value)
+            return {"ok": True, "values": {k: getattr(namespace, k) for k in values}}
+        return {"ok": False, "error": f"Unknown op {op!r}"}
+
+    def _watch(self, conn: socket.socket) -> None:
+        watcher = _Watcher(self._watch_queue_size)
+        with self._lock:
+            self._watchers.append(watcher)
+        try:
+            while not watcher.closed.is_set():
+                try:
+                    changes = watcher.events.get(timeout=0.1)
+                except queue.Empty:
+                    readable, _, _ = select.select([conn], [], [], 0)
+                    if readable and not conn.recv(1):
+                        return           # client hung up
+                    continue
+                self._send(conn, {"changes": changes})
         except OSError:
             pass
+        finally:
+            with self._lock:
+                if watcher in self._watchers:
+                    self._watchers.remove(watcher)
+
+
+class _Watcher:
+    """Event queue of one ``watch`` connection."""
+    __slots__ = ("events", "closed")
+
+    def __init__(self, maxsize: int) -> None:
+        self.events: "queue.Queue" = queue.Queue(maxsize=maxsize)
+        self.closed = threading.Event()
 
 
 class FargvTkBackend(FargvBackend):
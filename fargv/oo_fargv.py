@@ -9,7 +9,7 @@ from .parameters import (
     FargvInt, FargvFloat, FargvBool, FargvBoolHelp,
     FargvStr,
     FargvChoice, FargvVariadic, FargvPositional, FargvPostional,
-    FargvStream, FargvInputStream, FargvOutputStream,
+    FargvStream, FargvInputStream, FargvOutputStream, FargvBinaryInput,
     FargvPath, FargvExistingFile, FargvNonExistingFile, FargvFile,
     FargvTuple,
     FargvSubcommand,
@@ -21,7 +21,7 @@ __all__ = [
     "FargvInt", "FargvFloat", "FargvBool", "FargvBoolHelp",
     "FargvStr",
     "FargvChoice", "FargvVariadic", "FargvPositional", "FargvPostional",
-    "FargvStream", "FargvInputStream", "FargvOutputStream",
+    "FargvStream", "FargvInputStream", "FargvOutputStream", "FargvBinaryInput",
     "FargvPath", "FargvExistingFile", "FargvNonExistingFile", "FargvFile",
     "FargvTuple",
     "FargvSubcommand",
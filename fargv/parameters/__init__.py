@@ -20,6 +20,7 @@ Type hierarchy
 ├── :class:`FargvStream`       — text stream (file / stdin / stdout / stderr)
 │   ├── :class:`FargvInputStream`
 │   └── :class:`FargvOutputStream`
+├── :class:`FargvBinaryInput`  — binary reader or memory-mapped view (file / stdin)
 ├── :class:`FargvPath`         — :class:`pathlib.Path` with optional validation
 │   ├── :class:`FargvExistingFile`    — path that must already exist
 │   ├── :class:`FargvNonExistingFile` — path that must NOT already exist
@@ -32,7 +33,7 @@ from .scalars import FargvInt, FargvFloat, FargvBool, FargvBoolHelp
 from .auto_params import FargvHelp, FargvVerbosity, FargvBashAutocomplete, FargvConfig, FargvUserInterface
 from .string import FargvStr
 from .collection import FargvChoice, FargvVariadic, FargvPositional, FargvPostional
-from .stream import FargvStream, FargvInputStream, FargvOutputStream
+from .stream import FargvStream, FargvInputStream, FargvOutputStream, FargvBinaryInput
 from .path import FargvPath, FargvExistingFile, FargvNonExistingFile, FargvFile
 from .tuple_param import FargvTuple
 from .subcommand import FargvSubcommand
@@ -108,6 +108,10 @@ class FargvConfig(FargvStr):
     for ``--auto_configure``: the current parameter values are printed as JSON
     to stdout and the process exits.
 
+    The flag may be repeated (``--config=site.json --config=run.json``); the
+    files are layered in order by :func:`~fargv.config.load_config_layers`.
+    The parameter's own value is the last path given.
+
     Example — explicit user definition::
 
         from fargv import parse, FargvConfig
@@ -127,6 +131,7 @@ class FargvConfig(FargvStr):
         """
         super().__init__(path, name=name, description=description)
         self.is_auto       = True
+        self.is_repeatable = True
         self._param_parser = param_parser
         self._exclude = exclude or set()
 
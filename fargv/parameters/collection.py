@@ -1,5 +1,9 @@
 """Collection-type parameters: enumerated choices and variadic argument lists."""
-from typing import Optional, List
+import hashlib
+import heapq
+import os
+import sys
+from typing import Callable, Iterable, Iterator, Optional, List
 from .base import FargvParameter, FargvError
 
 
@@ -101,17 +105,80 @@ class FargvVariadic(FargvParameter):
         # prog --count=2 a.txt b.txt  →  {"files": ["a.txt", "b.txt"]}
 
     There can be at most one :class:`FargvVariadic` per parser.
+
+    Passing a :class:`~fargv.parameters.path.FargvPath` as *item_path* turns
+    the list into a list of :class:`pathlib.Path` objects, each validated
+    against that parameter's constraints (batched with all other path checks
+    of the parse)::
+
+        FargvVariadic(name="inputs", item_path=FargvExistingFile())
+        # prog a.txt b.txt  →  {"inputs": [Path("a.txt"), Path("b.txt")]}
+
+    With ``sources=True`` a token of the form ``@-`` (stdin) or ``@list.txt``
+    names a *source* whose items are streamed rather than passed on the
+    command line.  The value is then a lazy :class:`VariadicSource` instead
+    of a list, so arbitrarily many items pass through bounded memory::
+
+        FargvVariadic(name="files", sources=True)
+        # find . -print0 | prog --files=@-   →  VariadicSource(['@-'])
+        # for f in p.files: ...                 (items read on demand)
+
+    Items are newline-separated unless *separator* says otherwise; with the
+    default ``separator=None`` a NUL byte in the first block read selects
+    NUL separation (``find -print0`` / ``xargs -0`` style).
     """
 
     def __init__(self, default: Optional[List[str]] = None, name: Optional[str] = None,
-                 short_name: Optional[str] = None, description: Optional[str] = None) -> None:
+                 short_name: Optional[str] = None, description: Optional[str] = None,
+                 item_path=None, sources: bool = False,
+                 separator: Optional[str] = None) -> None:
         """
         :param default:     Starting list (default: empty list).
         :param name:        Positional name shown in help output.
         :param short_name:  Unused for variadic params; included for API consistency.
         :param description: Help text.
+        :param item_path:   Optional :class:`~fargv.parameters.path.FargvPath` whose
+                            constraints every item must satisfy.
+        :param sources:     Treat ``@-`` / ``@path`` tokens as streamed item sources.
+        :param separator:   Item separator inside sources (``"\\n"``, ``"\\0"``, …);
+                            ``None`` auto-detects NUL vs newline.
         """
         super().__init__(default if default is not None else [], name, short_name, description)
+        self.item_path = item_path
+        self.sources   = sources
+        self.separator = separator
+        if item_path is not None and item_path.name is None:
+            item_path.set_name(name)
+
+    def set_name(self, name: str):
+        """Set the long name, propagating it to *item_path* for error messages."""
+        super().set_name(name)
+        if self.item_path is not None and self.item_path.name is None:
+            self.item_path.set_name(name)
+
+    def _convert_one(self, item):
+        """Convert and validate a single streamed item through :attr:`item_path`."""
+        from pathlib import Path
+        path = Path(item)
+        self.item_path._check(path, Path.exists)
+        return path
+
+    def _convert_items(self, items: list):
+        """Convert and validate *items* through :attr:`item_path` when set.
+
+        Returns a :class:`VariadicSource` instead of a list when :attr:`sources`
+        is enabled and any item is an ``@`` source token.
+        """
+        if self.sources and any(isinstance(v, str) and v.startswith("@") and len(v) > 1 for v in items):
+            convert = self._convert_one if self.item_path is not None else None
+            return VariadicSource(items, separator=self.separator, convert=convert)
+        if self.item_path is None:
+            return items
+        from pathlib import Path
+        paths = [v if isinstance(v, Path) else Path(str(v)) for v in items]
+        for path in paths:
+            self.item_path._validate(path)
+        return paths
 
     @property
     def is_variadic(self) -> bool:
@@ -122,6 +189,18 @@ class FargvVariadic(FargvParameter):
     def _get_class_type(cls) -> type:
         return list
 
+    def apply_shard(self, shard: "VariadicShard") -> None:
+        """Narrow the current value to the items *shard* keeps.
+
+        A :class:`VariadicSource` stays lazy (the shard filters it while it
+        is iterated, before items are converted); a list is filtered now.
+        """
+        value = self._value
+        if isinstance(value, VariadicSource):
+            value.shard = shard
+        elif isinstance(value, list):
+            self._value = list(shard.select(value))
+
     def evaluate(self, val) -> list:
         """Set the value from a list, tuple, set, or scalar.
 
@@ -129,11 +208,11 @@ class FargvVariadic(FargvParameter):
         :return: The stored list.
         """
         if isinstance(val, list):
-            self._value = val
+            self._value = self._convert_items(val)
         elif isinstance(val, (tuple, set)):
-            self._value = list(val)
+            self._value = self._convert_items(list(val))
         else:
-            self._value = [str(val)]
+            self._value = self._convert_items([str(val)])
         return self._value
 
     def ingest_value_strings(self, *values: List[str]) -> List[str]:
@@ -142,9 +221,177 @@ class FargvVariadic(FargvParameter):
         :param values: Zero or more raw argv tokens.
         :return: Always ``[]`` — variadic parameters consume everything.
         """
-        self._value = list(values)
+        self._value = self._convert_items(list(values))
         return []
 
 
+class VariadicSource:
+    """Lazy item sequence behind a :class:`FargvVariadic` with ``sources=True``.
+
+    *tokens* mixes literal items with ``@`` source tokens: ``@-`` streams
+    stdin, ``@path`` streams a file.  Iterating yields the literal items and
+    the streamed items in order, reading sources in fixed-size blocks so that
+    memory stays bounded regardless of the number of items.
+
+    File sources are re-read on every iteration; stdin can only be iterated
+    once.  Call :meth:`materialise` when a real list is needed.
+
+    When :attr:`shard` is set only the items of that shard are yielded; the
+    others are skipped before conversion.
+    """
+
+    def __init__(self, tokens: List[str], separator: Optional[str] = None,
+                 convert: Optional[Callable] = None, block_size: int = 1 << 16) -> None:
+        """
+        :param tokens:     Literal items and ``@`` source tokens.
+        :param separator:  Item separator; ``None`` auto-detects NUL vs newline.
+        :param convert:    Optional per-item conversion (e.g. to :class:`pathlib.Path`).
+        :param block_size: Bytes read from a source per block.
+        """
+        self.tokens     = list(tokens)
+        self.separator  = separator
+        self.convert    = convert
+        self.block_size = block_size
+        self.shard: Optional[VariadicShard] = None
+        self._stdin_used = False
+
+    def _open(self, spec: str):
+        if spec == "-":
+            if self._stdin_used:
+                raise FargvError("Variadic source '@-' (stdin) can only be iterated once")
+            self._stdin_used = True
+            return getattr(sys.stdin, "buffer", sys.stdin), False
+        try:
+            return open(spec, "rb"), True
+        except OSError as exc:
+            raise FargvError(f"Cannot read variadic source '@{spec}': {exc}") from exc
+
+    def _stream(self, spec: str) -> Iterator[str]:
+        fh, owned = self._open(spec)
+        sep = None if self.separator is None else os.fsencode(self.separator)
+        pending = b""
+        try:
+            while True:
+                block = fh.read(self.block_size)
+                if not block:
+                    break
+                if isinstance(block, str):
+                    block = os.fsencode(block)
+                if sep is None:
+                    sep = b"\0" if b"\0" in block else b"\n"
+                pending += block
+                *items, pending = pending.split(sep)
+                for item in items:
+                    if sep == b"\n":
+                        item = item.rstrip(b"\r")
+                    if item:
+                        yield os.fsdecode(item)
+            if sep == b"\n":
+                pending = pending.rstrip(b"\r")
+            if pending:
+                yield os.fsdecode(pending)
+        finally:
+            if owned:
+                fh.close()
+
+    def _items(self) -> Iterator:
+        for token in self.tokens:
+            if isinstance(token, str) and token.startswith("@") and len(token) > 1:
+                yield from self._stream(token[1:])
+            else:
+                yield token
+
+    def __iter__(self) -> Iterator:
+        items = self._items() if self.shard is None else self.shard.select(self._items())
+        if self.convert is None:
+            yield from items
+        else:
+            for item in items:
+                yield self.convert(item)
+
+    def materialise(self) -> list:
+        """Read every item into a list."""
+        return list(self)
+
+    def __repr__(self) -> str:
+        return f"VariadicSource({self.tokens!r})"
+
+
+class VariadicShard:
+    """Deterministic ``index``-of-``count`` partition of a variadic's items.
+
+    Every process of a parallel launch walks the same item sequence and keeps
+    only its own share, so no process needs the full list in memory:
+
+    * ``"round_robin"`` (default) — item *k* goes to shard ``k % count``.
+    * ``"hash"`` — a stable hash of the item decides; an item keeps its shard
+      when others are added, removed or reordered.
+    * ``"size"`` — items are treated as file paths and handed, in order, to
+      the shard with the least bytes so far (ties to the lower index).  Every
+      process stats every item; only ``count`` running totals are kept.
+
+    Built from the ``--fargv_shard=i/N[:mode]`` command-line option by
+    :class:`~fargv.parser.ArgumentParser`, or directly.
+
+    :param index: This process's shard, ``0 <= index < count``.
+    :param count: Number of shards.
+    :param mode:  ``"round_robin"``, ``"hash"`` or ``"size"``.
+    """
+
+    MODES = ("round_robin", "hash", "size")
+
+    def __init__(self, index: int, count: int, mode: str = "round_robin") -> None:
+        if count < 1 or not 0 <= index < count:
+            raise FargvError(f"Invalid shard {index}/{count}: need 0 <= index < count")
+        if mode not in self.MODES:
+            raise FargvError(f"Unknown shard mode {mode!r}; choose from {list(self.MODES)}")
+        self.index = index
+        self.count = count
+        self.mode  = mode
+
+    @classmethod
+    def parse(cls, spec: str) -> "VariadicShard":
+        """Build a shard from ``"i/N"`` or ``"i/N:mode"``.
+
+        :raises FargvError: On a malformed *spec*.
+        """
+        text, _, mode = spec.partition(":")
+        try:
+            index, count = (int(part) for part in text.split("/"))
+        except ValueError:
+            raise FargvError(f"Bad shard {spec!r}: expected i/N or i/N:mode") from None
+        return cls(index, count, mode or "round_robin")
+
+    def select(self, items: Iterable) -> Iterator:
+        """Yield the members of *items* that belong to this shard, lazily."""
+        if self.mode == "round_robin":
+            for position, item in enumerate(items):
+                if position % self.count == self.index:
+                    yield item
+        elif self.mode == "hash":
+            for item in items:
+                if self.shard_of_hash(item) == self.index:
+                    yield item
+        else:
+            loads = [(0, shard) for shard in range(self.count)]
+            for item in items:
+                load, shard = heapq.heappop(loads)
+                try:
+                    size = os.stat(os.fspath(item)).st_size
+                except (OSError, TypeError):
+                    size = 0
+                heapq.heappush(loads, (load + max(size, 1), shard))
+                if shard == self.index:
+                    yield item
+
+    def shard_of_hash(self, item) -> int:
+        """Return the shard ``"hash"`` mode assigns *item* to."""
+        digest = hashlib.blake2b(os.fsencode(str(item)), digest_size=8).digest()
+        return int.from_bytes(digest, "big") % self.count
+
+    def __repr__(self) -> str:
+        return f"VariadicShard({self.index}, {self.count}, {self.mode!r})"
+
+
 FargvPositional = FargvVariadic  # backward-compatible alias (renamed from FargvPositional)
 FargvPostional = FargvVariadic   # backward-compatible alias (typo preserved)
@@ -1,9 +1,130 @@
-"""Path parameters returning :class:`pathlib.Path` objects with validation."""
+"""Path parameters returning :class:`pathlib.Path` objects with validation.
+
+Validation performed while :class:`~fargv.parser.ArgumentParser` parses argv
+is batched: every path check registered during the parse (including the
+items of a path-typed :class:`~fargv.parameters.collection.FargvVariadic`) is
+resolved at the end of the parse on a small pool of daemon threads, through
+a per-parse stat cache so that no path — typically a shared parent
+directory — is stat'ed twice.  An optional timeout, one deadline for the
+whole batch, turns hung network mounts into a
+:class:`~fargv.parameters.base.FargvError` instead of a blocked job.
+"""
+import os
+import queue
+import threading
+from concurrent.futures import Future, wait
 from pathlib import Path
-from typing import Optional, List
+from typing import Callable, Dict, List, Optional, Tuple
 from .base import FargvParameter, FargvError
 
 
+class _StatTask:
+    """One pending ``exists()`` probe shared by every check that needs it."""
+    __slots__ = ("path", "future")
+
+    def __init__(self, path: str) -> None:
+        self.path   = path
+        self.future: "Future[bool]" = Future()
+
+
+class PathValidationBatch:
+    """Collects path checks during one parse and resolves them in parallel.
+
+    Used as a context manager by :meth:`~fargv.parser.ArgumentParser.parse`.
+    While a batch is active on the current thread, :meth:`FargvPath._validate`
+    registers its checks here instead of touching the filesystem; the checks
+    run when the outermost ``with`` block exits (re-entering is a no-op).
+
+    :param timeout:     Seconds to wait for all of the batch's stats together
+                        before failing; ``None`` waits forever.
+    :param max_workers: Upper bound on the number of stat threads.
+    """
+
+    _local = threading.local()
+
+    def __init__(self, timeout: Optional[float] = None, max_workers: int = 8) -> None:
+        self.timeout     = timeout
+        self.max_workers = max_workers
+        self._tasks: Dict[str, _StatTask] = {}
+        self._checks: List[Tuple["FargvPath", Path]] = []
+        self._outer = False
+
+    @classmethod
+    def current(cls) -> Optional["PathValidationBatch"]:
+        """Return the batch active on this thread, or ``None``."""
+        return getattr(cls._local, "batch", None)
+
+    def __enter__(self) -> "PathValidationBatch":
+        if self.current() is None:
+            self._outer = True
+            type(self)._local.batch = self
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if not self._outer:
+            return
+        type(self)._local.batch = None
+        if exc_type is None:
+            self.run()
+
+    def add(self, param: "FargvPath", path: Path) -> None:
+        """Register *param*'s constraints against *path* for the deferred run."""
+        for target in param._stat_targets(path):
+            key = os.fspath(target)
+            if key not in self._tasks:
+                self._tasks[key] = _StatTask(key)
+        self._checks.append((param, path))
+
+    def _stat(self, path: Path) -> bool:
+        task = self._tasks[os.fspath(path)]
+        if not task.future.done():   # the batch deadline passed without an answer
+            raise FargvError(
+                f"Timed out after {self.timeout}s checking '{task.path}' "
+                f"(unresponsive filesystem?)"
+            )
+        error = task.future.exception()
+        if error is not None:
+            raise FargvError(f"Cannot stat '{task.path}': {error}")
+        return task.future.result()
+
+    def run(self) -> None:
+        """Stat every distinct path once, then evaluate the checks in registration order.
+
+        :raises FargvError: On the first violated constraint or timed-out stat.
+        """
+        pending = [t for t in self._tasks.values() if not t.future.done()]
+        if len(pending) == 1 and self.timeout is None:
+            _probe(pending[0])
+        elif pending:
+            work: "queue.Queue" = queue.Queue()
+            for task in pending:
+                work.put(task)
+            # Daemon threads rather than an executor: a stat stuck on a dead
+            # mount must not hold up interpreter exit.
+            for _ in range(min(self.max_workers, len(pending))):
+                threading.Thread(target=_worker, args=(work,), name="fargv-stat", daemon=True).start()
+            wait([t.future for t in pending], timeout=self.timeout)
+        checks, self._checks = self._checks, []
+        for param, path in checks:
+            param._check(path, self._stat)
+
+
+def _probe(task: _StatTask) -> None:
+    try:
+        task.future.set_result(os.path.exists(task.path))
+    except BaseException as exc:  # pragma: no cover - os.path.exists swallows OSError
+        task.future.set_exception(exc)
+
+
+def _worker(work: "queue.Queue") -> None:
+    while True:
+        try:
+            task = work.get_nowait()
+        except queue.Empty:
+            return
+        _probe(task)
+
+
 class FargvPath(FargvParameter):
     """File-system path parameter returning a :class:`pathlib.Path`.
 
@@ -52,17 +173,41 @@ class FargvPath(FargvParameter):
     def _get_class_type(cls) -> type:
         return Path
 
+    def _stat_targets(self, path: Path) -> List[Path]:
+        """Return the paths whose existence the enabled constraints depend on."""
+        targets = []
+        if self.must_exist or self.must_not_exist:
+            targets.append(path)
+        if self.parent_must_exist:
+            targets.append(path.parent)
+        return targets
+
     def _validate(self, path: Path) -> None:
         """Run the configured validation checks against *path*.
 
+        Inside an active :class:`PathValidationBatch` the checks are only
+        registered and run when the batch completes.
+
         :param path: Resolved :class:`pathlib.Path` to validate.
         :raises FargvError: When any enabled constraint is violated.
         """
-        if self.must_exist and not path.exists():
+        batch = PathValidationBatch.current()
+        if batch is not None:
+            if self._stat_targets(path):
+                batch.add(self, path)
+            return
+        self._check(path, Path.exists)
+
+    def _check(self, path: Path, exists: Callable[[Path], bool]) -> None:
+        """Evaluate the constraints against *path* using the *exists* probe.
+
+        :raises FargvError: When any enabled constraint is violated.
+        """
+        if self.must_exist and not exists(path):
             raise FargvError(f"Parameter '{self._name}': '{path}' does not exist.")
-        if self.must_not_exist and path.exists():
+        if self.must_not_exist and exists(path):
             raise FargvError(f"Parameter '{self._name}': '{path}' already exists.")
-        if self.parent_must_exist and not path.parent.exists():
+        if self.parent_must_exist and not exists(path.parent):
             raise FargvError(
                 f"Parameter '{self._name}': parent directory '{path.parent}' does not exist."
             )
@@ -1,13 +1,20 @@
-"""Stream parameters wrapping text I/O channels (files, stdin, stdout, stderr).
+"""Stream parameters wrapping I/O channels (files, stdin, stdout, stderr).
 
-:class:`FargvStream` is the base; :class:`FargvInputStream` and
+:class:`FargvStream` is the text-mode base; :class:`FargvInputStream` and
 :class:`FargvOutputStream` are the two concrete convenience subclasses.
+:class:`FargvBinaryInput` provides binary (optionally memory-mapped) input.
 """
+import mmap as _mmap
 import os
+import queue
+import shutil
 import sys
 import io
+import tempfile
+import threading
+import weakref
 from pathlib import Path
-from typing import Optional, List, Union, Literal
+from typing import Optional, List, Tuple, Union, Literal
 from .base import FargvParameter, FargvError
 
 
@@ -30,6 +37,24 @@ class FargvStream(FargvParameter):
     accidental overwriting).  Parent directories are created automatically
     when a path is given in write or append mode.
 
+    Write and append streams opened from a path accept three throughput /
+    safety options:
+
+    * ``buffering`` — buffer size forwarded to :func:`open` (``1`` selects
+      line buffering, ``-1`` the platform default).
+    * ``atomic`` — write to a temporary file in the target directory and
+      rename it onto the final path when the stream is closed cleanly
+      (``close()`` or a ``with`` block exiting without an exception).  A
+      crashed or killed job never leaves a truncated file at the final path.
+    * ``background`` — hand every ``write`` to a daemon thread through a
+      bounded queue of ``queue_size`` chunks, so the producer does not wait
+      on disk I/O.  ``flush()`` blocks until the queue is drained; errors
+      raised by the writer thread surface on the next ``write``/``flush``/``close``.
+
+    The ``stdout`` / ``stderr`` keywords are never wrapped.  The stream
+    outlives the parameter and its parser: it is closed (or, if atomic and
+    never closed, discarded) by its own garbage collection, not theirs.
+
     .. note::
        Prefer the concrete subclasses :class:`FargvInputStream` and
        :class:`FargvOutputStream` over this base class.
@@ -37,14 +62,23 @@ class FargvStream(FargvParameter):
 
     def __init__(self, default: Union[io.TextIOBase, Literal["stderr", "stdout", "stdin"]],
                  name: Optional[str] = None, short_name: Optional[str] = None,
-                 description: Optional[str] = None) -> None:
+                 description: Optional[str] = None, buffering: int = -1,
+                 atomic: bool = False, background: bool = False,
+                 queue_size: int = 1024) -> None:
         """
         :param default:     ``sys.stdin``, ``sys.stdout``, ``sys.stderr``, or an open
                             file handle.  The mode is derived from this value.
         :param name:        Long parameter name.
         :param short_name:  Single-character alias.
         :param description: Help text.
-        :raises FargvError: When *default* is not a recognised stream object.
+        :param buffering:   Buffer size passed to :func:`open` for file paths.
+        :param atomic:      Write through a temp file renamed on clean close
+                            (write / append mode only).
+        :param background:  Perform writes on a background thread (write /
+                            append mode only).
+        :param queue_size:  Maximum number of pending chunks for *background*.
+        :raises FargvError: When *default* is not a recognised stream object, or
+            the write-only options are requested for a read stream.
         """
         super().__init__(default, name, short_name, description)
         if default is sys.stderr:
@@ -61,6 +95,14 @@ class FargvStream(FargvParameter):
             self.original_path = getattr(default, "name", "N/A")
         else:
             raise FargvError(f"FargvStream default must be sys.stdin/stdout/stderr or an open file, got {type(default)}")
+        if buffering == 0:
+            raise FargvError(f"Parameter '{name}': text streams cannot be unbuffered (buffering=0)")
+        if (atomic or background) and self.mode not in ("w", "a"):
+            raise FargvError(f"Parameter '{name}': atomic/background require write or append mode")
+        self.buffering  = buffering
+        self.atomic     = atomic
+        self.background = background
+        self.queue_size = queue_size
 
     @classmethod
     def _get_class_type(cls) -> type:
@@ -128,17 +170,27 @@ class FargvStream(FargvParameter):
             if self.mode == "w":
                 assert not path.exists(), f"File '{v}' already exists, refusing to overwrite."
                 path.parent.mkdir(parents=True, exist_ok=True)
-                self._value = open(v, self.mode)
+                self._value = self._open_for_writing(path)
             elif self.mode == "r":
                 assert path.exists(), f"File '{v}' does not exist."
-                self._value = open(v, self.mode)
+                self._value = open(v, self.mode, buffering=self.buffering)
             elif self.mode == "a":
                 path.parent.mkdir(parents=True, exist_ok=True)
-                self._value = open(v, self.mode)
+                self._value = self._open_for_writing(path)
             else:
                 raise ValueError(f"Unsupported mode '{self.mode}' for '{self._name}'")
         return list(values[1:])
 
+    def _open_for_writing(self, path: Path) -> io.TextIOBase:
+        """Open *path* in write/append mode honouring the throughput options."""
+        if self.atomic:
+            fh = _AtomicTextFile(path, self.mode, self.buffering)
+        else:
+            fh = open(path, self.mode, buffering=self.buffering)
+        if self.background:
+            fh = _BackgroundWriter(fh, self.queue_size)
+        return fh
+
     @property
     def value_str(self) -> str:
         """Return a human-readable description of the current stream."""
@@ -150,10 +202,173 @@ class FargvStream(FargvParameter):
             return "sys.stderr"
         return f"open('{self.original_path}', '{self.mode}')"
 
-    def __del__(self):
-        """Close any open file handle on garbage collection (not stdin/stdout/stderr)."""
-        if isinstance(self._value, io.TextIOBase) and self._value not in (sys.stdout, sys.stderr, sys.stdin):
-            self._value.close()
+
+
+def _read_umask() -> int:
+    """Return the process umask, without changing it where ``/proc`` reports it."""
+    try:
+        with open("/proc/self/status") as fh:
+            for line in fh:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError, IndexError):
+        pass
+    umask = os.umask(0o022)   # only at import time, before any worker threads
+    os.umask(umask)
+    return umask
+
+
+_UMASK = _read_umask()
+
+
+class _AtomicTextFile(io.TextIOWrapper):
+    """Text file written to a sibling temp file and renamed onto *path* by :meth:`close`.
+
+    Exiting a ``with`` block with an exception, or garbage collection without
+    an explicit :meth:`close`, calls :meth:`discard` instead.  Append mode
+    starts from a copy of the existing file.
+    """
+
+    def __init__(self, path: Path, mode: str, buffering: int = -1) -> None:
+        path = Path(path)
+        fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+        os.close(fd)
+        if mode == "a" and path.exists():
+            shutil.copyfile(path, tmp)
+            shutil.copymode(path, tmp)
+        else:
+            os.chmod(tmp, 0o666 & ~_UMASK)
+        raw = open(tmp, "ab" if mode == "a" else "wb", buffering=buffering if buffering > 1 else -1)
+        super().__init__(raw, line_buffering=buffering == 1)
+        self.final_path = path
+        self.temp_path  = Path(tmp)
+
+    def close(self) -> None:
+        """Flush, close, and atomically rename the temp file onto the final path."""
+        if self.closed:
+            return
+        super().close()
+        os.replace(self.temp_path, self.final_path)
+
+    def discard(self) -> None:
+        """Close and delete the temp file, leaving the final path untouched."""
+        if not self.closed:
+            io.TextIOWrapper.close(self)
+        try:
+            self.temp_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+    def __del__(self) -> None:
+        if not self.closed:
+            self.discard()
+
+
+_FLUSH = object()   # queue marker: flush the wrapped stream
+
+
+def _drain(q: "queue.Queue", inner: io.TextIOBase, errors: List[BaseException]) -> None:
+    """Writer thread body; holds no reference to the :class:`_BackgroundWriter`."""
+    while True:
+        item = q.get()
+        try:
+            if item is None:
+                return
+            if item is _FLUSH:
+                inner.flush()
+            else:
+                inner.write(item)
+        except BaseException as exc:   # surfaced to the producer by _check()
+            errors.append(exc)
+        finally:
+            q.task_done()
+
+
+class _BackgroundWriter(io.TextIOBase):
+    """Text stream that forwards writes to *inner* on a daemon thread via a bounded queue.
+
+    Like :class:`_AtomicTextFile`, exiting a ``with`` block with an exception,
+    or garbage collection without an explicit :meth:`close`, calls
+    :meth:`discard` instead.
+    """
+
+    def __init__(self, inner: io.TextIOBase, queue_size: int = 1024) -> None:
+        super().__init__()
+        self._inner   = inner
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._errors: List[BaseException] = []
+        self._stopped = False
+        self._thread  = threading.Thread(target=_drain, args=(self._queue, inner, self._errors),
+                                         name="fargv-writer", daemon=True)
+        self._thread.start()
+
+    def _check(self) -> None:
+        if self._errors:
+            err = self._errors[0]
+            self._errors.clear()
+            raise err
+
+    @property
+    def name(self):
+        return getattr(self._inner, "name", None)
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        if self.closed or self._stopped:
+            raise ValueError("I/O operation on closed file.")
+        self._check()
+        self._queue.put(s)
+        return len(s)
+
+    def flush(self) -> None:
+        """Block until every queued chunk has been written and the inner stream flushed."""
+        if self.closed or self._stopped:
+            return
+        self._queue.put(_FLUSH)
+        self._queue.join()
+        self._check()
+
+    def _stop(self) -> None:
+        if self._stopped:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._stopped = True
+
+    def close(self) -> None:
+        """Drain the queue, stop the thread, and close the inner stream."""
+        if self.closed:
+            return
+        self._stop()
+        super().close()
+        self._inner.close()
+        self._check()
+
+    def discard(self) -> None:
+        """Drain the queue, stop the thread, and discard (or close) the inner stream."""
+        if self.closed:
+            return
+        self._stop()
+        super().close()
+        getattr(self._inner, "discard", self._inner.close)()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+    def __del__(self) -> None:
+        if not getattr(self, "_stopped", True) and not self.closed:
+            self.discard()
 
 
 class FargvInputStream(FargvStream):
@@ -189,16 +404,166 @@ class FargvOutputStream(FargvStream):
         # (no flag)          →  sys.stdout
 
     The keywords ``stdout`` and ``stderr`` are also accepted.
+
+    For heavy output, see the ``buffering``, ``atomic`` and ``background``
+    options described on :class:`FargvStream`::
+
+        FargvOutputStream(name="out", atomic=True, buffering=1 << 20)
+        # --out=results.txt  →  writes .results.txt.XXXX.tmp, renamed on close()
     """
 
-    def __init__(self, default=None, name=None, short_name=None, description=None):
+    def __init__(self, default=None, name=None, short_name=None, description=None,
+                 buffering: int = -1, atomic: bool = False, background: bool = False,
+                 queue_size: int = 1024):
         """
         :param default:     ``sys.stdout`` when ``None`` (the default).
         :param name:        Long parameter name.
         :param short_name:  Single-character alias.
         :param description: Help text.
+        :param buffering:   Buffer size passed to :func:`open` for file paths.
+        :param atomic:      Publish the file by rename on clean close.
+        :param background:  Write on a background thread with a bounded queue.
+        :param queue_size:  Maximum number of pending chunks for *background*.
         """
         super().__init__(
             sys.stdout if default is None else default,
             name, short_name, description,
+            buffering=buffering, atomic=atomic, background=background,
+            queue_size=queue_size,
         )
+
+
+class FargvBinaryInput(FargvParameter):
+    """Binary input parameter; defaults to ``sys.stdin.buffer``.
+
+    The value is a buffered binary reader (:class:`io.BufferedReader`), so
+    callers can ``read``/``readinto`` into preallocated buffers without
+    text decoding.  With ``mmap=True`` a file path is memory-mapped
+    read-only instead and the value is a :class:`memoryview` over the
+    mapping, which allows zero-copy slicing::
+
+        FargvBinaryInput(name="weights", mmap=True)
+        # --weights=model.bin  →  memoryview(mmap(open("model.bin", "rb")))
+        # --weights=stdin      →  sys.stdin.buffer  (pipes cannot be mapped)
+
+    The keyword ``stdin`` always yields the buffered binary stdin reader,
+    regardless of *mmap*.
+
+    The value outlives the parameter and its parser: a reader closes when it
+    is garbage collected, and a mapping is unmapped once the last view of it
+    is.  Only re-assigning the parameter releases the previous value.
+    """
+
+    def __init__(self, default=None, mmap: bool = False, buffering: int = -1,
+                 name: Optional[str] = None, short_name: Optional[str] = None,
+                 description: Optional[str] = None) -> None:
+        """
+        :param default:     ``sys.stdin.buffer`` when ``None`` (the default), or an
+                            open binary reader.
+        :param mmap:        Memory-map file paths and expose a :class:`memoryview`.
+        :param buffering:   Buffer size passed to :func:`open` for non-mapped files
+                            (``-1`` uses the platform default).
+        :param name:        Long parameter name.
+        :param short_name:  Single-character alias.
+        :param description: Help text.
+        """
+        if default is None:
+            default = _stdin_buffer()
+        super().__init__(default, name, short_name, description)
+        self.use_mmap = mmap
+        self.buffering = buffering
+        self.original_path = "stdin" if default is _stdin_buffer() else getattr(default, "name", "N/A")
+        self._mmap = None
+
+    @classmethod
+    def _get_class_type(cls) -> type:
+        """Return :class:`io.BufferedIOBase` as the target type."""
+        return io.BufferedIOBase
+
+    def validate_value_strings(self, *values: List[str]) -> bool:
+        """Return ``True`` when every value is ``stdin`` or a readable file."""
+        return all(v == "stdin" or os.access(v, os.R_OK) and os.path.isfile(v) for v in values)
+
+    def _release(self) -> None:
+        """Close the currently held file or mapping (never stdin) before it is replaced."""
+        value, self._value = self._value, None
+        if isinstance(value, memoryview):
+            value.release()
+        elif isinstance(value, io.IOBase) and value is not _stdin_buffer():
+            value.close()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def _open(self, path: str):
+        """Open *path* as a buffered reader or a memory-mapped view."""
+        if not Path(path).is_file():
+            raise FargvError(f"Parameter '{self._name}': file '{path}' does not exist.")
+        if not self.use_mmap:
+            return open(path, "rb", buffering=self.buffering)
+        with open(path, "rb") as fh:
+            st = os.fstat(fh.fileno())
+            if st.st_size == 0:
+                return memoryview(b"")   # empty files cannot be mapped
+            self._mmap = _mmap.mmap(fh.fileno(), 0, access=_mmap.ACCESS_READ)
+        _MAPPED_FILES[self._mmap] = (os.path.abspath(path), st.st_dev, st.st_ino)
+        return memoryview(self._mmap)
+
+    def ingest_value_strings(self, *values: List[str]) -> List[str]:
+        """Open the first token as binary input.
+
+        :param values: One or more raw argv tokens.
+        :return: Unconsumed tokens.
+        :raises FargvError: When no token is supplied or the file does not exist.
+        """
+        if len(values) < 1:
+            raise FargvError(f"Parameter '{self._name}' requires one value")
+        v = values[0]
+        self._release()
+        if v == "stdin":
+            self._value = _stdin_buffer()
+        else:
+            self._value = self._open(v)
+        self.original_path = v
+        self.on_value_set(self._value)
+        return list(values[1:])
+
+    def evaluate(self, val):
+        """Store an open binary reader or :class:`memoryview` directly; open anything else as a path.
+
+        :param val: Binary reader, memoryview, or path-like.
+        :return: The stored value.
+        """
+        if isinstance(val, (io.BufferedIOBase, io.RawIOBase, memoryview)):
+            self._value = val
+            self.on_value_set(val)
+            return val
+        self.ingest_value_strings(str(val))
+        return self._value
+
+    @property
+    def value_str(self) -> str:
+        """Return a human-readable description of the current input."""
+        if self._value is _stdin_buffer():
+            return "sys.stdin.buffer"
+        if isinstance(self._value, memoryview):
+            return f"mmap('{self.original_path}')"
+        return f"open('{self.original_path}', 'rb')"
+
+
+
+_MAPPED_FILES: "weakref.WeakKeyDictionary[_mmap.mmap, Tuple[str, int, int]]" = weakref.WeakKeyDictionary()
+
+
+def mapped_file(view: memoryview) -> Optional[Tuple[str, int, int]]:
+    """Return ``(path, st_dev, st_ino)`` of the file behind a whole-file view
+    made by :class:`FargvBinaryInput`, or ``None`` for any other buffer."""
+    mapping = view.obj
+    if not isinstance(mapping, _mmap.mmap) or view.nbytes != len(mapping):
+        return None
+    return _MAPPED_FILES.get(mapping)
+
+
+def _stdin_buffer():
+    """Return the binary buffer behind ``sys.stdin`` (or ``sys.stdin`` if it has none)."""
+    return getattr(sys.stdin, "buffer", sys.stdin)
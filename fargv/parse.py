@@ -17,6 +17,7 @@ By default :func:`parse` returns a :class:`types.SimpleNamespace`.  Pass
 ``return_type="dict"`` or ``return_type="namedtuple"`` to change this.
 """
 import inspect
+import os
 import sys
 import textwrap
 import types
@@ -31,7 +32,10 @@ from .parameters import (
 from .parser import ArgumentParser
 from .type_detection import definition_to_parser
 from .ansi import gray, bold_white, is_colored
-from .config import default_config_path, load_config, apply_config, apply_env_vars, dump_config, scan_config_path, supported_dump_formats
+from .config import (
+    INCLUDE_KEYS, FlatLookup, pop_sweep_keys, default_config_path, load_config_layers, apply_config,
+    apply_env_vars, apply_overrides, dump_config, scan_config_paths, supported_dump_formats,
+)
 
 
 _DC = TypeVar("_DC")   # used in @overload signatures for dataclass definitions
@@ -290,6 +294,7 @@ def parse(
     fn_def_tolerate_wildcards: bool = False,
     override_order: List[Literal["default", "config", "envvar", "ui"]] = ["default", "config", "envvar", "ui"],
     employ_docstring_in_help: bool = True,
+    response_files: bool = False,
 ) -> Tuple[Any, str]:
     """Parse CLI arguments using the fargv interface.
 
@@ -333,6 +338,13 @@ def parse(
         help string under a ``__doc__:`` heading.  Printed in gray when
         colours are active.
 
+    response_files:
+        Expand bare ``@file`` argv tokens into the tokens listed in *file*
+        (one per line, nesting allowed).  Expansion happens before the config
+        scan, so a ``--config`` flag inside a response file is honoured.
+        ``@path`` values following the flag of a ``sources=True`` variadic
+        are left to it as sources.
+
     subcommand_return_type:
         "flat" (default) — subcommand params merged into top-level namespace,
         subcommand key holds the selected name.
@@ -406,22 +418,36 @@ def parse(
         return _wrap(result_raw, return_type), help_str
 
     argv = sys.argv if given_parameters is None else list(given_parameters)
+    if response_files or parser.response_files:
+        argv = parser.expand_response_files(argv)
 
     # 6. Apply intermediate override sources in the requested order
     user_params = {k: v for k, v in parser._name2parameters.items()
                    if k not in _AUTO_PARAMS}
+    lookup = None   # FlatLookup over user_params, built on first use and shared
+    # Values resolved by a parent process replace the config and env layers.
+    from .handoff import RESOLVED_ENV, accept as _accept_resolved
+    resolved = _accept_resolved(user_params) if os.environ.get(RESOLVED_ENV) else None
     for _source in override_order[1:-1]:   # skip 'default' and 'ui'
+        if resolved is not None and _source in ("config", "envvar"):
+            if resolved:
+                lookup = lookup or FlatLookup(user_params)
+                apply_overrides(user_params, resolved, source=RESOLVED_ENV, separator=".", lookup=lookup)
+                resolved = {}
+            # An explicit --config (or its short alias) on this command line is still loaded on top.
+            _cfg_short = getattr(parser._name2parameters.get("config"), "short_name", None)
+            if _source == "envvar" or not scan_config_paths(argv[1:], long_prefix,
+                                                            short_name=_cfg_short):
+                continue
         if _source == "config" and "config" in parser._name2parameters:
-            raw_config_path = scan_config_path(argv[1:] if argv else [], long_prefix)
-            if raw_config_path is None:
-                # Also scan for the short-name form (e.g. -C //ini)
-                _cfg_param = parser._name2parameters.get("config")
-                _short = getattr(_cfg_param, "short_name", None) if _cfg_param else None
-                if _short:
-                    raw_config_path = scan_config_path(argv[1:] if argv else [], "-", key=_short)
-            if raw_config_path is None:
-                raw_config_path = parser._name2parameters.get("config", None)
-                raw_config_path = raw_config_path._value if raw_config_path else None
+            # Long and short forms (e.g. --config a.json -c //ini) in command-line order
+            _cfg_param = parser._name2parameters.get("config")
+            _short = getattr(_cfg_param, "short_name", None) if _cfg_param else None
+            config_paths = scan_config_paths(argv[1:] if argv else [], long_prefix, short_name=_short)
+            if not config_paths:
+                config_paths = [_cfg_param._value if _cfg_param else None]
+            raw_config_path = next((c for c in config_paths if c and str(c).startswith("//")),
+                                   config_paths[0])
             if raw_config_path and str(raw_config_path).startswith("//"):
                 # //json, //ini, //toml, //yaml → dump defaults to stdout and exit
                 _fmt = str(raw_config_path)[2:].lower() or "json"
@@ -434,7 +460,8 @@ def parse(
                     )
                     sys.exit(1)
                 _progname_arg = argv[0] if argv else getattr(parser, 'name', 'fargv')
-                print(dump_config(parser, fmt=_fmt, exclude=_AUTO_PARAMS, progname=_progname_arg))
+                lookup = lookup or FlatLookup(user_params)
+                print(dump_config(parser, fmt=_fmt, exclude=_AUTO_PARAMS, progname=_progname_arg, lookup=lookup))
                 _fmt_ext = {"json": ".json", "ini": ".ini", "toml": ".toml", "yaml": ".yaml"}.get(_fmt, f".{_fmt}")
                 _default_path = default_config_path(_progname_arg).with_suffix(_fmt_ext)
                 print(
@@ -442,19 +469,26 @@ def parse(
                     file=sys.stderr,
                 )
                 sys.exit(0)
+            config_label = ", ".join(str(c) for c in config_paths)
             try:
-                cfg = load_config(raw_config_path)
-                apply_config(user_params, cfg, raw_config_path)
+                lookup = lookup or FlatLookup(user_params)
+                # A parameter literally named "include" keeps its key.
+                include_keys = tuple(k for k in INCLUDE_KEYS if k not in lookup.dotted)
+                cfg = load_config_layers(config_paths, include_keys=include_keys)
+                pop_sweep_keys(cfg)   # sweep directives are read by fargv.sweep
+                apply_config(user_params, cfg, config_label, lookup=lookup)
             except (ValueError, ImportError) as _cfg_err:
-                print(f"fargv: ignoring config '{raw_config_path}': {_cfg_err}", file=sys.stderr)
+                print(f"fargv: ignoring config '{config_label}': {_cfg_err}", file=sys.stderr)
         elif _source == "envvar":
             _progname = argv[0] if argv else getattr(parser, 'name', 'fargv')
-            apply_env_vars(user_params, _progname)
+            lookup = lookup or FlatLookup(user_params)
+            apply_env_vars(user_params, _progname, lookup=lookup)
 
     # 7. CLI parse (always); then optionally launch GUI if --user_interface requests it.
     # Parsing first means any CLI-supplied values pre-populate the GUI form.
     raw = parser.parse(argv, first_is_name=True,
-                       tolerate_unassigned_arguments=tolerate_unassigned_arguments)
+                       tolerate_unassigned_arguments=tolerate_unassigned_arguments,
+                       expand_response_files=False)
     parser._finalize_string_params()
 
     effective_ui = raw.get("user_interface", resolved_ui)
@@ -527,6 +561,15 @@ def parse_and_launch(
     fn_def_tolerate_wildcards: bool = False,
     override_order: List[Literal["default", "config", "envvar", "ui"]] = ["default", "config", "envvar", "ui"],
     employ_docstring_in_help: bool = True,
+    response_files: bool = False,
+    jobs: Optional[int] = None,
+    executor: Literal["process", "thread"] = "process",
+    ordered: bool = True,
+    results: Optional[str] = None,
+    cpu_affinity: Optional[Union[str, List[List[int]]]] = None,
+    memo: Optional[Union[bool, str]] = None,
+    memo_max_bytes: int = 1 << 30,
+    memo_paths: Literal["path", "content"] = "path",
 ) -> Any:
     """Parse CLI arguments inferred from *fn*'s signature, then call *fn*.
 
@@ -534,12 +577,36 @@ def parse_and_launch(
     ``return_type`` is always ``"dict"`` internally so auto-params are
     filtered before the call.
 
-    :param fn: Callable whose signature defines the parameters.
-    :return:   The return value of *fn*.
+    With *jobs* (or ``--fargv_jobs=N`` on the command line) the arguments are
+    read as a :func:`fargv.sweep` and *fn* runs once per configuration; see
+    :func:`fargv.launch.run_sweep`.  ``--fargv_results=path`` sets *results*.
+    Without *jobs*, an explicit ``--fargv_task_index=N`` reads the arguments
+    as a sweep, selects configuration *N*, and calls *fn* once with it;
+    ``SLURM_ARRAY_TASK_ID`` alone does not, so ordinary values such as
+    ``[abc]`` keep their meaning inside array jobs.
+
+    With *memo* (or ``--fargv_memo=DIR``, or the ``FARGV_MEMO`` env var) the
+    return value is cached on disk and an identical later call returns it
+    without running *fn*; see :mod:`fargv.memo`.
+
+    :param fn:           Callable whose signature defines the parameters.
+    :param jobs:         Run a sweep with this many concurrent tasks (``0``:
+                         one per CPU, ``1``: serially in this process).
+    :param executor:     ``"process"`` or ``"thread"`` pool for the sweep.
+    :param ordered:      Return sweep results in configuration order rather
+                         than completion order.
+    :param results:      JSONL file receiving one line per sweep task.
+    :param cpu_affinity: ``"pin"`` or a list of CPU sets for sweep workers.
+    :param memo:         Memo cache directory, ``True`` for the default
+                         directory, ``False`` to disable even if
+                         ``FARGV_MEMO`` is set.
+    :param memo_max_bytes: Size bound of the memo directory (LRU eviction).
+    :param memo_paths:   ``"path"`` hashes path arguments by name,
+                         ``"content"`` also by file content.
+    :return: The return value of *fn*; in sweep mode a list of
+             :class:`fargv.launch.TaskResult`.
     """
-    params, _ = parse(
-        fn,
-        given_parameters=given_parameters,
+    parse_kwargs: Dict[str, Any] = dict(
         argv_parse_mode=argv_parse_mode,
         allow_implied_variadics=allow_implied_variadics,
         tolerate_unassigned_arguments=tolerate_unassigned_arguments,
@@ -555,9 +622,52 @@ def parse_and_launch(
         fn_def_tolerate_wildcards=fn_def_tolerate_wildcards,
         override_order=override_order,
         employ_docstring_in_help=employ_docstring_in_help,
-        return_type="dict",
+        response_files=response_files,
     )
-    return fn(**_filter_to_fn_params(fn, params))
+    long_prefix = "-" if argv_parse_mode == "legacy" else "--"
+    if not isinstance(given_parameters, dict):
+        from .launch import LAUNCH_FLAGS
+        argv = sys.argv if given_parameters is None else list(given_parameters)
+        if any(t.startswith(long_prefix + f) for t in argv[1:] for f in LAUNCH_FLAGS):
+            from .sweep import _pop_control_flags
+            given_parameters, control = _pop_control_flags(argv, long_prefix, LAUNCH_FLAGS, ())
+            if "fargv_jobs" in control:
+                jobs = _as_jobs(control["fargv_jobs"][-1])
+            if "fargv_results" in control:
+                results = control["fargv_results"][-1]
+            if "fargv_memo" in control:
+                memo = control["fargv_memo"][-1]
+    if memo is None:
+        from .memo import MEMO_ENV
+        memo = os.environ.get(MEMO_ENV) or None
+    if jobs is None and not isinstance(given_parameters, dict):
+        from .sweep import sweep
+        argv = sys.argv if given_parameters is None else list(given_parameters)
+        if any(t.startswith(f"{long_prefix}fargv_task_") for t in argv[1:]):
+            selected = sweep(fn, argv, **parse_kwargs)
+            if selected.indices is not None:   # one job-array task: run its configuration here
+                given_parameters = selected.argv_for(next(selected.assignments()))
+    if jobs is not None:
+        from .launch import run_sweep
+        from .sweep import sweep
+        task_kwargs = {"memo": memo, "memo_max_bytes": memo_max_bytes, "memo_paths": memo_paths}
+        return run_sweep(fn, sweep(fn, given_parameters, **parse_kwargs), jobs=jobs,
+                         executor=executor, ordered=ordered, results=results,
+                         cpu_affinity=cpu_affinity, task_kwargs=task_kwargs if memo else None)
+    params, _ = parse(fn, given_parameters=given_parameters, return_type="dict", **parse_kwargs)
+    kwargs = _filter_to_fn_params(fn, params)
+    if memo:
+        from .memo import MemoCache
+        cache = MemoCache(None if memo is True else memo, max_bytes=memo_max_bytes, paths=memo_paths)
+        return cache.call(fn, kwargs)
+    return fn(**kwargs)
+
+
+def _as_jobs(text: str) -> int:
+    try:
+        return int(text)
+    except ValueError:
+        raise FargvError(f"--fargv_jobs expects an integer, got {text!r}") from None
 
 
 def parse_here(
@@ -577,6 +687,7 @@ def parse_here(
     fn_def_tolerate_wildcards: bool = False,
     override_order: List[Literal["default", "config", "envvar", "ui"]] = ["default", "config", "envvar", "ui"],
     employ_docstring_in_help: bool = True,
+    response_files: bool = False,
     return_type: Literal["SimpleNamespace", "dict", "namedtuple", "namespace"] = "SimpleNamespace",
 ) -> Tuple[Any, str]:
     """Parse CLI arguments inferred from the *calling* function's signature.
@@ -627,5 +738,6 @@ def parse_here(
         fn_def_tolerate_wildcards=fn_def_tolerate_wildcards,
         override_order=override_order,
         employ_docstring_in_help=employ_docstring_in_help,
+        response_files=response_files,
         return_type=return_type,
     )
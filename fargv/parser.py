@@ -4,13 +4,67 @@ This module is consumed by :func:`~fargv.parse.parse` (the high-level API)
 but can also be used directly for full control over parser construction.
 """
 import os
+import shlex
 import sys
-from typing import Dict, Optional, List, Union, Any, Set
+from typing import Callable, Dict, Iterable, Iterator, Optional, List, Union, Any, Set, Tuple
 from .parameters import FargvError, FargvParameter, FargvVariadic, FargvBoolHelp
+from .parameters.collection import VariadicShard
+from .parameters.path import PathValidationBatch
 from .global_guessing import guess_program_name
 from .ansi import bold_white, gray, is_colored
 
 
+def _response_file_lines(fh, fmt: str) -> Iterator[str]:
+    """Yield the tokens of an open response file, one line at a time."""
+    for line in fh:
+        line = line.rstrip("\r\n")
+        if fmt == "shell":
+            yield from shlex.split(line, comments=True)
+        elif line.strip() and not line.lstrip().startswith("#"):
+            yield line
+
+
+def iter_response_file_tokens(tokens: Iterable[str], fmt: str = "lines",
+                              keep: Optional[Callable[[str], bool]] = None,
+                              _stack: Tuple[str, ...] = ()) -> Iterator[str]:
+    """Yield *tokens* with ``@file`` response files expanded in place.
+
+    Response files are read lazily, line by line, and may themselves contain
+    ``@file`` tokens (paths are relative to the working directory).  ``@@x``
+    yields the literal token ``@x``; ``@-`` is passed through untouched so it
+    remains available to :class:`~fargv.parameters.collection.FargvVariadic`
+    sources.
+
+    :param tokens: argv tokens (program name already stripped).
+    :param fmt:    ``"lines"`` — every non-blank line is one token, ``#`` lines
+                   are comments; ``"shell"`` — each line is split with
+                   :func:`shlex.split` (quotes do not span lines).
+    :param keep:   Called with every token of the expanded stream, in order;
+                   a token for which it returns ``True`` is passed through
+                   as is.
+    :raises FargvError: On unreadable files or an inclusion cycle.
+    """
+    for tok in tokens:
+        if keep is not None and keep(tok):
+            yield tok
+        elif tok.startswith("@@"):
+            yield tok[1:]
+        elif tok.startswith("@") and tok != "@-" and len(tok) > 1:
+            path = os.path.realpath(tok[1:])
+            if path in _stack:
+                chain = " -> ".join(_stack + (path,))
+                raise FargvError(f"Response file cycle: {chain}")
+            try:
+                fh = open(path)
+            except OSError as exc:
+                raise FargvError(f"Cannot read response file {tok!r}: {exc}") from exc
+            with fh:
+                yield from iter_response_file_tokens(_response_file_lines(fh, fmt), fmt, keep,
+                                                     _stack + (path,))
+        else:
+            yield tok
+
+
 class ArgumentParser:
     """Low-level Unix-style argument parser for fargv.
 
@@ -56,6 +110,22 @@ class ArgumentParser:
         Prefix for long flags (default ``"--"``).
     short_prefix:
         Prefix for short flags (default ``"-"``).
+    path_check_timeout:
+        Seconds allowed for all the filesystem checks made while validating
+        :class:`~fargv.parameters.path.FargvPath` values, as one deadline for
+        the parse; ``None`` (default) waits indefinitely.
+    path_check_workers:
+        Maximum number of threads used to run path checks in parallel.
+    response_files:
+        When ``True``, bare ``@file`` tokens are replaced by the tokens read
+        from *file* (see :func:`iter_response_file_tokens`), except where a
+        ``sources=True`` variadic takes them (see :meth:`expand_response_files`).
+    response_file_format:
+        ``"lines"`` (one token per line) or ``"shell"`` (shell-quoted lines).
+    shard:
+        Keep only one shard of the variadic parameter's items — a
+        :class:`~fargv.parameters.collection.VariadicShard` or its ``"i/N[:mode]"``
+        spec.  The ``--fargv_shard=i/N[:mode]`` option overrides it.
     """
 
     def __init__(self, progname: Optional[str] = None,
@@ -64,12 +134,22 @@ class ArgumentParser:
                  auto_help: bool = True,
                  auto_bash_autocomplete: bool = True,
                  long_prefix: str = "--",
-                 short_prefix: str = "-"):
+                 short_prefix: str = "-",
+                 path_check_timeout: Optional[float] = None,
+                 path_check_workers: int = 8,
+                 response_files: bool = False,
+                 response_file_format: str = "lines",
+                 shard: Optional[Union[str, VariadicShard]] = None):
         self._name2parameters: Dict[str, FargvParameter] = {}
         self._shortname2parameters: Dict[str, FargvParameter] = {}
         self.allow_default_variadic = allow_default_variadic
         self.long_prefix  = long_prefix
         self.short_prefix = short_prefix
+        self.path_check_timeout = path_check_timeout
+        self.path_check_workers = path_check_workers
+        self.response_files = response_files
+        self.response_file_format = response_file_format
+        self.shard = VariadicShard.parse(shard) if isinstance(shard, str) else shard
         self.name = progname if progname is not None else guess_program_name(level=1)
         self.program_doc: str = ""
         for param in (
@@ -169,8 +249,68 @@ class ArgumentParser:
 
     # ─────────────────────────────── core parse ─────────────────────────────
 
+    def expand_response_files(self, argv: List[str], first_is_name: bool = True) -> List[str]:
+        """Return *argv* with ``@file`` response files expanded.
+
+        The program name (when *first_is_name*) is never expanded.  The files
+        are streamed straight into the single output list.
+
+        A bare ``@path`` token among the values following the flag of a
+        :class:`~fargv.parameters.collection.FargvVariadic` with
+        ``sources=True`` (``--files @list.txt``) is left for that parameter
+        as a source.  Every other ``@path`` token, positional ones included,
+        is a response file.
+
+        :raises FargvError: On unreadable files or an inclusion cycle.
+        """
+        tokens = iter(argv)
+        head = [next(tokens)] if first_is_name and argv else []
+        head.extend(iter_response_file_tokens(tokens, self.response_file_format,
+                                              self._source_token_filter()))
+        return head
+
+    def _source_token_filter(self) -> Optional[Callable[[str], bool]]:
+        """Return a ``keep`` callback claiming ``@path`` tokens for ``sources`` variadics.
+
+        The callback follows the flags of the expanded stream the way
+        :meth:`_parse_flat` assigns values: a variadic's flag takes every
+        token up to the next flag, a valued flag takes one.  ``None`` when
+        no parameter declares ``sources``.
+        """
+        params = self._name2parameters
+        if not any(getattr(param, "sources", False) for param in params.values()):
+            return None
+        lp, sp  = self.long_prefix, self.short_prefix
+        owner   = None    # variadic whose flag the current tokens follow
+        pending = False   # a valued flag still expects its value token
+
+        def takes_value(param) -> bool:
+            return not (param.is_bool or param.is_variadic
+                        or getattr(param, "is_count_switch", False))
+
+        def keep(tok: str) -> bool:
+            nonlocal owner, pending
+            if tok.startswith("@") and not tok.startswith("@@") and len(tok) > 1:
+                return not pending and getattr(owner, "sources", False)
+            if tok.startswith(lp):
+                name, eq, _ = tok[len(lp):].partition("=")
+                param = params.get(name)
+                owner = param if param is not None and param.is_variadic else None
+                pending = param is not None and not eq and takes_value(param)
+            elif tok.startswith(sp) and len(tok) > len(sp):
+                chars, eq, _ = tok[len(sp):].partition("=")
+                owner = None
+                pending = not eq and any(takes_value(self._shortname2parameters[c])
+                                         for c in chars if c in self._shortname2parameters)
+            else:
+                pending = False
+            return False
+
+        return keep
+
     def parse(self, argv: Optional[List[str]] = None, first_is_name: bool = True,
-              tolerate_unassigned_arguments: bool = False) -> Dict[str, Any]:
+              tolerate_unassigned_arguments: bool = False,
+              expand_response_files: Optional[bool] = None) -> Dict[str, Any]:
         """Parse *argv* and return a ``{name: value}`` result dict.
 
         :param argv:                        Token list to parse.  Defaults to
@@ -181,21 +321,69 @@ class ArgumentParser:
         :param tolerate_unassigned_arguments: When ``True``, leftover tokens that
                                             cannot be assigned to any parameter are
                                             silently discarded instead of raising.
+        :param expand_response_files:       Expand ``@file`` tokens; ``None`` uses
+                                            :attr:`response_files`.
         :return: ``{name: value}`` mapping for every registered parameter.
         :raises FargvError: On unknown flags, type errors, or missing mandatory params.
         """
         if argv is None:
             argv = sys.argv
-        argv = list(argv)
+        if self.response_files if expand_response_files is None else expand_response_files:
+            argv = self.expand_response_files(argv, first_is_name)
+        else:
+            argv = list(argv)
         if first_is_name and argv:
             self.name = os.path.basename(argv[0])
             argv = argv[1:]
-
-        sub_key, sub_param = self._find_subcommand_param()
-        if sub_param is not None:
-            return self._parse_with_subcommand(argv, sub_key, sub_param,
-                                                tolerate_unassigned_arguments)
-        return self._parse_flat(argv, tolerate_unassigned_arguments)
+        argv, shard = self._pop_shard(argv)
+
+        # One batch (and stat cache) spans the parent and subcommand parses.
+        with PathValidationBatch(self.path_check_timeout, self.path_check_workers):
+            sub_key, sub_param = self._find_subcommand_param()
+            if sub_param is not None:
+                result = self._parse_with_subcommand(argv, sub_key, sub_param,
+                                                     tolerate_unassigned_arguments)
+            else:
+                result = self._parse_flat(argv, tolerate_unassigned_arguments)
+        if shard is not None:
+            self._apply_shard(shard, result, sub_key, sub_param)
+        return result
+
+    def _pop_shard(self, argv: List[str]) -> Tuple[List[str], Optional[VariadicShard]]:
+        """Remove ``--fargv_shard`` options from *argv*; return the rest and the shard."""
+        flag = f"{self.long_prefix}fargv_shard"
+        shard = self.shard
+        kept: List[str] = []
+        tokens = iter(argv)
+        for token in tokens:
+            if token == flag:
+                spec = next(tokens, None)
+                if spec is None:
+                    raise FargvError(f"{flag} requires a value (i/N or i/N:mode)")
+            elif token.startswith(flag + "="):
+                spec = token[len(flag) + 1:]
+            else:
+                kept.append(token)
+                continue
+            shard = VariadicShard.parse(spec)
+        return kept, shard
+
+    def _apply_shard(self, shard: VariadicShard, result: Dict[str, Any], sub_key, sub_param) -> None:
+        """Narrow the variadic values in *result* (and the selected subcommand's) to *shard*."""
+        targets = [(self, result)]
+        if sub_param is not None and sub_param._selected_name in sub_param._sub_parsers:
+            targets.append((sub_param._sub_parsers[sub_param._selected_name], sub_param._sub_result))
+        found = False
+        for parser, values in targets:
+            for name, param in parser._name2parameters.items():
+                if param.is_variadic and name in values:
+                    param.apply_shard(shard)
+                    values[name] = param.value
+                    found = True
+        if not found:
+            raise FargvError(f"{self.long_prefix}fargv_shard: there is no variadic parameter to shard")
+        if len(targets) > 1:
+            result[sub_key] = sub_param.value
 
     def _route_tokens(
         self,
@@ -345,6 +533,10 @@ class ArgumentParser:
         4. Route leftovers to the default variadic (or raise).
         5. Verify all mandatory parameters have been supplied.
 
+        Path checks registered by steps 3-4 run when the enclosing
+        :class:`~fargv.parameters.path.PathValidationBatch` opened by
+        :meth:`parse` exits.
+
         :param argv:                        Token list (program name already stripped).
         :param tolerate_unassigned_arguments: Silently drop leftovers when ``True``.
         :param exclude:                     Parameter names to skip (used when parsing
@@ -428,7 +620,7 @@ class ArgumentParser:
             # Skip params already handled in the pre-pass (count switches).
             if pname in pre_analysed:
                 continue
-            if pname in analysed:
+            if pname in analysed and not getattr(param, "is_repeatable", False):
                 raise FargvError(f"Parameter {lp}{pname} specified multiple times")
             leftover = param.ingest_value_strings(*values)
             if leftover:
@@ -466,6 +658,20 @@ class ArgumentParser:
             if isinstance(param, FargvStr):
                 param._value = param.value
 
+    def result_digest(self, paths: str = "path") -> str:
+        """Return the stable fingerprint of the parameters' current values.
+
+        ``filter_out`` parameters are skipped.  Without subcommands this equals
+        :func:`fargv.result_digest` of the dict that :func:`fargv.parse`
+        returns for the same arguments.
+
+        :param paths: ``"path"`` or ``"content"``; see :mod:`fargv.digest`.
+        """
+        from .digest import combine_digests, key_digest
+        return combine_digests({name: key_digest(name, param.value, paths)
+                                for name, param in self._name2parameters.items()
+                                if not getattr(param, "filter_out", False)})
+
     # ───────────────────────────── output helpers ───────────────────────────
 
     def generate_bash_autocomplete(self) -> str:
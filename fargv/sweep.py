@@ -0,0 +1,520 @@
+"""Parameter sweeps: one definition, many validated configurations.
+
+:func:`sweep` reads *sweep expressions* in place of ordinary values and
+returns a lazy :class:`Sweep`.  Iterating it yields one parsed result per
+configuration, each produced by :func:`fargv.parse` so that every value goes
+through the parameter's own converter, config files and env-vars still
+apply, and a bad value fails with the usual :class:`~fargv.parameters.base.FargvError`.
+The grid is never materialised: configurations are generated one at a time.
+
+Grammar
+-------
+================================  =============================================
+``[a,b,c]``                       the listed values (quote an item to keep a comma)
+``range(start,stop[,step])``      integers, exactly like Python's :func:`range`
+``linspace(a,b,n)``               *n* evenly spaced floats from *a* to *b*
+``logspace(a,b,n)``               *n* floats from ``10**a`` to ``10**b``
+``uniform(a,b)``                  a random float in ``[a, b]``
+``loguniform(a,b)``               a random float, log-uniform in ``[a, b]``
+``randint(a,b)``                  a random integer in ``[a, b]``
+``choice(a,b,...)``               a random pick among the listed values
+================================  =============================================
+
+Example::
+
+    python train.py --lr='[1e-3,1e-4]' --bs='range(32,257,32)'       # 2 x 8 grid
+    python train.py --lr='[1e-3,1e-4]' --wd='[0,1e-5]' --fargv_zip=lr,wd   # 2 runs
+    python train.py --lr='loguniform(1e-5,1e-2)' --fargv_samples=20 --fargv_seed=3
+
+Axes combine as a cartesian product, the last one varying fastest.  Axes
+named together in a ``--fargv_zip=a,b`` group advance in lock-step (they must
+have the same length).  Random axes require a sample count
+(``--fargv_samples=N`` or ``samples=``); in that mode every grid axis is
+sampled too, so sample *i* is a pure function of the seed and *i*.
+
+In a config file the sweep lives in a ``fargv_sweep`` section (ordinary
+values are never read as sweep expressions), and zip groups under
+``fargv_zip``::
+
+    {"epochs": 10,
+     "fargv_sweep": {"lr": "[1e-3,1e-4]", "bs": "range(32,257,32)"},
+     "fargv_zip": ["lr,bs"]}
+
+:func:`fargv.parse` ignores both keys, so the same file serves single runs.
+"""
+import itertools
+import math
+import os
+import random
+import re
+import shlex
+import sys
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .parameters.base import FargvError
+
+_EXPRESSION = re.compile(
+    r"\s*(?:\[(?P<items>.*)\]|(?P<fn>range|linspace|logspace|uniform|loguniform|randint|choice)"
+    r"\((?P<args>.*)\))\s*",
+    re.S,
+)
+
+_CONTROL_FLAGS = ("fargv_samples", "fargv_seed", "fargv_zip", "fargv_task_index", "fargv_task_count")
+"""Command-line flags consumed by :func:`sweep` itself."""
+
+_SWITCHES = ("fargv_task_count",)
+"""Control flags that take no value."""
+
+TASK_INDEX_ENV = "SLURM_ARRAY_TASK_ID"
+"""Environment variable read as the task index when no index is given."""
+
+
+def is_sweep_expression(text) -> bool:
+    """Return ``True`` when *text* is a sweep expression (see the module grammar)."""
+    return isinstance(text, str) and _EXPRESSION.fullmatch(text) is not None
+
+
+def _format(value) -> str:
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _split_items(text: str) -> List[str]:
+    if not text.strip():
+        return []
+    lexer = shlex.shlex(text, posix=True)
+    lexer.whitespace, lexer.whitespace_split, lexer.commenters = ",", True, ""
+    return [item.strip() for item in lexer]
+
+
+class _Linspace:
+    """Lazy, indexable ``linspace`` / ``logspace`` sequence."""
+
+    def __init__(self, start: float, stop: float, num: int, log: bool) -> None:
+        self.start, self.stop, self.num, self.log = start, stop, num, log
+
+    def __len__(self) -> int:
+        return self.num
+
+    def __getitem__(self, index: int) -> float:
+        if not 0 <= index < self.num:
+            raise IndexError(index)
+        x = self.start if self.num == 1 else self.start + (self.stop - self.start) * index / (self.num - 1)
+        return 10.0 ** x if self.log else x
+
+
+class SweepAxis:
+    """One swept parameter: an indexable grid of values or a random sampler.
+
+    Values are produced as strings, the form a value takes on the command
+    line; converting them is left to the parameter.
+
+    :param name:       Parameter name.
+    :param expression: The sweep expression, kept for messages.
+    :param values:     Indexable sequence (a :class:`list`, :class:`range`, …)
+                       for grid axes.
+    :param sampler:    ``rng -> value`` callable for random axes.
+    """
+
+    def __init__(self, name: str, expression: str,
+                 values: Optional[Sequence] = None,
+                 sampler: Optional[Callable[[random.Random], Any]] = None) -> None:
+        self.name       = name
+        self.expression = expression
+        self.values     = values
+        self.sampler    = sampler
+
+    @classmethod
+    def parse(cls, name: str, expression: str) -> "SweepAxis":
+        """Build the axis described by *expression*.
+
+        :raises FargvError: When *expression* is not valid sweep grammar.
+        """
+        match = _EXPRESSION.fullmatch(expression)
+        if match is None:
+            raise FargvError(f"Parameter '{name}': {expression!r} is not a sweep expression")
+        try:
+            if match.group("fn") is None:
+                values = _split_items(match.group("items"))
+                if not values:
+                    raise ValueError("empty list")
+                return cls(name, expression, values=values)
+            fn, args = match.group("fn"), _split_items(match.group("args"))
+            if fn == "choice":
+                if not args:
+                    raise ValueError("choice() needs at least one value")
+                return cls(name, expression, sampler=lambda rng: rng.choice(args))
+            if fn == "range":
+                values = range(*(int(a) for a in args))
+                if not values:
+                    raise ValueError("empty range")
+                return cls(name, expression, values=values)
+            if fn in ("linspace", "logspace"):
+                start, stop, num = args
+                if int(num) < 1:
+                    raise ValueError("the point count must be positive")
+                return cls(name, expression,
+                           values=_Linspace(float(start), float(stop), int(num), fn == "logspace"))
+            low, high = args
+            if fn == "randint":
+                low_i, high_i = int(low), int(high)
+                return cls(name, expression, sampler=lambda rng: rng.randint(low_i, high_i))
+            low_f, high_f = float(low), float(high)
+            if fn == "uniform":
+                return cls(name, expression, sampler=lambda rng: rng.uniform(low_f, high_f))
+            if low_f <= 0 or high_f <= 0:
+                raise ValueError("loguniform() bounds must be positive")
+            log_low, log_high = math.log(low_f), math.log(high_f)
+            return cls(name, expression,
+                       sampler=lambda rng: math.exp(rng.uniform(log_low, log_high)))
+        except (ValueError, TypeError) as exc:
+            raise FargvError(f"Parameter '{name}': bad sweep expression {expression!r}: {exc}") from None
+
+    @property
+    def is_random(self) -> bool:
+        """``True`` for a sampled axis, which has no length."""
+        return self.values is None
+
+    def __len__(self) -> int:
+        if self.values is None:
+            raise TypeError(f"random sweep axis '{self.name}' has no length")
+        return len(self.values)
+
+    def __getitem__(self, index: int) -> str:
+        return _format(self.values[index])
+
+    def draw(self, rng: random.Random) -> str:
+        """Return a random value; grid axes pick a uniformly random element."""
+        if self.values is None:
+            return _format(self.sampler(rng))
+        return self[rng.randrange(len(self.values))]
+
+    def __repr__(self) -> str:
+        return f"SweepAxis({self.name!r}, {self.expression!r})"
+
+
+class Sweep:
+    """Lazy sequence of configurations described by sweep axes.
+
+    Normally obtained from :func:`sweep`.  Iterating yields parsed results;
+    :meth:`assignments` yields the raw ``{name: value_string}`` picks.
+
+    :param definition:   Anything :func:`fargv.parse` accepts.
+    :param argv:         Argument list (program name first) with the sweep
+                         expressions still in place.
+    :param axes:         Axes in order; the last varies fastest.
+    :param slots:        ``{name: (index, inline)}`` — where each command-line
+                         axis sits in *argv*; ``inline`` is ``True`` for
+                         ``--name=expr`` and ``False`` for ``--name expr``.
+                         Axes without a slot are inserted after the program name.
+    :param zip_groups:   Groups of axis names that advance together.
+    :param samples:      Draw this many random configurations instead of
+                         walking the grid.  Required when any axis is random.
+    :param seed:         Seed of the random configurations.
+    :param parse_kwargs: Forwarded to :func:`fargv.parse` for every configuration.
+    :param indices:      Visit only these configuration indices (see
+                         :meth:`assignment`), e.g. ``range(n, n + 1)`` for
+                         one task of a job array; ``None`` visits all.
+    :raises FargvError: On an unknown or inconsistent zip group, random
+                        axes without *samples*, or an index out of range.
+    """
+
+    def __init__(self, definition, argv: List[str], axes: Sequence[SweepAxis],
+                 slots: Optional[Dict[str, Tuple[int, bool]]] = None,
+                 zip_groups: Sequence[Sequence[str]] = (),
+                 samples: Optional[int] = None, seed: int = 0,
+                 parse_kwargs: Optional[Dict[str, Any]] = None,
+                 indices: Optional[Sequence[int]] = None) -> None:
+        self.definition   = definition
+        self.argv         = list(argv)
+        self.axes         = {axis.name: axis for axis in axes}
+        self.slots        = dict(slots or {})
+        self.samples      = samples
+        self.seed         = seed
+        self.parse_kwargs = dict(parse_kwargs or {})
+        self.long_prefix  = "-" if self.parse_kwargs.get("argv_parse_mode") == "legacy" else "--"
+        self.groups       = self._build_groups(zip_groups)
+        if samples is None and any(axis.is_random for axis in axes):
+            random_names = [a.name for a in axes if a.is_random]
+            raise FargvError(
+                f"Random sweep axes {random_names} need a sample count "
+                f"({self.long_prefix}fargv_samples=N)"
+            )
+        if samples is not None and samples < 0:
+            raise FargvError(f"Sample count must not be negative, got {samples}")
+        self.indices = indices
+        if indices is not None:
+            total = self.total
+            bad = next((i for i in indices if not 0 <= i < total), None)
+            if bad is not None:
+                raise FargvError(
+                    f"Configuration index {bad} is out of range for a sweep of {total} configurations"
+                )
+
+    def _build_groups(self, zip_groups) -> List[List[SweepAxis]]:
+        group_of: Dict[str, int] = {}
+        for number, names in enumerate(zip_groups):
+            for name in names:
+                if name not in self.axes:
+                    raise FargvError(f"Zip group {list(names)} names '{name}', which is not swept")
+                if name in group_of:
+                    raise FargvError(f"Sweep axis '{name}' is in more than one zip group")
+                group_of[name] = number
+        groups: List[List[SweepAxis]] = []
+        placed: Dict[int, List[SweepAxis]] = {}
+        for name, axis in self.axes.items():
+            number = group_of.get(name)
+            if number is None:
+                groups.append([axis])
+            elif number in placed:
+                placed[number].append(axis)
+            else:
+                placed[number] = [axis]
+                groups.append(placed[number])
+        for group in groups:
+            if len(group) > 1:
+                if any(axis.is_random for axis in group):
+                    raise FargvError(f"Zip group {[a.name for a in group]} contains a random axis")
+                lengths = {axis.name: len(axis) for axis in group}
+                if len(set(lengths.values())) > 1:
+                    raise FargvError(f"Zipped sweep axes differ in length: {lengths}")
+        return groups
+
+    @property
+    def total(self) -> int:
+        """Number of configurations in the whole sweep, ignoring :attr:`indices`."""
+        if self.samples is not None:
+            return self.samples
+        return math.prod(len(group[0]) for group in self.groups)
+
+    def __len__(self) -> int:
+        return self.total if self.indices is None else len(self.indices)
+
+    def assignment(self, index: int) -> Dict[str, str]:
+        """Return configuration *index* without enumerating the ones before it.
+
+        The index is read as a mixed-radix number whose digits are the
+        positions along each (zipped) axis group, the last group being the
+        least significant — the order :meth:`assignments` walks the grid —
+        so the cost is one division per group.  Random sweeps seed sample
+        *index* directly.
+
+        :raises FargvError: When *index* is outside ``[0, total)``.
+        """
+        total = self.total
+        if not 0 <= index < total:
+            raise FargvError(
+                f"Configuration index {index} is out of range for a sweep of {total} configurations"
+            )
+        if self.samples is not None:
+            return self._sample(index)
+        picks = []
+        for group in reversed(self.groups):
+            index, pick = divmod(index, len(group[0]))
+            picks.append(pick)
+        return {axis.name: axis[pick]
+                for group, pick in zip(self.groups, reversed(picks)) for axis in group}
+
+    def assignments(self) -> Iterator[Dict[str, str]]:
+        """Yield ``{name: value_string}`` for every configuration, lazily."""
+        if self.indices is not None:
+            for index in self.indices:
+                yield self.assignment(index)
+            return
+        if self.samples is not None:
+            for index in range(self.samples):
+                yield self._sample(index)
+            return
+        for picks in itertools.product(*(range(len(group[0])) for group in self.groups)):
+            yield {axis.name: axis[pick]
+                   for group, pick in zip(self.groups, picks) for axis in group}
+
+    def indexed_assignments(self) -> Iterator[Tuple[int, Dict[str, str]]]:
+        """Like :meth:`assignments`, paired with each configuration's index."""
+        indices = range(self.total) if self.indices is None else self.indices
+        return zip(indices, self.assignments())
+
+    def _sample(self, index: int) -> Dict[str, str]:
+        rng = random.Random(f"{self.seed}:{index}")
+        out: Dict[str, str] = {}
+        for group in self.groups:
+            if len(group) == 1:
+                out[group[0].name] = group[0].draw(rng)
+            else:
+                pick = rng.randrange(len(group[0]))
+                out.update((axis.name, axis[pick]) for axis in group)
+        return out
+
+    def argv_for(self, assignment: Dict[str, str]) -> List[str]:
+        """Return the argument list that realises *assignment*."""
+        argv = list(self.argv)
+        for name, value in assignment.items():
+            slot = self.slots.get(name)
+            if slot is None:
+                continue
+            index, inline = slot
+            if inline:
+                argv[index] = f"{argv[index].split('=', 1)[0]}={value}"
+            else:
+                argv[index + 1] = value
+        inserted = [f"{self.long_prefix}{name}={value}"
+                    for name, value in assignment.items() if name not in self.slots]
+        return argv[:1] + inserted + argv[1:]
+
+    def parse(self, assignment: Dict[str, str]) -> Any:
+        """Parse the configuration *assignment* and return the result.
+
+        :raises FargvError: When a swept value does not convert.
+        """
+        from .parse import parse
+        return parse(self.definition, given_parameters=self.argv_for(assignment), **self.parse_kwargs)[0]
+
+    def __iter__(self) -> Iterator[Any]:
+        for assignment in self.assignments():
+            yield self.parse(assignment)
+
+    def __repr__(self) -> str:
+        return f"Sweep(axes={list(self.axes.values())!r}, configurations={len(self)})"
+
+
+def _pop_control_flags(argv: List[str], long_prefix: str, names: Sequence[str] = _CONTROL_FLAGS,
+                       switches: Sequence[str] = _SWITCHES) -> Tuple[List[str], Dict[str, List[str]]]:
+    """Remove the flags *names* from *argv*; return the rest and their values.
+
+    Flags in *switches* take no value and are reported with ``""``.
+    """
+    kept = argv[:1]
+    found: Dict[str, List[str]] = {}
+    tokens = iter(argv[1:])
+    for token in tokens:
+        name, eq, value = token[len(long_prefix):].partition("=")
+        if token.startswith(long_prefix) and name in names:
+            if name in switches:
+                if eq:
+                    raise FargvError(f"{long_prefix}{name} takes no value")
+                value = ""
+            elif not eq:
+                value = next(tokens, None)
+                if value is None:
+                    raise FargvError(f"{token} requires a value")
+            found.setdefault(name, []).append(value)
+        else:
+            kept.append(token)
+    return kept, found
+
+
+def _zip_groups(spec) -> List[List[str]]:
+    """Normalise ``"a,b"`` / ``["a,b", ...]`` / ``[["a", "b"], ...]`` zip specs."""
+    if isinstance(spec, str):
+        spec = [spec]
+    return [[n.strip() for n in group.split(",") if n.strip()] if isinstance(group, str)
+            else [str(n) for n in group] for group in spec]
+
+
+def _as_int(flag: str, text) -> int:
+    try:
+        return int(text)
+    except (TypeError, ValueError):
+        raise FargvError(f"{flag} expects an integer, got {text!r}") from None
+
+
+def sweep(
+    definition,
+    given_parameters: Optional[List[str]] = None,
+    samples: Optional[int] = None,
+    seed: int = 0,
+    zip_groups: Sequence[Union[str, Sequence[str]]] = (),
+    task_index: Optional[int] = None,
+    **parse_kwargs: Any,
+) -> Sweep:
+    """Describe a parameter sweep over *definition* and return it as a lazy :class:`Sweep`.
+
+    Sweep expressions (see the module docstring) are accepted as the value of
+    any long-form option (``--lr=[1e-3,1e-4]`` or ``--lr '[1e-3,1e-4]'``) and
+    in the ``fargv_sweep`` section of the ``--config`` files; a command-line
+    axis replaces a config axis of the same name.  ``--fargv_samples=N``,
+    ``--fargv_seed=N``, ``--fargv_zip=a,b`` (repeatable) and
+    ``--fargv_task_index=N`` override the corresponding keyword arguments.
+
+    Job arrays: with a task index — ``--fargv_task_index=N``, *task_index*, or
+    else :data:`TASK_INDEX_ENV` (``SLURM_ARRAY_TASK_ID``) when something is
+    swept — the sweep holds only configuration *N*, computed directly by
+    :meth:`Sweep.assignment`.  ``--fargv_task_count`` prints the number of
+    configurations and exits, for sizing the array.
+
+    Example::
+
+        for p in fargv.sweep({"lr": 0.01, "bs": 32}):
+            train(p.lr, p.bs)
+
+    :param definition:       Anything :func:`fargv.parse` accepts.
+    :param given_parameters: Argument list, program name first; defaults to
+                             :data:`sys.argv`.
+    :param samples:          Number of random configurations to draw instead
+                             of walking the grid.
+    :param seed:             Seed for random configurations.
+    :param zip_groups:       Axis groups that advance together, each a list
+                             of names or a comma-separated string.
+    :param task_index:       Select this single configuration.
+    :param parse_kwargs:     Forwarded to :func:`fargv.parse`.
+    :return: The :class:`Sweep`; nothing is parsed until it is iterated.
+    :raises FargvError: On malformed sweep grammar, inconsistent groups or an
+                        out-of-range task index.
+    """
+    from .config import SWEEP_KEYS, load_config_layers, pop_sweep_keys, scan_config_paths
+
+    argv = list(sys.argv if given_parameters is None else given_parameters)
+    long_prefix = "-" if parse_kwargs.get("argv_parse_mode") == "legacy" else "--"
+    argv, control = _pop_control_flags(argv, long_prefix)
+
+    axes: Dict[str, SweepAxis] = {}
+    slots: Dict[str, Tuple[int, bool]] = {}
+    for index in range(1, len(argv)):
+        token = argv[index]
+        if not token.startswith(long_prefix):
+            continue
+        name, eq, value = token[len(long_prefix):].partition("=")
+        if eq:
+            inline = True
+        elif index + 1 < len(argv):
+            value, inline = argv[index + 1], False
+        else:
+            continue
+        if is_sweep_expression(value):
+            if name in axes:
+                raise FargvError(f"Parameter '{name}' is swept more than once")
+            axes[name] = SweepAxis.parse(name, value)
+            slots[name] = (index, inline)
+
+    config_zip: list = []
+    config_paths = scan_config_paths(argv[1:], long_prefix)
+    if config_paths and not any(str(p).startswith("//") for p in config_paths):
+        try:
+            directives = pop_sweep_keys(load_config_layers(config_paths))
+        except (ValueError, ImportError):
+            directives = {}   # fargv.parse reports the broken config
+        for key, value in directives.items():
+            if key == SWEEP_KEYS[1]:
+                config_zip = _zip_groups(value)
+                continue
+            name = key[len(SWEEP_KEYS[0]) + 1:]
+            if name not in axes and not scan_config_paths(argv[1:], long_prefix, key=name):
+                axes[name] = SweepAxis.parse(name, str(value))
+
+    if "fargv_samples" in control:
+        samples = _as_int(f"{long_prefix}fargv_samples", control["fargv_samples"][-1])
+    if "fargv_seed" in control:
+        seed = _as_int(f"{long_prefix}fargv_seed", control["fargv_seed"][-1])
+    cli_zip = _zip_groups(control.get("fargv_zip", []))
+    groups = _zip_groups(zip_groups) + (cli_zip or config_zip)
+    if "fargv_task_index" in control:
+        task_index = _as_int(f"{long_prefix}fargv_task_index", control["fargv_task_index"][-1])
+    elif task_index is None and axes and os.environ.get(TASK_INDEX_ENV):
+        task_index = _as_int(TASK_INDEX_ENV, os.environ[TASK_INDEX_ENV])
+    counting = "fargv_task_count" in control
+    indices = None if task_index is None or counting else range(task_index, task_index + 1)
+    result = Sweep(definition, argv, list(axes.values()), slots=slots, zip_groups=groups,
+                   samples=samples, seed=seed, parse_kwargs=parse_kwargs, indices=indices)
+    if counting:
+        print(result.total)
+        sys.exit(0)
+    return result
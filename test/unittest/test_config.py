@@ -0,0 +1,296 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+import fargv.config as config_mod
+from fargv.config import FlatLookup, load_config, clear_config_cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_config_cache()
+    yield
+    clear_config_cache()
+
+
+def _write_json(path: Path, data) -> Path:
+    path.write_text(json.dumps(data))
+    return path
+
+
+# ---------------------------------------------------------------------------
+# load_config cache
+# ---------------------------------------------------------------------------
+
+class TestConfigCache:
+    def test_second_load_skips_parsing(self, tmp_path, monkeypatch):
+        cfg = _write_json(tmp_path / "c.json", {"lr": 0.1})
+        assert load_config(cfg) == {"lr": 0.1}
+        monkeypatch.setattr(config_mod, "_load_json", lambda p: pytest.fail("re-parsed"))
+        assert load_config(cfg) == {"lr": 0.1}
+
+    def test_returned_dict_is_a_copy(self, tmp_path):
+        cfg = _write_json(tmp_path / "c.json", {"lr": 0.1})
+        load_config(cfg)["lr"] = 99
+        assert load_config(cfg) == {"lr": 0.1}
+
+    def test_changed_file_is_reloaded(self, tmp_path):
+        cfg = _write_json(tmp_path / "c.json", {"lr": 0.1})
+        load_config(cfg)
+        _write_json(cfg, {"lr": 0.25, "epochs": 3})
+        st = cfg.stat()
+        os.utime(cfg, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert load_config(cfg) == {"lr": 0.25, "epochs": 3}
+
+    def test_symlink_shares_entry(self, tmp_path, monkeypatch):
+        cfg = _write_json(tmp_path / "c.json", {"lr": 0.1})
+        link = tmp_path / "link.json"
+        link.symlink_to(cfg)
+        load_config(cfg)
+        monkeypatch.setattr(config_mod, "_load_json", lambda p: pytest.fail("re-parsed"))
+        assert load_config(link) == {"lr": 0.1}
+
+    def test_mutating_a_parsed_list_leaves_the_cache_alone(self, tmp_path):
+        import fargv
+        cfg = _write_json(tmp_path / "c.json", {"files": ["a", "b"]})
+        definition = {"files": fargv.FargvVariadic(["x"])}
+        p, _ = fargv.parse(definition, given_parameters=["prog", f"--config={cfg}"])
+        p.files.append("c")
+        p, _ = fargv.parse({"files": fargv.FargvVariadic(["x"])},
+                           given_parameters=["prog", f"--config={cfg}"])
+        assert p.files == ["a", "b"]
+        assert load_config(cfg) == {"files": ["a", "b"]}
+
+    def test_clear_and_bypass(self, tmp_path, monkeypatch):
+        cfg = _write_json(tmp_path / "c.json", {"lr": 0.1})
+        load_config(cfg)
+        calls = []
+        real = config_mod._load_json
+        monkeypatch.setattr(config_mod, "_load_json", lambda p: calls.append(p) or real(p))
+        load_config(cfg, use_cache=False)
+        clear_config_cache()
+        load_config(cfg)
+        assert len(calls) == 2
+
+
+# ---------------------------------------------------------------------------
+# Compiled sidecars
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def sidecar_dir(tmp_path):
+    d = tmp_path / "sidecars"
+    config_mod.set_config_sidecar(d)
+    yield d
+    config_mod.set_config_sidecar(None)
+
+
+class TestConfigSidecar:
+    def test_sidecar_written_and_used(self, tmp_path, sidecar_dir, monkeypatch):
+        cfg = tmp_path / "c.ini"
+        cfg.write_text("[main]\nlr = 0.1\n[train]\nepochs = 3\n")
+        assert load_config(cfg) == {"lr": "0.1", "train.epochs": "3"}
+        assert len(list(sidecar_dir.glob("*.marshal"))) == 1
+        clear_config_cache()
+        monkeypatch.setattr(config_mod, "_load_ini", lambda p: pytest.fail("re-parsed"))
+        assert load_config(cfg) == {"lr": "0.1", "train.epochs": "3"}
+
+    def test_stale_sidecar_ignored(self, tmp_path, sidecar_dir):
+        cfg = _write_json(tmp_path / "c.json", {"lr": 0.1})
+        load_config(cfg)
+        clear_config_cache()
+        _write_json(cfg, {"lr": 0.75})
+        st = cfg.stat()
+        os.utime(cfg, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert load_config(cfg) == {"lr": 0.75}
+
+    def test_corrupt_sidecar_falls_back(self, tmp_path, sidecar_dir):
+        cfg = _write_json(tmp_path / "c.json", {"lr": 0.1})
+        load_config(cfg)
+        for f in sidecar_dir.glob("*.marshal"):
+            f.write_bytes(b"garbage")
+        clear_config_cache()
+        assert load_config(cfg) == {"lr": 0.1}
+
+    def test_unwritable_dir_is_ignored(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        config_mod.set_config_sidecar(blocker / "sub")
+        try:
+            cfg = _write_json(tmp_path / "c.json", {"lr": 0.1})
+            assert load_config(cfg) == {"lr": 0.1}
+        finally:
+            config_mod.set_config_sidecar(None)
+
+    def test_env_var(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("FARGV_CONFIG_SIDECAR", "0")
+        assert config_mod._sidecar_dir_from_env() is None
+        monkeypatch.setenv("FARGV_CONFIG_SIDECAR", "1")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert config_mod._sidecar_dir_from_env() == tmp_path / "fargv" / "config"
+
+
+# ---------------------------------------------------------------------------
+# FlatLookup shared across config / env / dump
+# ---------------------------------------------------------------------------
+
+def _sub_params():
+    import fargv
+    from fargv.parameters import FargvSubcommand
+    parser = fargv.ArgumentParser()
+    parser._add_parameter(fargv.FargvInt(1, name="n"))
+    parser._add_parameter(FargvSubcommand(
+        {"train": {"lr": 0.01}, "eval": {"dataset": "val"}}, name="cmd"))
+    return parser
+
+
+class TestFlatLookup:
+    def test_keys_for_both_separators(self):
+        lookup = FlatLookup(_sub_params()._name2parameters)
+        assert {"n", "train.lr", "eval.dataset"} <= set(lookup.dotted)
+        assert {"n", "train_lr", "eval_dataset"} <= set(lookup.underscored)
+        assert lookup.dotted["train.lr"] is lookup.underscored["train_lr"]
+
+    def test_iter_dump_honours_exclude(self):
+        lookup = FlatLookup(_sub_params()._name2parameters)
+        keys = [k for k, _ in lookup.iter_dump(exclude={"cmd"})]
+        assert keys == ["n"]
+
+    def test_parse_builds_lookup_once(self, tmp_path, monkeypatch):
+        import fargv
+        cfg = _write_json(tmp_path / "c.json", {"train.lr": 0.5})
+        monkeypatch.setenv("PROG_N", "7")
+        built = []
+        real_init = FlatLookup.__init__
+
+        def counting_init(self, name2parameters):
+            built.append(1)
+            real_init(self, name2parameters)
+
+        monkeypatch.setattr(FlatLookup, "__init__", counting_init)
+        p, _ = fargv.parse(
+            {"n": 1, "cmd": {"train": {"lr": 0.01}, "eval": {"dataset": "val"}}},
+            given_parameters=["prog", f"--config={cfg}"],
+            return_type="dict",
+        )
+        assert len(built) == 1
+        assert p["n"] == 7
+        assert p["lr"] == 0.5
+
+
+# ---------------------------------------------------------------------------
+# apply_env_vars single-pass scan
+# ---------------------------------------------------------------------------
+
+class TestEnvScan:
+    def test_prefixed_var_applied(self, monkeypatch):
+        from fargv.config import apply_env_vars
+        parser = _sub_params()
+        monkeypatch.setenv("PROG_N", "5")
+        monkeypatch.setenv("PROG_TRAIN_LR", "0.25")
+        apply_env_vars(parser._name2parameters, "prog")
+        assert parser._name2parameters["n"].value == 5
+        assert FlatLookup(parser._name2parameters).dotted["train.lr"].value == 0.25
+
+    def test_env_index_is_cached_per_prefix(self):
+        lookup = FlatLookup(_sub_params()._name2parameters)
+        assert lookup.env_index("PROG_") is lookup.env_index("PROG_")
+        assert lookup.env_index("PROG_")["PROG_TRAIN_LR"] == ["train_lr"]
+
+    def test_typo_is_reported(self, monkeypatch, capsys):
+        from fargv.config import apply_env_vars
+        parser = _sub_params()
+        monkeypatch.setenv("PROG_TRAIN_LT", "0.25")
+        apply_env_vars(parser._name2parameters, "prog")
+        err = capsys.readouterr().err
+        assert "PROG_TRAIN_LT" in err and "PROG_TRAIN_LR" in err
+
+    def test_unrelated_prefixed_var_is_silent(self, monkeypatch, capsys):
+        from fargv.config import apply_env_vars
+        parser = _sub_params()
+        monkeypatch.setenv("PROG_SOMETHING_ELSE_ENTIRELY", "1")
+        monkeypatch.setenv("OTHER_N", "9")
+        apply_env_vars(parser._name2parameters, "prog")
+        assert capsys.readouterr().err == ""
+        assert parser._name2parameters["n"].value == 1
+
+
+# ---------------------------------------------------------------------------
+# Layered configs and includes
+# ---------------------------------------------------------------------------
+
+class TestConfigLayers:
+    def test_later_layers_win(self, tmp_path):
+        from fargv.config import load_config_layers
+        a = _write_json(tmp_path / "a.json", {"lr": 0.1, "n": 1})
+        b = _write_json(tmp_path / "b.json", {"lr": 0.2})
+        assert load_config_layers([a, b]) == {"lr": 0.2, "n": 1}
+
+    def test_include_is_merged_first_and_removed(self, tmp_path):
+        from fargv.config import load_config_layers
+        _write_json(tmp_path / "base.json", {"lr": 0.1, "n": 1})
+        run = _write_json(tmp_path / "run.json", {"include": "base.json", "lr": 0.3})
+        assert load_config_layers([run]) == {"lr": 0.3, "n": 1}
+
+    def test_diamond_include_merged_once(self, tmp_path):
+        from fargv.config import load_config_layers
+        _write_json(tmp_path / "site.json", {"lr": 0.1})
+        _write_json(tmp_path / "team.json", {"fargv_include": "site.json", "lr": 0.2})
+        _write_json(tmp_path / "exp.json", {"fargv_include": "site.json", "n": 3})
+        run = _write_json(tmp_path / "run.json", {"include": ["team.json", "exp.json"]})
+        assert load_config_layers([run]) == {"lr": 0.2, "n": 3}
+
+    def test_shared_base_parsed_once(self, tmp_path, monkeypatch):
+        from fargv.config import load_config_layers
+        _write_json(tmp_path / "base.json", {"lr": 0.1})
+        jobs = [_write_json(tmp_path / f"job{i}.json", {"include": "base.json", "n": i})
+                for i in range(3)]
+        calls = []
+        real = config_mod._load_json
+        monkeypatch.setattr(config_mod, "_load_json", lambda p: calls.append(p) or real(p))
+        for job in jobs:
+            load_config_layers([job])
+        assert [Path(c).name for c in calls].count("base.json") == 1
+
+    def test_cycle_raises(self, tmp_path):
+        from fargv.config import load_config_layers
+        a = _write_json(tmp_path / "a.json", {"include": "b.json"})
+        _write_json(tmp_path / "b.json", {"include": "a.json"})
+        with pytest.raises(ValueError, match="cycle"):
+            load_config_layers([a])
+
+    def test_repeated_config_flags(self, tmp_path):
+        import fargv
+        site = _write_json(tmp_path / "site.json", {"lr": 0.1, "n": 2})
+        run = _write_json(tmp_path / "run.json", {"lr": 0.5})
+        p, _ = fargv.parse({"lr": 0.01, "n": 1},
+                           given_parameters=["prog", f"--config={site}", "--config", str(run)],
+                           return_type="dict")
+        assert p["lr"] == 0.5 and p["n"] == 2
+
+    def test_mixed_long_and_short_config_flags_keep_order(self, tmp_path):
+        import fargv
+        a = _write_json(tmp_path / "a.json", {"lr": 0.1})
+        b = _write_json(tmp_path / "b.json", {"lr": 0.5})
+        for argv, lr in ((["-c", str(a), "--config", str(b)], 0.5),
+                         ([f"--config={b}", "-c", str(a)], 0.1)):
+            p, _ = fargv.parse({"lr": 0.01}, given_parameters=["prog"] + argv, return_type="dict")
+            assert p["lr"] == lr
+
+    def test_unknown_key_policy_applies_to_merged_result(self, tmp_path, capsys):
+        import fargv
+        _write_json(tmp_path / "site.json", {"lr": 0.1})
+        run = _write_json(tmp_path / "run.json", {"include": "site.json", "typo": 1})
+        p, _ = fargv.parse({"lr": 0.01}, given_parameters=["prog", f"--config={run}"],
+                           return_type="dict")
+        assert p["lr"] == 0.01   # the included site layer is dropped with the merged dict
+        assert "typo" in capsys.readouterr().err
+
+    def test_param_named_include_is_not_a_directive(self, tmp_path):
+        import fargv
+        cfg = _write_json(tmp_path / "c.json", {"include": "extra"})
+        p, _ = fargv.parse({"include": "none"}, given_parameters=["prog", f"--config={cfg}"],
+                           return_type="dict")
+        assert p["include"] == "extra"
@@ -0,0 +1,131 @@
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from fargv import forkserver
+
+ROOT = str(Path(__file__).resolve().parents[2])
+
+pytestmark = pytest.mark.skipif(not forkserver.available(), reason="needs fork and Unix sockets")
+
+MODULE = '''
+import os, sys
+def shout(n: int = 1):
+    sys.stdout.write(sys.stdin.read().upper() * n)
+    return f"pid={os.getpid()} cwd={os.path.basename(os.getcwd())} tag={os.environ.get('TAG')}"
+def fail(code: int = 3):
+    raise SystemExit(code)
+def later(path: str = ""):
+    import atexit
+    atexit.register(lambda: open(path, "w").write("done"))
+def mask():
+    m = os.umask(0)
+    os.umask(m)
+    return oct(m)
+'''
+
+
+@pytest.fixture
+def env(tmp_path, monkeypatch):
+    (tmp_path / "fs_target.py").write_text(MODULE)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path / "run"))
+    monkeypatch.delenv(forkserver.SERVER_ENV, raising=False)
+    return {**os.environ, "PYTHONPATH": os.pathsep.join([ROOT, str(tmp_path)])}
+
+
+@pytest.fixture
+def server(env, tmp_path):
+    proc = subprocess.Popen([sys.executable, "-m", "fargv", "--serve", "fs_target"],
+                            env=env, cwd=tmp_path, stderr=subprocess.PIPE)
+    sock = forkserver.default_socket_path("fs_target")
+    for _ in range(100):
+        if sock.exists():
+            break
+        time.sleep(0.05)
+    yield proc
+    proc.terminate()
+    proc.wait(timeout=10)
+
+
+def _call(env, *argv, stdin="", **kwargs):
+    return subprocess.run([sys.executable, "-m", "fargv", *argv], env=env, input=stdin,
+                          capture_output=True, text=True, timeout=30, **kwargs)
+
+
+class TestForkServer:
+    def test_find_server(self, env):
+        sock = forkserver.default_socket_path("fs_target")
+        assert forkserver.find_server("fs_target.shout") is None
+        sock.parent.mkdir(mode=0o700, parents=True)
+        sock.touch()
+        assert forkserver.find_server("fs_target.shout") == sock
+        os.environ[forkserver.SERVER_ENV] = "off"
+        try:
+            assert forkserver.find_server("fs_target.shout") is None
+        finally:
+            del os.environ[forkserver.SERVER_ENV]
+
+    def test_shared_socket_directory_is_refused(self, env, capsys):
+        from fargv import FargvError
+        sock = forkserver.default_socket_path("fs_target")
+        sock.parent.mkdir(mode=0o700, parents=True)
+        sock.parent.chmod(0o755)
+        sock.touch()
+        assert forkserver.find_server("fs_target.shout") is None
+        assert "not private" in capsys.readouterr().err
+        with pytest.raises(FargvError, match="mode 0700"):
+            forkserver.serve("json", lambda target, argv: None)
+
+    def test_tagged_messages(self, tmp_path):
+        import socket
+        import threading
+        path = tmp_path / "fake.sock"
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(str(path))
+        listener.listen(1)
+
+        def fake_server():
+            conn, _ = listener.accept()
+            with conn:
+                header, fds, _, _ = socket.recv_fds(conn, forkserver._HEADER.size, 3)
+                for fd in fds:
+                    os.close(fd)
+                forkserver._recv_exact(conn, forkserver._HEADER.unpack(header)[0])
+                conn.sendall(forkserver._MESSAGE.pack(forkserver._PID, 2 ** 22 + 1))
+                conn.sendall(forkserver._MESSAGE.pack(forkserver._STATUS, 7))
+
+        thread = threading.Thread(target=fake_server)
+        thread.start()
+        try:
+            assert forkserver.run_remote(path, "x.y", []) == 7
+        finally:
+            thread.join(5)
+            listener.close()
+
+    def test_call_runs_in_forked_child_with_client_stdio(self, env, server, tmp_path):
+        work = tmp_path / "work"
+        work.mkdir()
+        out = _call({**env, "TAG": "t1"}, "fs_target.shout", "--n=2", stdin="ab", cwd=work)
+        assert out.returncode == 0, out.stderr
+        assert out.stdout.startswith("ABABpid=")
+        assert out.stdout.rstrip().endswith("cwd=work tag=t1")
+        assert f"pid={server.pid} " not in out.stdout
+
+    def test_atexit_handlers_and_umask_follow_the_call(self, env, server, tmp_path):
+        marker = tmp_path / "atexit.txt"
+        out = _call(env, "fs_target.later", f"--path={marker}")
+        assert out.returncode == 0, out.stderr
+        assert marker.read_text() == "done"
+        out = _call(env, "fs_target.mask", umask=0o077)
+        assert out.stdout.strip() == "0o77", out.stderr
+
+    def test_exit_status_and_stale_socket(self, env, server):
+        assert _call(env, "fs_target.fail", "--code=5").returncode == 5
+        server.terminate()
+        server.wait(timeout=10)
+        assert not forkserver.default_socket_path("fs_target").exists()
+        assert _call(env, "fs_target.fail").returncode == 3   # runs locally
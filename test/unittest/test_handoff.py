@@ -0,0 +1,74 @@
+import json
+import os
+
+import pytest
+
+import fargv
+from fargv import handoff
+
+DEFINITION = {"lr": 0.1, "name": "run", "tags": ["a"], "out": fargv.FargvPath("x")}
+
+
+@pytest.fixture
+def parent():
+    p, _ = fargv.parse(DEFINITION, ["parent", "--lr=0.5", "--tags", "b", "c", "--name=base"])
+    return p
+
+
+class TestHandoff:
+    def test_child_takes_resolved_values(self, parent, monkeypatch):
+        monkeypatch.setenv(handoff.RESOLVED_ENV, handoff.encode(DEFINITION, parent))
+        monkeypatch.setenv("PROG_LR", "0.9")   # the env layer is replaced
+        p, _ = fargv.parse(DEFINITION, ["prog", "--name=cli"])
+        assert (p.lr, p.name, p.tags, str(p.out)) == (0.5, "cli", ["b", "c"], "x")
+
+    def test_blob_is_compact_and_skips_auto_params(self, parent):
+        blob = json.loads(handoff.encode(DEFINITION, parent))
+        assert set(blob["values"]) == {"lr", "name", "tags", "out"}
+        parser = fargv.type_detection.definition_to_parser(DEFINITION)
+        parser._add_parameter(fargv.FargvVerbosity())
+        assert blob["def"] == handoff.definition_hash(parser._name2parameters)
+
+    def test_explicit_config_still_loads(self, parent, monkeypatch, tmp_path):
+        cfg = tmp_path / "c.json"
+        cfg.write_text('{"name": "from-config"}')
+        monkeypatch.setenv(handoff.RESOLVED_ENV, handoff.encode(DEFINITION, parent))
+        p, _ = fargv.parse(DEFINITION, ["prog", f"--config={cfg}"])
+        assert (p.lr, p.name) == (0.5, "from-config")
+
+    def test_mismatched_definition_is_rejected(self, monkeypatch, capsys):
+        monkeypatch.setenv(handoff.RESOLVED_ENV, handoff.encode({"lr": 0.1}, {"lr": 0.3}))
+        p, _ = fargv.parse(DEFINITION, ["prog"])
+        assert p.lr == 0.1
+        assert "different definition" in capsys.readouterr().err
+
+    def test_explicit_short_config_still_loads(self, parent, monkeypatch, tmp_path):
+        cfg = tmp_path / "c.json"
+        cfg.write_text('{"name": "from-config"}')
+        monkeypatch.setenv(handoff.RESOLVED_ENV, handoff.encode(DEFINITION, parent))
+        p, _ = fargv.parse(DEFINITION, ["prog", "-c", str(cfg)])
+        assert (p.lr, p.name) == (0.5, "from-config")
+
+    def test_descriptor_transport(self, parent, monkeypatch):
+        fd = handoff.write_fd(DEFINITION, parent)
+        try:
+            monkeypatch.setenv(handoff.RESOLVED_ENV, f"fd:{fd}")
+            assert fargv.parse(DEFINITION, ["prog"])[0].tags == ["b", "c"]
+            assert os.environ[handoff.RESOLVED_ENV] == handoff.encode(DEFINITION, parent)
+        finally:
+            os.close(fd)
+        assert fargv.parse(DEFINITION, ["prog"])[0].lr == 0.5   # inline from here on
+
+    def test_oversized_descriptor_blob_is_not_passed_on(self, parent, monkeypatch):
+        monkeypatch.setattr(handoff, "_ENV_MAX", 10)
+        fd = handoff.write_fd(DEFINITION, parent)
+        try:
+            monkeypatch.setenv(handoff.RESOLVED_ENV, f"fd:{fd}")
+            assert fargv.parse(DEFINITION, ["prog"])[0].lr == 0.5
+        finally:
+            os.close(fd)
+        assert handoff.RESOLVED_ENV not in os.environ
+
+    def test_child_env_copies(self, parent):
+        env = handoff.child_env(DEFINITION, parent, env={"A": "1"})
+        assert env["A"] == "1" and handoff.RESOLVED_ENV in env
@@ -0,0 +1,106 @@
+import json
+import os
+
+import pytest
+
+import fargv
+from fargv.index import RunIndex, main, parse_condition
+
+
+def _dump(root, name, values, mtime=None):
+    path = root / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(values))
+    if mtime is not None:
+        os.utime(path, ns=(mtime, mtime))
+    return path
+
+
+@pytest.fixture
+def runs(tmp_path):
+    for i in range(6):
+        _dump(tmp_path, f"r{i}/params.json", {
+            "fargv_comment_lr": "--lr, -l <float>    [default: 0.1]",
+            "lr": 1 if i == 0 else 10 ** -i,
+            "mode": "eval" if i % 2 else "train",
+            "n": i,
+            "tags": ["a"] * i,
+            "train": {"bs": 32 * (i + 1)},
+        })
+    return tmp_path
+
+
+class TestRunIndex:
+    def test_scan_types_and_select(self, runs):
+        index = RunIndex(runs)
+        assert index.update() == (6, 0, 0)
+        assert index.kinds() == {"lr": "float", "mode": "str", "n": "int",
+                                 "tags": "json", "train.bs": "int"}
+        assert index.select("lr<1e-3", "mode=eval") == ["r5/params.json"]
+        assert index.select(("n", ">=", 4), "train.bs>160") == ["r5/params.json"]
+        assert index.select("tags=[]") == ["r0/params.json"]
+        assert index.diff("r1/params.json", 2) == {
+            "lr": (0.1, 0.01), "mode": ("eval", "train"), "n": (1, 2),
+            "tags": (["a"], ["a", "a"]), "train.bs": (64, 96)}
+
+    def test_incremental_update_in_place(self, runs, monkeypatch):
+        RunIndex(runs).update()
+        (runs / "r0/params.json").unlink()
+        _dump(runs, "r1/params.json", {"lr": 0.5, "n": 2.5, "extra": True}, mtime=1)
+        _dump(runs, "r7/params.json", {"lr": 0.2})
+        index = RunIndex(runs)
+        opened = []
+        real_open = open
+        monkeypatch.setattr("builtins.open", lambda f, *a, **k: opened.append(str(f)) or real_open(f, *a, **k))
+        assert index.update() == (1, 1, 1)
+        assert sorted(p for p in opened if p.endswith(".json")) == \
+            [str(runs / "r1/params.json"), str(runs / "r7/params.json")]
+        assert len(index) == 6
+        assert index.record("r1/params.json") == {"lr": 0.5, "n": 2.5, "extra": True}
+        assert index.kinds()["n"] == "float"   # widened by 2.5
+        assert index.column("extra") == [True, None, None, None, None, None]
+        assert RunIndex(runs).update() == (0, 0, 0)
+
+    def test_definition_types_columns(self, tmp_path):
+        _dump(tmp_path, "a.json", {"n": 1.0, "out": "x"})
+        index = RunIndex(tmp_path, definition={"n": 0.5, "out": fargv.FargvPath("y")})
+        index.update()
+        assert index.kinds() == {"n": "float", "out": "str"}
+
+    def test_bad_input(self, runs, capsys):
+        _dump(runs, "broken.json", {})
+        (runs / "broken.json").write_text("{nope")
+        index = RunIndex(runs)
+        index.update()
+        assert "skipping broken.json" in capsys.readouterr().err
+        with pytest.raises(fargv.FargvError):
+            index.select("missing=1")
+        with pytest.raises(fargv.FargvError):
+            index.select("n<lots")
+        with pytest.raises(fargv.FargvError):
+            parse_condition("just-a-name")
+
+    def test_stored_index_is_data_only(self, runs, capsys):
+        import pickle
+        marker = runs / "pwned"
+
+        class Payload:
+            def __reduce__(self):
+                return os.mkdir, (str(marker),)
+
+        (runs / ".fargv_index").write_bytes(pickle.dumps({"version": 2, "x": Payload()}))
+        assert RunIndex(runs).update() == (6, 0, 0)
+        assert not marker.exists()
+        assert "rebuilding" in capsys.readouterr().err
+        stored = json.loads((runs / ".fargv_index").read_text())
+        stored["columns"]["n"]["data"] = stored["columns"]["n"]["data"][:8]   # truncated
+        (runs / ".fargv_index").write_text(json.dumps(stored))
+        assert len(RunIndex(runs)) == 0
+        assert RunIndex(runs).update() == (6, 0, 0)
+
+    def test_cli(self, runs, capsys):
+        assert main([str(runs), "select", "mode!=eval", "n>0"]) == 0
+        assert capsys.readouterr().out.split() == ["r2/params.json", "r4/params.json"]
+        assert main([str(runs), "diff", "r2/params.json", "r4/params.json"]) == 0
+        assert "n: 2 -> 4" in capsys.readouterr().out
+        assert main([str(runs), "frobnicate"]) == 2
@@ -0,0 +1,100 @@
+import json
+import os
+import time
+
+import pytest
+
+import fargv
+from fargv.launch import TaskResult, run_sweep
+
+
+def _scale(lr: float = 0.1, bs: int = 1):
+    if bs == 3:
+        raise RuntimeError("bs=3 is cursed")
+    return lr * bs
+
+
+def _echo(pattern: str = ""):
+    return pattern
+
+
+def _crash_first(bs: int = 0):
+    if bs == 0:
+        os._exit(3)
+    time.sleep(0.05)
+    return bs
+
+
+def _where(bs: int = 0):
+    return sorted(os.sched_getaffinity(0))
+
+
+ARGV = ["prog", "--lr=[1,2]", "--bs=range(1,5)"]
+
+
+class TestParseAndLaunchJobs:
+    def test_without_jobs_calls_once(self):
+        assert fargv.parse_and_launch(_scale, ["prog", "--bs=2"]) == pytest.approx(0.2)
+
+    def test_serial_sweep_isolates_failures(self, capsys):
+        results = fargv.parse_and_launch(_scale, ARGV, jobs=1)
+        assert [r.index for r in results] == list(range(8))
+        assert [r.ok for r in results] == [True, True, False, True] * 2
+        assert results[1].value == 2.0
+        assert "cursed" in results[2].error
+        assert "2 of 8 tasks failed" in capsys.readouterr().err
+
+    def test_process_pool_and_jsonl_sink(self, tmp_path):
+        sink = tmp_path / "runs.jsonl"
+        results = fargv.parse_and_launch(_scale, ARGV + ["--fargv_jobs=3", f"--fargv_results={sink}"])
+        assert [r.index for r in results] == list(range(8))
+        rows = [json.loads(line) for line in sink.read_text().splitlines()]
+        assert [row["index"] for row in rows] == list(range(8))
+        assert rows[7] == {**rows[7], "params": {"lr": "2", "bs": "4"}, "ok": True, "result": 8.0}
+        assert len({r.pid for r in results}) >= 1 and all(r.pid != os.getpid() for r in results)
+
+    def test_thread_pool_unordered(self):
+        results = fargv.parse_and_launch(_scale, ARGV, jobs=4, executor="thread", ordered=False)
+        assert sorted(r.index for r in results) == list(range(8))
+        assert sum(r.ok for r in results) == 6
+
+    def test_parse_errors_are_task_failures(self):
+        results = fargv.parse_and_launch(_scale, ["prog", "--bs=[1,x]"], jobs=1)
+        assert [r.ok for r in results] == [True, False]
+
+    def test_dead_worker_does_not_sink_the_sweep(self):
+        results = fargv.parse_and_launch(_crash_first, ["prog", "--bs=range(0,8)"], jobs=2)
+        assert len(results) == 8
+        assert not results[0].ok
+        assert results[-1].ok and results[-1].value == 7
+
+    @pytest.mark.skipif(not hasattr(os, "sched_setaffinity"), reason="Linux only")
+    def test_cpu_affinity(self):
+        cpu = min(os.sched_getaffinity(0))
+        results = fargv.parse_and_launch(_where, ["prog", "--bs=[1,2]"], jobs=2,
+                                         cpu_affinity=[[cpu]])
+        assert [r.value for r in results] == [[cpu], [cpu]]
+
+    def test_task_index_runs_one_configuration(self):
+        results = fargv.parse_and_launch(_scale, ARGV + ["--fargv_task_index=7"], jobs=1)
+        assert [(r.index, r.value) for r in results] == [(7, 8.0)]
+
+    def test_task_index_without_jobs_calls_once(self):
+        assert fargv.parse_and_launch(_scale, ARGV + ["--fargv_task_index=7"]) == pytest.approx(8.0)
+
+    def test_slurm_index_alone_leaves_literal_values_alone(self, monkeypatch):
+        monkeypatch.setenv("SLURM_ARRAY_TASK_ID", "3")
+        assert fargv.parse_and_launch(_echo, ["prog", "--pattern=[abc]"]) == "[abc]"
+        assert fargv.parse_and_launch(_echo, ["prog", "--pattern=[a,b,c,d,e]"]) == "[a,b,c,d,e]"
+        assert fargv.parse_and_launch(_scale, ["prog", "--bs=2"]) == pytest.approx(0.2)
+        assert fargv.parse_and_launch(_scale, ARGV + ["--fargv_task_index=5"]) == pytest.approx(4.0)
+
+
+class TestRunSweep:
+    def test_bad_executor(self):
+        with pytest.raises(fargv.FargvError):
+            run_sweep(_scale, fargv.sweep(_scale, ARGV), jobs=2, executor="gpu")
+
+    def test_task_result_json(self):
+        line = TaskResult(3, {"bs": "2"}, value=object()).to_json()
+        assert json.loads(line)["ok"] is True
@@ -0,0 +1,207 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+import fargv
+from fargv.digest import canonical_bytes, digest
+from fargv.memo import MemoCache
+
+CALLS = []
+
+
+def _double(n: int = 1, src=fargv.FargvPath("in.txt")):
+    CALLS.append(n)
+    return {"n": n * 2, "src": str(src)}
+
+
+def _write(n: int = 1, out=fargv.FargvOutputStream(sys.stderr)):
+    CALLS.append(n)
+    return n
+
+
+@pytest.fixture(autouse=True)
+def _reset(monkeypatch):
+    CALLS.clear()
+    monkeypatch.delenv("FARGV_MEMO", raising=False)
+
+
+class TestCanonicalEncoding:
+    def test_order_path_and_float_spelling_do_not_matter(self):
+        a = {"lr": float("1e-1"), "src": Path("/data/x"), "k": [1, 2]}
+        b = {"k": (1, 2), "src": "/data/x", "lr": 0.1}
+        assert canonical_bytes(a) == canonical_bytes(b)
+
+    def test_types_are_distinguished(self):
+        assert len({digest(v) for v in (1, 1.0, "1", True, [1], None)}) == 6
+
+    def test_content_mode_follows_file_content(self, tmp_path):
+        f = tmp_path / "x.txt"
+        f.write_text("one")
+        before = digest(f, paths="content")
+        assert digest(f) == digest(str(f))
+        f.write_text("two!")
+        assert digest(f, paths="content") != before
+
+    def test_content_mode_follows_variadic_list_file(self, tmp_path):
+        from fargv.parameters.collection import VariadicSource
+        listing = tmp_path / "files.txt"
+        listing.write_text("a\nb\n")
+        source = VariadicSource([f"@{listing}", "c"])
+        before = digest(source, paths="content")
+        listing.write_text("a\nb\nd\n")
+        assert digest(source, paths="content") != before
+        assert digest(source) == digest([f"@{listing}", "c"])
+
+    def test_large_buffers_are_streamed(self, tmp_path):
+        import hashlib
+        import mmap
+        data = bytes(range(256)) * 10_000   # > 2 chunks
+        f = tmp_path / "blob.bin"
+        f.write_bytes(data)
+        with open(f, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                assert digest({"w": view}) == digest({"w": data}) == \
+                    hashlib.sha256(canonical_bytes({"w": data})).hexdigest()
+            finally:
+                view.release()
+
+    def test_mapped_input_is_hashed_by_path_and_identity(self, tmp_path):
+        from fargv.parameters import FargvBinaryInput
+        f = tmp_path / "weights.bin"
+        f.write_bytes(b"w" * 100_000)
+        first, second = FargvBinaryInput(mmap=True), FargvBinaryInput(mmap=True)
+        first.ingest_value_strings(str(f))
+        second.ingest_value_strings(str(f))
+        encoded = canonical_bytes(first.value)
+        assert encoded.startswith(b"m") and len(encoded) < 200
+        assert digest(first.value) == digest(second.value)
+        assert digest(first.value, paths="content") != digest(first.value)
+        assert digest(first.value[:10]) == digest(b"w" * 10)   # a slice is just bytes
+
+    def test_content_cache_is_bounded(self, tmp_path, monkeypatch):
+        from fargv import digest as digest_mod
+        monkeypatch.setattr(digest_mod, "CONTENT_CACHE_SIZE", 2)
+        monkeypatch.setattr(digest_mod, "_content_cache", type(digest_mod._content_cache)())
+        for i in range(3):
+            f = tmp_path / f"{i}.txt"
+            f.write_text(str(i))
+            digest(f, paths="content")
+        assert len(digest_mod._content_cache) == 2
+
+    def test_unencodable(self):
+        with pytest.raises(TypeError):
+            canonical_bytes(object())
+
+
+class TestMemoCache:
+    def test_hit_skips_call(self, tmp_path):
+        argv = ["prog", "--n=3"]
+        first = fargv.parse_and_launch(_double, argv, memo=str(tmp_path))
+        second = fargv.parse_and_launch(_double, argv, memo=str(tmp_path))
+        assert first == second == {"n": 6, "src": "in.txt"}
+        assert CALLS == [3]
+        fargv.parse_and_launch(_double, ["prog", "--n=4"], memo=str(tmp_path))
+        assert CALLS == [3, 4]
+
+    def test_cli_flag_and_env(self, tmp_path, monkeypatch):
+        fargv.parse_and_launch(_double, ["prog", f"--fargv_memo={tmp_path}"])
+        monkeypatch.setenv("FARGV_MEMO", str(tmp_path))
+        fargv.parse_and_launch(_double, ["prog"])
+        assert CALLS == [1]
+        fargv.parse_and_launch(_double, ["prog"], memo=False)
+        assert CALLS == [1, 1]
+
+    def test_content_mode_invalidates_on_edit(self, tmp_path):
+        src = tmp_path / "in.txt"
+        src.write_text("a")
+        argv = ["prog", f"--src={src}"]
+        cache = str(tmp_path / "memo")
+        fargv.parse_and_launch(_double, argv, memo=cache, memo_paths="content")
+        fargv.parse_and_launch(_double, argv, memo=cache, memo_paths="content")
+        src.write_text("bb")
+        fargv.parse_and_launch(_double, argv, memo=cache, memo_paths="content")
+        assert CALLS == [1, 1]
+
+    def test_writable_stream_is_not_memoised(self, tmp_path, capsys):
+        for name in ("a.txt", "b.txt"):
+            fargv.parse_and_launch(_write, ["prog", f"--out={tmp_path / name}"],
+                                   memo=str(tmp_path / "memo"))
+        assert CALLS == [1, 1]
+        assert "writable stream" in capsys.readouterr().err
+
+    def test_lru_eviction(self, tmp_path):
+        cache = MemoCache(tmp_path, max_bytes=13_000)
+        blob = b"x" * 4000
+        for i in range(3):
+            key = f"{i:02d}" + "0" * 62
+            cache.put(key, blob)
+            os.utime(cache._entry(key), ns=(i * 10**9, i * 10**9))
+        cache.get("00" + "0" * 62)   # refreshes entry 0
+        cache.put("99" + "0" * 62, blob)
+        assert cache.get("00" + "0" * 62)[0]
+        assert not cache.get("01" + "0" * 62)[0]
+
+    def test_eviction_scans_are_amortised(self, tmp_path, monkeypatch):
+        from fargv import memo
+        scans = []
+        real_evict = MemoCache.evict
+        monkeypatch.setattr(MemoCache, "evict", lambda self: scans.append(1) or real_evict(self))
+        cache = MemoCache(tmp_path, max_bytes=1 << 20)
+        for i in range(memo.SCAN_EVERY + 1):
+            cache.put(f"{i:064x}", i)
+        assert len(scans) == 2   # the first store, then the periodic scan
+        MemoCache(tmp_path, max_bytes=1).put("f" * 64, b"x" * 100)   # over the estimate
+        assert len(scans) == 3
+        assert list(tmp_path.glob("*/*.pkl")) == []
+
+    def test_corrupt_entry_is_discarded(self, tmp_path):
+        cache = MemoCache(tmp_path)
+        key = "ab" * 32
+        cache._entry(key).parent.mkdir(parents=True)
+        cache._entry(key).write_bytes(b"not a pickle")
+        assert cache.get(key) == (False, None)
+        assert not cache._entry(key).exists()
+
+    def test_sweep_tasks_are_memoised(self, tmp_path):
+        argv = ["prog", "--n=[1,2]", f"--fargv_memo={tmp_path}"]
+        fargv.parse_and_launch(_double, argv, jobs=1)
+        results = fargv.parse_and_launch(_double, argv, jobs=1)
+        assert [r.value["n"] for r in results] == [2, 4]
+        assert CALLS == [1, 2]
+
+
+class TestResultDigest:
+    DEFINITION = {"lr": 0.1, "src": fargv.FargvPath("in.txt"), "tags": ["a"]}
+
+    def test_return_types_agree(self):
+        argv = ["prog", "--lr=1e-1"]
+        digests = {fargv.result_digest(fargv.parse(self.DEFINITION, argv, return_type=rt)[0])
+                   for rt in ("SimpleNamespace", "dict", "namedtuple", "namespace")}
+        assert len(digests) == 1
+
+    def test_filter_out_params_are_ignored(self):
+        parser = fargv.ArgumentParser()
+        parser._add_parameter(fargv.FargvInt(3, name="n"))
+        bare = parser.result_digest()
+        parser._add_parameter(fargv.FargvHelp(parser))
+        assert parser.result_digest() == bare == fargv.result_digest({"n": 3})
+
+    def test_namespace_rehashes_only_changed_keys(self, monkeypatch):
+        import fargv.digest as fd
+        p, _ = fargv.parse(self.DEFINITION, ["prog"], return_type="namespace")
+        before = p.result_digest()
+        hashed = []
+        real = fd.key_digest
+        monkeypatch.setattr(fd, "key_digest", lambda n, v, paths="path": hashed.append(n) or real(n, v, paths))
+        p.lr = 0.5
+        after = p.result_digest()
+        assert "lr" in hashed and "src" not in hashed
+        assert after != before == fargv.result_digest({**p.as_dict(), "lr": 0.1})
+        assert after == fargv.result_digest(p.as_dict())
+
+    def test_unsupported_result(self):
+        with pytest.raises(TypeError):
+            fargv.result_digest(42)
@@ -0,0 +1,712 @@
+import json
+import os
+import time
+
+import pytest
+
+from fargv.namespace import (
+    FargvBackend, FargvConfigBackend, FargvNamespace, FargvSharedMemoryBackend,
+    FargvSqliteBackend, FargvWatchBackend,
+)
+from fargv.parameters import FargvBool, FargvError, FargvFloat, FargvInt, FargvStr, FargvVariadic
+
+
+def _make_namespace():
+    return FargvNamespace({
+        "lr":     FargvFloat(0.001, name="lr"),
+        "epochs": FargvInt(10, name="epochs"),
+    })
+
+
+class _Recorder(FargvBackend):
+    def __init__(self):
+        self.single = []
+        self.batches = []
+
+    def attach(self, namespace):
+        pass
+
+    def on_param_changed(self, namespace, name, value):
+        self.single.append((name, value))
+
+    def on_params_changed(self, namespace, changes):
+        self.batches.append(dict(changes))
+
+
+# ---------------------------------------------------------------------------
+# FargvNamespace.batch
+# ---------------------------------------------------------------------------
+
+class TestNamespaceBatch:
+    def test_backends_notified_once_with_dirty_keys(self):
+        ns, rec = _make_namespace(), _Recorder()
+        ns.link(rec)
+        with ns.batch():
+            ns.lr = 0.1
+            ns.lr = 0.2
+            ns.epochs = 5
+        assert rec.single == []
+        assert rec.batches == [{"lr": 0.2, "epochs": 5}]
+
+    def test_nested_batches_notify_on_outermost_exit(self):
+        ns, rec = _make_namespace(), _Recorder()
+        ns.link(rec)
+        with ns.batch():
+            with ns.batch():
+                ns.lr = 0.1
+            assert rec.batches == []
+            ns.epochs = 3
+        assert rec.batches == [{"lr": 0.1, "epochs": 3}]
+
+    def test_empty_batch_does_not_notify(self):
+        ns, rec = _make_namespace(), _Recorder()
+        ns.link(rec)
+        with ns.batch():
+            pass
+        assert rec.batches == []
+
+    def test_exception_rolls_back(self):
+        ns, rec = _make_namespace(), _Recorder()
+        ns.link(rec)
+        with pytest.raises(RuntimeError):
+            with ns.batch():
+                ns.lr = 0.5
+                raise RuntimeError("boom")
+        assert ns.lr == pytest.approx(0.001)
+        assert rec.batches == []
+
+    def test_default_hook_falls_back_to_per_key(self):
+        class PerKey(FargvBackend):
+            def __init__(self):
+                self.seen = []
+
+            def attach(self, namespace):
+                pass
+
+            def on_param_changed(self, namespace, name, value):
+                self.seen.append(name)
+
+        ns, backend = _make_namespace(), PerKey()
+        ns.link(backend)
+        with ns.batch():
+            ns.lr = 0.1
+            ns.epochs = 2
+        assert backend.seen == ["lr", "epochs"]
+
+
+# ---------------------------------------------------------------------------
+# FargvConfigBackend writes
+# ---------------------------------------------------------------------------
+
+class TestConfigBackendWrites:
+    def test_batch_writes_file_once(self, tmp_path, monkeypatch):
+        import fargv.namespace as ns_mod
+        writes = []
+        real = ns_mod._atomic_write_text
+        monkeypatch.setattr(ns_mod, "_atomic_write_text",
+                            lambda p, t: writes.append(p) or real(p, t))
+        cfg = tmp_path / "cfg.json"
+        ns = _make_namespace()
+        ns.link(FargvConfigBackend(cfg))
+        with ns.batch():
+            ns.lr = 0.1
+            ns.epochs = 50
+        assert len(writes) == 1
+        assert json.loads(cfg.read_text()) == {"lr": 0.1, "epochs": 50}
+
+    def test_write_is_atomic(self, tmp_path, monkeypatch):
+        cfg = tmp_path / "cfg.json"
+        cfg.write_text(json.dumps({"lr": 0.3, "epochs": 1}))
+        ns = _make_namespace()
+        ns.link(FargvConfigBackend(cfg))
+
+        def crash(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "replace", crash)
+        ns.lr = 0.9
+        assert json.loads(cfg.read_text()) == {"lr": 0.3, "epochs": 1}
+        assert [p.name for p in tmp_path.iterdir()] == ["cfg.json"]
+
+    def test_debounced_writes_coalesce(self, tmp_path):
+        cfg = tmp_path / "cfg.json"
+        backend = FargvConfigBackend(cfg, debounce=0.05)
+        ns = _make_namespace()
+        ns.link(backend)
+        for i in range(20):
+            ns.epochs = i
+        assert not cfg.exists()
+        deadline = time.monotonic() + 5
+        while not cfg.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert json.loads(cfg.read_text())["epochs"] == 19
+
+    def test_flush_writes_pending_change(self, tmp_path):
+        cfg = tmp_path / "cfg.json"
+        backend = FargvConfigBackend(cfg, debounce=60)
+        ns = _make_namespace()
+        ns.link(backend)
+        ns.lr = 0.25
+        backend.flush()
+        assert json.loads(cfg.read_text())["lr"] == pytest.approx(0.25)
+
+    def test_close_flushes_and_releases_exit_hook(self, tmp_path):
+        import gc
+        import weakref
+        cfg = tmp_path / "cfg.json"
+        backend = FargvConfigBackend(cfg, debounce=60)
+        ns = _make_namespace()
+        ns.link(backend)
+        ns.lr = 0.5
+        backend.close()
+        assert json.loads(cfg.read_text())["lr"] == pytest.approx(0.5)
+        ref = weakref.ref(backend)
+        del ns, backend
+        gc.collect()
+        assert ref() is None
+
+
+# ---------------------------------------------------------------------------
+# FargvWatchBackend hot reload
+# ---------------------------------------------------------------------------
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+def _replace_json(path, data):
+    tmp = path.with_name(path.name + ".new")
+    tmp.write_text(json.dumps(data))
+    os.replace(tmp, path)
+
+
+@pytest.fixture(params=[None, False], ids=["auto", "polling"])
+def watched(request, tmp_path):
+    cfg = tmp_path / "live.json"
+    cfg.write_text(json.dumps({"lr": 0.5}))
+    ns, rec = _make_namespace(), _Recorder()
+    ns.link(rec)
+    backend = FargvWatchBackend(cfg, debounce=0.05, poll_interval=0.02,
+                                use_inotify=request.param)
+    ns.link(backend)
+    yield cfg, ns, rec, backend
+    backend.close()
+
+
+class TestWatchBackend:
+    def test_initial_values_loaded(self, watched):
+        cfg, ns, rec, backend = watched
+        assert ns.lr == pytest.approx(0.5)
+
+    def test_edit_is_applied_and_notified(self, watched):
+        cfg, ns, rec, backend = watched
+        rec.batches.clear()
+        _replace_json(cfg, {"lr": 0.5, "epochs": 42})
+        assert _wait_for(lambda: ns.epochs == 42)
+        assert rec.batches == [{"epochs": 42}]
+
+    def test_invalid_update_rejected_atomically(self, watched, capsys):
+        cfg, ns, rec, backend = watched
+        rec.batches.clear()
+        _replace_json(cfg, {"lr": 0.9, "epochs": "not-an-int"})
+        assert _wait_for(lambda: "ignoring update" in capsys.readouterr().err)
+        assert ns.lr == pytest.approx(0.5)
+        assert ns.epochs == 10
+        assert rec.batches == []
+
+    def test_unknown_key_rejected(self, watched):
+        cfg, ns, rec, backend = watched
+        _replace_json(cfg, {"lr": 0.7, "ghost": 1})
+        assert backend.reload() is False
+        assert ns.lr == pytest.approx(0.5)
+
+    def test_failed_reload_rolls_back_during_another_threads_batch(self, tmp_path):
+        import threading
+        cfg = tmp_path / "live.json"
+        cfg.write_text(json.dumps({"lr": 0.5}))
+        ns = _make_namespace()
+        backend = FargvWatchBackend(cfg, poll_interval=60, use_inotify=False)
+        ns.link(backend)
+        try:
+            _replace_json(cfg, {"lr": 0.9, "epochs": "not-an-int"})
+            outcome = []
+            reloader = threading.Thread(target=lambda: outcome.append(backend.reload()))
+            with ns.batch():
+                ns.epochs = 3
+                reloader.start()
+                reloader.join(0.2)     # blocked until this batch exits
+            reloader.join(5)
+            assert outcome == [False]
+            assert ns.lr == pytest.approx(0.5)
+            assert ns.epochs == 3
+        finally:
+            backend.close()
+
+    def test_polling_fallback_without_inotify(self, tmp_path):
+        cfg = tmp_path / "live.json"
+        cfg.write_text("{}")
+        backend = FargvWatchBackend(cfg, use_inotify=False)
+        _make_namespace().link(backend)
+        try:
+            assert backend.uses_inotify is False
+        finally:
+            backend.close()
+
+
+# ---------------------------------------------------------------------------
+# FargvSqliteBackend
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def sqlite_pair(tmp_path):
+    db = tmp_path / "shared.db"
+    backends = []
+
+    def make(name="default"):
+        ns, backend = _make_namespace(), FargvSqliteBackend(db, namespace=name)
+        ns.link(backend)
+        backends.append(backend)
+        return ns, backend
+
+    yield make
+    for backend in backends:
+        backend.close()
+
+
+class TestSqliteBackend:
+    def test_wal_mode(self, sqlite_pair):
+        _, backend = sqlite_pair()
+        assert backend._conn().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_change_visible_to_other_process_after_poll(self, sqlite_pair):
+        a, _ = sqlite_pair()
+        b, b_backend = sqlite_pair()
+        a.lr = 0.25
+        assert b.lr == pytest.approx(0.001)
+        assert b_backend.poll() is True
+        assert b.lr == pytest.approx(0.25)
+        assert b_backend.poll() is False
+
+    def test_late_attach_loads_stored_values(self, sqlite_pair):
+        a, _ = sqlite_pair()
+        a.epochs = 77
+        b, _ = sqlite_pair()
+        assert b.epochs == 77
+
+    def test_poll_notifies_other_backends_not_itself(self, sqlite_pair):
+        a, _ = sqlite_pair()
+        b, b_backend = sqlite_pair()
+        rec = _Recorder()
+        b.link(rec)
+        version = b_backend.version
+        a.epochs = 3
+        b_backend.poll()
+        assert rec.batches == [{"epochs": 3}]
+        assert b_backend.version > version
+        assert b_backend.poll() is False    # no echo write from b
+
+    def test_async_delivery_of_a_poll_is_not_written_back(self, sqlite_pair):
+        a, _ = sqlite_pair()
+        b, b_backend = sqlite_pair()
+        dispatcher = b.notify_async()
+        a.epochs = 3
+        assert b_backend.poll() is True
+        assert dispatcher.flush(5)
+        assert b_backend.poll() is False    # no echo write from the worker thread
+        b.epochs = 4                        # a later local change still goes through
+        assert dispatcher.flush(5)
+        a_backend = object.__getattribute__(a, "_backends")[0]
+        assert a_backend.poll() is True and a.epochs == 4
+        dispatcher.close()
+
+    def test_named_namespaces_are_independent(self, sqlite_pair):
+        a, _ = sqlite_pair("job1")
+        b, b_backend = sqlite_pair("job2")
+        a.lr = 0.5
+        assert b_backend.poll() is False
+        assert b.lr == pytest.approx(0.001)
+
+    def test_invalid_remote_value_rejected(self, sqlite_pair, capsys):
+        a, a_backend = sqlite_pair()
+        b, b_backend = sqlite_pair()
+        a_backend.on_params_changed(a, {"lr": 0.3, "epochs": "lots"})
+        b_backend.poll()
+        assert b.lr == pytest.approx(0.001) and b.epochs == 10
+        assert "ignoring update" in capsys.readouterr().err
+
+    def test_rejected_poll_rolls_back_during_another_threads_batch(self, sqlite_pair):
+        import threading
+        a, a_backend = sqlite_pair()
+        b, b_backend = sqlite_pair()
+        a_backend.on_params_changed(a, {"lr": 0.3, "epochs": "lots"})
+        poller = threading.Thread(target=b_backend.poll)
+        with b.batch():
+            b.epochs = 4
+            poller.start()
+            poller.join(0.2)
+        poller.join(5)
+        assert b.lr == pytest.approx(0.001) and b.epochs == 4
+
+    def test_concurrent_writers_lose_no_keys(self, tmp_path):
+        import threading
+        db = tmp_path / "shared.db"
+        names = [f"k{i}" for i in range(8)]
+
+        def worker(name):
+            ns = FargvNamespace({n: FargvInt(0, name=n) for n in names})
+            backend = FargvSqliteBackend(db)
+            ns.link(backend)
+            for i in range(1, 21):
+                setattr(ns, name, i)
+            backend.close()
+
+        FargvSqliteBackend(db).attach(FargvNamespace({n: FargvInt(0, name=n) for n in names}))
+        threads = [threading.Thread(target=worker, args=(n,)) for n in names]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        reader = FargvNamespace({n: FargvInt(0, name=n) for n in names})
+        backend = FargvSqliteBackend(db)
+        reader.link(backend)
+        assert reader.as_dict() == {n: 20 for n in names}
+        backend.close()
+
+    def test_background_polling(self, tmp_path):
+        db = tmp_path / "shared.db"
+        a, b = _make_namespace(), _make_namespace()
+        a_backend = FargvSqliteBackend(db)
+        b_backend = FargvSqliteBackend(db, poll_interval=0.02)
+        a.link(a_backend)
+        b.link(b_backend)
+        try:
+            a.epochs = 12
+            assert _wait_for(lambda: b.epochs == 12)
+        finally:
+            b_backend.close()
+            a_backend.close()
+
+
+# ---------------------------------------------------------------------------
+# FargvSharedMemoryBackend
+# ---------------------------------------------------------------------------
+
+def _make_scalar_namespace():
+    return FargvNamespace({
+        "lr":    FargvFloat(0.001, name="lr"),
+        "steps": FargvInt(10, name="steps"),
+        "debug": FargvBool(False, name="debug"),
+        "tag":   FargvStr("run", name="tag"),
+        "files": FargvVariadic([], name="files"),
+    })
+
+
+@pytest.fixture
+def shared_ns():
+    ns, backend = _make_scalar_namespace(), FargvSharedMemoryBackend(str_size=16)
+    ns.link(backend)
+    yield ns, backend
+    backend.close()
+
+
+def _worker_loop(ns, conn):
+    # Report lr whenever it changes; stop when the parent sets steps to 0.
+    last = None
+    while ns.steps != 0:
+        if ns.lr != last:
+            last = ns.lr
+            conn.send((ns.lr, ns.tag, ns.debug))
+        time.sleep(0.001)
+    conn.close()
+
+
+class TestSharedMemoryBackend:
+    def test_only_scalars_are_shared(self, shared_ns):
+        ns, backend = shared_ns
+        assert sorted(backend.shared_names) == ["debug", "lr", "steps", "tag"]
+
+    def test_pickled_copy_sees_live_updates(self, shared_ns):
+        import pickle
+        ns, backend = shared_ns
+        copy = pickle.loads(pickle.dumps(ns))
+        ns.lr = 0.5
+        ns.tag = "résumé"
+        assert copy.lr == pytest.approx(0.5)
+        assert copy.tag == "résumé"
+        copy.steps = 3                  # writes from the copy reach the parent too
+        assert ns.steps == 3
+        object.__getattribute__(copy, "_shared").close()
+
+    def test_process_local_backends_not_pickled(self, shared_ns, tmp_path):
+        import pickle
+        ns, _ = shared_ns
+        ns.link(FargvConfigBackend(tmp_path / "cfg.json", debounce=10))
+        copy = pickle.loads(pickle.dumps(ns))
+        backends = object.__getattribute__(copy, "_backends")
+        assert [type(b).__name__ for b in backends] == ["FargvSharedMemoryBackend"]
+        object.__getattribute__(copy, "_shared").close()
+
+    def test_close_releases_exit_hook(self):
+        import gc
+        import weakref
+        backend = FargvSharedMemoryBackend()
+        ns = FargvNamespace({"lr": FargvFloat(0.1, name="lr")})
+        ns.link(backend)
+        backend.close()
+        ref = weakref.ref(backend)
+        del ns, backend
+        gc.collect()
+        assert ref() is None
+
+    def test_validation_still_applies(self, shared_ns):
+        ns, _ = shared_ns
+        with pytest.raises(Exception):
+            ns.steps = "many"
+        assert ns.steps == 10
+
+    def test_oversized_string_rejected(self, shared_ns):
+        ns, _ = shared_ns
+        with pytest.raises(FargvError, match="shared slot"):
+            ns.tag = "x" * 17
+
+    def test_worker_process_sees_updates(self, shared_ns):
+        import multiprocessing as mp
+        if "fork" not in mp.get_all_start_methods():
+            pytest.skip("needs the fork start method")
+        ctx = mp.get_context("fork")
+        ns, _ = shared_ns
+        parent_end, child_end = ctx.Pipe()
+        proc = ctx.Process(target=_worker_loop, args=(ns, child_end))
+        proc.start()
+        try:
+            assert parent_end.poll(5)
+            assert parent_end.recv() == (pytest.approx(0.001), "run", False)
+            with ns.batch():
+                ns.tag = "live"
+                ns.debug = True
+                ns.lr = 0.25
+            assert parent_end.poll(5)
+            assert parent_end.recv() == (pytest.approx(0.25), "live", True)
+        finally:
+            ns.steps = 0
+            proc.join(5)
+        assert proc.exitcode == 0
+
+
+# ---------------------------------------------------------------------------
+# Asynchronous notification
+# ---------------------------------------------------------------------------
+
+class _SlowRecorder(_Recorder):
+    def __init__(self, gate):
+        super().__init__()
+        self.gate = gate
+
+    def on_param_changed(self, namespace, name, value):
+        self.gate.wait(5)
+        super().on_param_changed(namespace, name, value)
+
+    def on_params_changed(self, namespace, changes):
+        self.gate.wait(5)
+        super().on_params_changed(namespace, changes)
+
+
+class TestAsyncDispatch:
+    def test_assignment_does_not_wait_for_backend(self):
+        import threading
+        gate = threading.Event()
+        ns, rec = _make_namespace(), _SlowRecorder(gate)
+        ns.link(rec)
+        dispatcher = ns.notify_async()
+        ns.lr = 0.1
+        assert rec.single == []
+        gate.set()
+        assert dispatcher.flush(5)
+        assert rec.single == [("lr", 0.1)]
+        dispatcher.close()
+
+    def test_repeated_updates_coalesce_in_order(self):
+        import threading
+        gate = threading.Event()
+        ns, rec = _make_namespace(), _SlowRecorder(gate)
+        ns.link(rec)
+        dispatcher = ns.notify_async()
+        ns.epochs = 0                      # taken by the worker, blocks on the gate
+        assert _wait_for(lambda: dispatcher.metrics["depth"] == 0)
+        for i in range(1, 100):
+            ns.epochs = i
+        ns.lr = 0.5
+        gate.set()
+        dispatcher.flush(5)
+        assert rec.single == [("epochs", 0)]
+        assert rec.batches == [{"epochs": 99, "lr": 0.5}]
+        assert dispatcher.metrics["coalesced"] == 99
+        dispatcher.close()
+
+    def test_without_coalescing_every_update_is_delivered(self):
+        ns, rec = _make_namespace(), _Recorder()
+        ns.link(rec)
+        dispatcher = ns.notify_async(coalesce=False)
+        for i in range(50):
+            ns.epochs = i
+        dispatcher.flush(5)
+        assert rec.single == [("epochs", i) for i in range(50)]
+        dispatcher.close()
+
+    def test_slow_backend_does_not_block_fast_one(self):
+        import threading
+        gate = threading.Event()
+        ns, slow, fast = _make_namespace(), _SlowRecorder(gate), _Recorder()
+        ns.link(slow).link(fast)
+        dispatcher = ns.notify_async()
+        ns.lr = 0.3
+        assert _wait_for(lambda: fast.single == [("lr", 0.3)])
+        assert slow.single == []
+        gate.set()
+        dispatcher.close()
+        assert slow.single == [("lr", 0.3)]
+
+    def test_metrics_and_error_surface_on_flush(self):
+        class Broken(_Recorder):
+            def on_param_changed(self, namespace, name, value):
+                raise RuntimeError("backend down")
+
+        ns = _make_namespace()
+        ns.link(Broken())
+        dispatcher = ns.notify_async()
+        ns.lr = 0.2
+        with pytest.raises(RuntimeError, match="backend down"):
+            dispatcher.flush(5)
+        metrics = dispatcher.metrics
+        assert metrics["errors"] == 1 and metrics["delivered"] == 1
+        assert metrics["depth"] == 0 and metrics["max_latency"] >= 0
+        dispatcher.close()
+
+    def test_close_restores_synchronous_notification(self):
+        ns, rec = _make_namespace(), _Recorder()
+        ns.link(rec)
+        ns.notify_async().close()
+        ns.lr = 0.4
+        assert rec.single == [("lr", 0.4)]
+
+
+# ---------------------------------------------------------------------------
+# FargvSocketBackend + fargv.ctl
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def control(tmp_path):
+    import tempfile
+    from fargv.namespace import FargvSocketBackend
+    # AF_UNIX paths are length-limited; tmp_path can be too long.
+    sock_dir = tempfile.mkdtemp(prefix="fargv")
+    path = os.path.join(sock_dir, "ctl.sock")
+    ns, rec = _make_namespace(), _Recorder()
+    backend = FargvSocketBackend(path)
+    ns.link(rec).link(backend)
+    yield path, ns, rec
+    backend.close()
+    os.rmdir(sock_dir)
+
+
+class TestSocketBackend:
+    def test_socket_is_private(self, control):
+        import stat
+        path, _, _ = control
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+    def test_refuses_to_replace_a_regular_file(self, tmp_path):
+        from fargv.namespace import FargvSocketBackend
+        path = tmp_path / "ctl.sock"
+        path.write_text("precious")
+        with pytest.raises(OSError, match="not a socket"):
+            _make_namespace().link(FargvSocketBackend(path))
+        assert path.read_text() == "precious"
+
+    def test_replaces_own_stale_socket(self):
+        import socket
+        import tempfile
+        from fargv.namespace import FargvSocketBackend
+        sock_dir = tempfile.mkdtemp(prefix="fargv")
+        path = os.path.join(sock_dir, "ctl.sock")
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(path)
+        stale.close()
+        backend = FargvSocketBackend(path)
+        _make_namespace().link(backend)
+        backend.close()
+        os.rmdir(sock_dir)
+
+    def test_list_and_get(self, control):
+        from fargv.ctl import request
+        path, ns, _ = control
+        assert request(path, {"op": "list"}) == {"ok": True, "values": {"lr": 0.001, "epochs": 10}}
+        assert request(path, {"op": "get", "name": "epochs"}) == {"ok": True, "value": 10}
+        assert request(path, {"op": "get", "name": "nope"})["ok"] is False
+
+    def test_set_validates_and_notifies_once(self, control):
+        from fargv.ctl import request
+        path, ns, rec = control
+        response = request(path, {"op": "set", "values": {"lr": "1e-4", "epochs": "7"}})
+        assert response == {"ok": True, "values": {"lr": 0.0001, "epochs": 7}}
+        assert ns.epochs == 7
+        assert rec.batches == [{"lr": 0.0001, "epochs": 7}]
+
+    def test_invalid_set_applies_nothing(self, control):
+        from fargv.ctl import request
+        path, ns, rec = control
+        response = request(path, {"op": "set", "values": {"lr": "0.5", "epochs": "many"}})
+        assert response["ok"] is False
+        assert ns.lr == pytest.approx(0.001)
+        assert rec.batches == []
+
+    def test_invalid_set_during_another_threads_batch_applies_nothing(self, control):
+        import threading
+        from fargv.ctl import request
+        path, ns, _ = control
+        responses = []
+        client = threading.Thread(target=lambda: responses.append(
+            request(path, {"op": "set", "values": {"lr": "0.5", "epochs": "many"}})))
+        with ns.batch():
+            ns.epochs = 2
+            client.start()
+            client.join(0.2)
+        client.join(5)
+        assert responses[0]["ok"] is False
+        assert ns.lr == pytest.approx(0.001) and ns.epochs == 2
+
+    def test_watch_streams_changes(self, control):
+        from fargv.ctl import watch
+        path, ns, _ = control
+        events = watch(path)
+        ns.lr = 0.5                      # before the subscription: not reported
+        first = []
+
+        def consume():
+            first.append(next(events))
+
+        import threading
+        t = threading.Thread(target=consume)
+        t.start()
+        backend = [b for b in object.__getattribute__(ns, "_backends") if hasattr(b, "_watchers")][0]
+        assert _wait_for(lambda: backend._watchers)
+        ns.epochs = 3
+        t.join(5)
+        assert first == [{"epochs": 3}]
+        events.close()
+
+    def test_cli_client(self, control, capsys):
+        from fargv.ctl import main
+        path, ns, _ = control
+        assert main([path, "set", "lr=0.02", "epochs=4"]) == 0
+        assert ns.lr == pytest.approx(0.02) and ns.epochs == 4
+        assert main([path, "get", "epochs"]) == 0
+        assert main([path, "set", "ghost=1"]) == 1
+        out, err = capsys.readouterr()
+        assert out.splitlines() == ["lr=0.02", "epochs=4", "4"]
+        assert "ghost" in err
@@ -11,7 +11,7 @@ from fargv.parameters import (
     FargvInt, FargvStr, FargvBool,
     FargvPath, FargvExistingFile, FargvNonExistingFile, FargvFile,
     FargvInputStream, FargvOutputStream,
-    FargvTuple,
+    FargvTuple, FargvVariadic,
     FargvSubcommand,
 )
 from fargv.parser import ArgumentParser
@@ -828,3 +828,78 @@ class TestSubcommandConfig:
             assert p.cmd.epochs == 20
         finally:
             os.unlink(cfg)
+
+
+# ---------------------------------------------------------------------------
+# Batched path validation
+# ---------------------------------------------------------------------------
+
+class TestPathValidationBatch:
+    def test_batched_checks_pass(self, tmp_path):
+        files = []
+        for i in range(5):
+            f = tmp_path / f"in{i}.txt"
+            f.write_text("x")
+            files.append(str(f))
+        res = parse([FargvExistingFile(name="model"), FargvFile(name="out"),
+                     FargvVariadic(name="inputs", item_path=FargvExistingFile())],
+                    [f"--model={files[0]}", f"--out={tmp_path / 'new.txt'}"] + files)
+        assert res["inputs"] == [Path(f) for f in files]
+        assert res["model"] == Path(files[0])
+
+    def test_variadic_item_failure_names_param(self, tmp_path):
+        with pytest.raises(FargvError, match="inputs.*does not exist"):
+            parse([FargvVariadic(name="inputs", item_path=FargvExistingFile())],
+                  [str(tmp_path / "missing.txt")])
+
+    def test_first_failing_check_reported(self, tmp_path):
+        with pytest.raises(FargvError, match="'a'"):
+            parse([FargvExistingFile(name="a"), FargvExistingFile(name="b")],
+                  ["--a=/nonexistent_a_xyz", "--b=/nonexistent_b_xyz"])
+
+    def test_shared_parent_statted_once(self, tmp_path, monkeypatch):
+        import fargv.parameters.path as path_mod
+        seen = []
+        real_exists = os.path.exists
+
+        def counting_exists(p):
+            seen.append(p)
+            return real_exists(p)
+        monkeypatch.setattr(path_mod.os.path, "exists", counting_exists)
+        parse([FargvVariadic(name="outs", item_path=FargvFile())],
+              [str(tmp_path / f"o{i}.txt") for i in range(10)])
+        assert seen == [str(tmp_path)]
+
+    def test_timeout_fails_fast(self, monkeypatch):
+        import threading
+        import fargv.parameters.path as path_mod
+        release = threading.Event()
+        monkeypatch.setattr(path_mod.os.path, "exists", lambda p: release.wait(5))
+        p = ArgumentParser(path_check_timeout=0.05)
+        p._add_parameter(FargvExistingFile(name="f"))
+        try:
+            with pytest.raises(FargvError, match="Timed out"):
+                p.parse(["prog", "--f=/mnt/hung/file"])
+        finally:
+            release.set()
+
+    def test_timeout_is_one_deadline_for_the_batch(self, monkeypatch):
+        import time
+        import fargv.parameters.path as path_mod
+
+        def slow_exists(p):
+            time.sleep(0.1)
+            return True
+        monkeypatch.setattr(path_mod.os.path, "exists", slow_exists)
+        # Each stat alone fits in the timeout; six of them in a row do not.
+        p = ArgumentParser(path_check_timeout=0.25, path_check_workers=1)
+        p._add_parameter(FargvVariadic(name="fs", item_path=FargvExistingFile()))
+        start = time.monotonic()
+        with pytest.raises(FargvError, match="Timed out"):
+            p.parse(["prog", "--fs"] + [f"/mnt/slow{i}/file" for i in range(6)])
+        assert time.monotonic() - start < 0.5
+
+    def test_evaluate_outside_parse_validates_immediately(self):
+        p = FargvVariadic(name="inputs", item_path=FargvExistingFile())
+        with pytest.raises(FargvError):
+            p.evaluate(["/nonexistent_path_abc_123"])
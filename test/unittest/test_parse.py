@@ -242,3 +242,86 @@ class TestUIGuard:
     def test_jupyter_available_flag(self):
         from fargv.gui_ipywidgets import available
         assert isinstance(available, bool)
+
+
+# ---------------------------------------------------------------------------
+# Response files (@args.txt)
+# ---------------------------------------------------------------------------
+
+class TestResponseFiles:
+    def test_lines_format(self, tmp_path):
+        rsp = tmp_path / "args.txt"
+        rsp.write_text("# comment\n--name=hello world\n\n--count=3\n")
+        p, _ = fargv.parse({"name": "x", "count": 0}, ["prog", f"@{rsp}"],
+                           response_files=True, auto_define_config=False)
+        assert p.name == "hello world"
+        assert p.count == 3
+
+    def test_shell_format_and_nesting(self, tmp_path):
+        inner = tmp_path / "inner.txt"
+        inner.write_text("--count=7  # trailing comment\n")
+        outer = tmp_path / "outer.txt"
+        outer.write_text(f"--name='a b' @{inner}\n")
+        parser = ArgumentParser(response_files=True, response_file_format="shell")
+        parser._add_parameter(FargvStr("x", name="name"))
+        parser._add_parameter(FargvInt(0, name="count"))
+        res = parser.parse(["prog", f"@{outer}"])
+        assert res == {"name": "a b", "count": 7}
+
+    def test_cycle_detected(self, tmp_path):
+        a, b = tmp_path / "a.txt", tmp_path / "b.txt"
+        a.write_text(f"@{b}\n")
+        b.write_text(f"@{a}\n")
+        parser = ArgumentParser(response_files=True)
+        with pytest.raises(FargvError, match="cycle"):
+            parser.parse(["prog", f"@{a}"])
+
+    def test_missing_file(self):
+        parser = ArgumentParser(response_files=True)
+        with pytest.raises(FargvError, match="Cannot read response file"):
+            parser.parse(["prog", "@/no_such_rsp_xyz.txt"])
+
+    def test_escape_and_stdin_passthrough(self):
+        parser = ArgumentParser(response_files=True)
+        assert parser.expand_response_files(["prog", "@@lit", "@-"]) == ["prog", "@lit", "@-"]
+
+    def test_disabled_by_default(self):
+        res = fargv.parse({"files": []}, ["prog", "@x.txt"], auto_define_config=False)[0]
+        assert res.files == ["@x.txt"]
+
+    def test_config_inside_response_file(self, tmp_path):
+        cfg = tmp_path / "cfg.json"
+        cfg.write_text('{"lr": 0.5}')
+        rsp = tmp_path / "args.txt"
+        rsp.write_text(f"--config={cfg}\n")
+        p, _ = fargv.parse({"lr": 0.1}, ["prog", f"@{rsp}"], response_files=True)
+        assert p.lr == 0.5
+
+    def test_sources_variadic_keeps_its_at_tokens(self, tmp_path):
+        items = tmp_path / "items.txt"
+        items.write_text("a\nb\n")
+        rsp = tmp_path / "args.txt"
+        rsp.write_text("--count=3\n")
+        parser = ArgumentParser(response_files=True)
+        parser._add_parameter(FargvInt(0, name="count"))
+        parser._add_parameter(FargvVariadic(name="files", sources=True))
+        assert parser.expand_response_files(["prog", f"@{rsp}", "--files", f"@{items}"]) == \
+            ["prog", "--count=3", "--files", f"@{items}"]
+        res = parser.parse(["prog", f"@{rsp}", "--files", f"@{items}", "@-"])
+        assert res["count"] == 3
+        assert res["files"].tokens == [f"@{items}", "@-"]
+
+    def test_response_file_can_name_sources(self, tmp_path):
+        from fargv.parameters.collection import VariadicSource
+        items = tmp_path / "items.txt"
+        items.write_text("x\ny\n")
+        rsp = tmp_path / "args.txt"
+        rsp.write_text(f"--count\n@{tmp_path / 'count.txt'}\n--files\n@{items}\n")
+        (tmp_path / "count.txt").write_text("4\n")
+        parser = ArgumentParser(response_files=True)
+        parser._add_parameter(FargvInt(0, name="count"))
+        parser._add_parameter(FargvVariadic(name="files", sources=True))
+        res = parser.parse(["prog", f"@{rsp}"])
+        assert res["count"] == 4
+        assert isinstance(res["files"], VariadicSource)   # streamed, not inlined
+        assert list(res["files"]) == ["x", "y"]
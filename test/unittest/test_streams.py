@@ -0,0 +1,320 @@
+import io
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from fargv.parameters import (
+    FargvError, FargvBinaryInput, FargvStream, FargvOutputStream,
+    FargvVariadic, FargvExistingFile,
+)
+from fargv.parameters.collection import VariadicShard, VariadicSource
+from fargv.parser import ArgumentParser
+
+
+def parse(params_list, argv):
+    p = ArgumentParser(long_prefix="--", short_prefix="-")
+    for param in params_list:
+        p._add_parameter(param)
+    return p.parse(["prog"] + argv)
+
+
+# ---------------------------------------------------------------------------
+# FargvBinaryInput
+# ---------------------------------------------------------------------------
+
+class TestFargvBinaryInput:
+    def test_default_is_stdin_buffer(self):
+        p = FargvBinaryInput(name="data")
+        assert p.value is getattr(sys.stdin, "buffer", sys.stdin)
+        assert p.value_str == "sys.stdin.buffer"
+
+    def test_reader_readinto(self, tmp_path):
+        f = tmp_path / "blob.bin"
+        f.write_bytes(bytes(range(16)))
+        param = FargvBinaryInput(name="data")
+        res = parse([param], [f"--data={f}"])
+        buf = bytearray(8)
+        assert res["data"].readinto(buf) == 8
+        assert bytes(buf) == bytes(range(8))
+        param._release()
+
+    def test_mmap_zero_copy_slice(self, tmp_path):
+        f = tmp_path / "blob.bin"
+        f.write_bytes(b"abcdefgh")
+        p = FargvBinaryInput(name="data", mmap=True)
+        p.ingest_value_strings(str(f))
+        assert isinstance(p.value, memoryview)
+        assert bytes(p.value[2:5]) == b"cde"
+        assert p.value_str == f"mmap('{f}')"
+        p._release()
+
+    def test_mmap_empty_file(self, tmp_path):
+        f = tmp_path / "empty.bin"
+        f.write_bytes(b"")
+        p = FargvBinaryInput(name="data", mmap=True)
+        p.ingest_value_strings(str(f))
+        assert bytes(p.value) == b""
+
+    def test_mmap_stdin_falls_back_to_reader(self):
+        p = FargvBinaryInput(name="data", mmap=True)
+        p.ingest_value_strings("stdin")
+        assert not isinstance(p.value, memoryview)
+
+    def test_missing_file_raises(self):
+        p = FargvBinaryInput(name="data")
+        with pytest.raises(FargvError, match="does not exist"):
+            p.ingest_value_strings("/no_such_file_xyz.bin")
+
+    def test_evaluate_accepts_reader(self):
+        p = FargvBinaryInput(name="data")
+        reader = io.BufferedReader(io.BytesIO(b"xyz"))
+        assert p.evaluate(reader) is reader
+
+    @pytest.mark.parametrize("use_mmap", [False, True])
+    def test_value_outlives_parser(self, tmp_path, use_mmap):
+        import gc
+        import fargv
+        f = tmp_path / "blob.bin"
+        f.write_bytes(b"abcdefgh")
+        definition = {"w": FargvBinaryInput(name="w", mmap=use_mmap)}
+        p, _ = fargv.parse(definition, given_parameters=["prog", f"--w={f}"], return_type="dict")
+        del definition
+        gc.collect()
+        data = p["w"]
+        assert (bytes(data[:3]) if use_mmap else data.read(3)) == b"abc"
+
+    def test_validate_value_strings(self, tmp_path):
+        f = tmp_path / "blob.bin"
+        f.write_bytes(b"x")
+        p = FargvBinaryInput(name="data")
+        assert p.validate_value_strings(str(f), "stdin")
+        assert not p.validate_value_strings(str(Path(tmp_path) / "missing"))
+
+
+# ---------------------------------------------------------------------------
+# FargvOutputStream — atomic / buffering / background
+# ---------------------------------------------------------------------------
+
+class TestFargvOutputStreamOptions:
+    def test_atomic_renames_on_close(self, tmp_path):
+        target = tmp_path / "out.txt"
+        p = FargvOutputStream(name="out", atomic=True)
+        p.ingest_value_strings(str(target))
+        p.value.write("hello")
+        assert not target.exists()
+        p.value.close()
+        assert target.read_text() == "hello"
+        assert list(tmp_path.iterdir()) == [target]
+
+    def test_atomic_discarded_on_exception(self, tmp_path):
+        target = tmp_path / "out.txt"
+        p = FargvOutputStream(name="out", atomic=True)
+        p.ingest_value_strings(str(target))
+        with pytest.raises(RuntimeError):
+            with p.value as fh:
+                fh.write("partial")
+                raise RuntimeError("crash")
+        assert list(tmp_path.iterdir()) == []
+
+    def test_atomic_append_keeps_content(self, tmp_path):
+        target = tmp_path / "log.txt"
+        target.write_text("a\n")
+        fh = open(target, "a")
+        p = FargvStream(fh, name="log", atomic=True)
+        fh.close()
+        p.ingest_value_strings(str(target))
+        p.value.write("b\n")
+        p.value.close()
+        assert target.read_text() == "a\nb\n"
+
+    def test_buffering_forwarded(self, tmp_path):
+        p = FargvOutputStream(name="out", buffering=1)
+        p.ingest_value_strings(str(tmp_path / "out.txt"))
+        assert p.value.line_buffering
+        p.value.close()
+
+    def test_unbuffered_rejected(self):
+        with pytest.raises(FargvError, match="unbuffered"):
+            FargvOutputStream(name="out", buffering=0)
+
+    def test_read_mode_rejects_atomic(self):
+        with pytest.raises(FargvError, match="write or append"):
+            FargvStream(sys.stdin, name="inp", atomic=True)
+
+    def test_background_writer(self, tmp_path):
+        target = tmp_path / "out.txt"
+        p = FargvOutputStream(name="out", background=True, queue_size=4)
+        p.ingest_value_strings(str(target))
+        for i in range(100):
+            p.value.write(f"{i}\n")
+        p.value.flush()
+        assert target.read_text().count("\n") == 100
+        p.value.close()
+        with pytest.raises(ValueError):
+            p.value.write("late")
+
+    def test_background_atomic(self, tmp_path):
+        target = tmp_path / "out.txt"
+        p = FargvOutputStream(name="out", background=True, atomic=True)
+        p.ingest_value_strings(str(target))
+        p.value.write("x")
+        p.value.close()
+        assert target.read_text() == "x"
+
+    def test_background_atomic_discarded_on_exception(self, tmp_path):
+        target = tmp_path / "out.txt"
+        p = FargvOutputStream(name="out", background=True, atomic=True)
+        p.ingest_value_strings(str(target))
+        with pytest.raises(RuntimeError):
+            with p.value as fh:
+                fh.write("partial")
+                raise RuntimeError("crash")
+        assert list(tmp_path.iterdir()) == []
+
+    def test_background_atomic_discarded_on_gc(self, tmp_path):
+        import gc
+        target = tmp_path / "out.txt"
+        p = FargvOutputStream(name="out", background=True, atomic=True)
+        p.ingest_value_strings(str(target))
+        fh = p.value
+        p._value = None
+        fh.write("partial")
+        del fh
+        gc.collect()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_atomic_stream_outlives_parser(self, tmp_path):
+        import gc
+        import fargv
+        target = tmp_path / "out.txt"
+
+        def open_output():
+            p, _ = fargv.parse({"out": FargvOutputStream(name="out", atomic=True)},
+                               given_parameters=["prog", f"--out={target}"], return_type="dict")
+            return p["out"]
+
+        fh = open_output()
+        gc.collect()
+        fh.write("kept")
+        fh.close()
+        assert target.read_text() == "kept"
+
+    def test_atomic_mode_follows_umask(self, tmp_path):
+        target = tmp_path / "out.txt"
+        p = FargvOutputStream(name="out", atomic=True)
+        p.ingest_value_strings(str(target))
+        p.value.close()
+        umask = os.umask(0o022)
+        os.umask(umask)
+        assert target.stat().st_mode & 0o777 == 0o666 & ~umask
+
+    def test_stdout_keyword_not_wrapped(self):
+        p = FargvOutputStream(name="out", atomic=True, background=True)
+        p.ingest_value_strings("stdout")
+        assert p.value is sys.stdout
+
+
+# ---------------------------------------------------------------------------
+# FargvVariadic — streamed @ sources
+# ---------------------------------------------------------------------------
+
+class TestVariadicSources:
+    def test_stdin_nul_separated(self, monkeypatch):
+        monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(b"a.txt\0b c.txt\0")))
+        param = FargvVariadic(name="files", sources=True)
+        res = parse([param], ["--files=@-"])
+        assert isinstance(res["files"], VariadicSource)
+        assert list(res["files"]) == ["a.txt", "b c.txt"]
+        with pytest.raises(FargvError, match="only be iterated once"):
+            list(res["files"])
+
+    def test_file_newline_separated_reiterable(self, tmp_path):
+        lst = tmp_path / "list.txt"
+        lst.write_text("x\r\ny\n\nz")
+        res = parse([FargvVariadic(name="files", sources=True)], ["first", f"@{lst}", "last"])
+        assert res["files"].materialise() == ["first", "x", "y", "z", "last"]
+        assert list(res["files"]) == ["first", "x", "y", "z", "last"]
+
+    def test_small_blocks_split_items(self, tmp_path):
+        lst = tmp_path / "list.txt"
+        lst.write_bytes(b"\0".join(f"item{i}".encode() for i in range(50)))
+        src = VariadicSource([f"@{lst}"], block_size=7)
+        assert list(src) == [f"item{i}" for i in range(50)]
+
+    def test_explicit_separator(self, tmp_path):
+        lst = tmp_path / "list.txt"
+        lst.write_text("a,b,c")
+        assert list(VariadicSource([f"@{lst}"], separator=",")) == ["a", "b", "c"]
+
+    def test_sources_disabled_by_default(self):
+        res = parse([FargvVariadic(name="files")], ["@-"])
+        assert res["files"] == ["@-"]
+
+    def test_item_path_applied_lazily(self, tmp_path):
+        good = tmp_path / "good.txt"
+        good.write_text("x")
+        lst = tmp_path / "list.txt"
+        lst.write_text(f"{good}\n{tmp_path / 'missing.txt'}\n")
+        res = parse([FargvVariadic(name="files", sources=True, item_path=FargvExistingFile())],
+                    [f"@{lst}"])
+        it = iter(res["files"])
+        assert next(it) == good
+        with pytest.raises(FargvError, match="does not exist"):
+            next(it)
+
+    def test_unreadable_source(self):
+        src = VariadicSource(["@/no_such_list_xyz.txt"])
+        with pytest.raises(FargvError, match="Cannot read"):
+            list(src)
+
+
+class TestVariadicShard:
+    ITEMS = [f"f{i}" for i in range(10)]
+
+    @pytest.mark.parametrize("mode", ["round_robin", "hash"])
+    def test_shards_partition_the_items(self, mode):
+        shards = [parse([FargvVariadic(name="files")], self.ITEMS + [f"--fargv_shard={i}/3:{mode}"])["files"]
+                  for i in range(3)]
+        assert sorted(sum(shards, [])) == sorted(self.ITEMS)
+        if mode == "round_robin":
+            assert shards[1] == ["f1", "f4", "f7"]
+
+    def test_hash_is_stable_under_reordering(self):
+        shard = VariadicShard(1, 4, "hash")
+        assert set(shard.select(self.ITEMS)) == set(shard.select(reversed(self.ITEMS)))
+
+    def test_source_is_filtered_lazily_before_conversion(self, tmp_path):
+        good = tmp_path / "good.txt"
+        good.write_text("x")
+        lst = tmp_path / "list.txt"
+        lst.write_text(f"{good}\n{tmp_path / 'missing.txt'}\n")
+        param = FargvVariadic(name="files", sources=True, item_path=FargvExistingFile())
+        res = parse([param], [f"@{lst}", "--fargv_shard", "0/2"])
+        assert isinstance(res["files"], VariadicSource)
+        assert list(res["files"]) == [good]   # the missing file belongs to shard 1
+
+    def test_size_mode_balances_bytes(self, tmp_path):
+        paths = []
+        for i, size in enumerate([100, 1, 1, 1, 50, 50]):
+            path = tmp_path / f"x{i}"
+            path.write_bytes(b"a" * size)
+            paths.append(str(path))
+        shards = [list(VariadicShard(i, 2, "size").select(paths)) for i in range(2)]
+        assert shards[0] == paths[:1]
+        assert shards[1] == paths[1:]
+
+    def test_parser_default_shard(self):
+        p = ArgumentParser(shard="2/5")
+        p._add_parameter(FargvVariadic(name="files"))
+        assert p.parse(["prog"] + self.ITEMS)["files"] == ["f2", "f7"]
+
+    def test_no_variadic(self):
+        with pytest.raises(FargvError, match="no variadic"):
+            parse([], ["--fargv_shard=0/2"])
+
+    @pytest.mark.parametrize("spec", ["2/2", "1", "a/b", "0/2:random"])
+    def test_bad_spec(self, spec):
+        with pytest.raises(FargvError):
+            VariadicShard.parse(spec)
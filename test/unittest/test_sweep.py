@@ -0,0 +1,148 @@
+import json
+
+import pytest
+
+import fargv
+from fargv import FargvError
+from fargv.sweep import SweepAxis, is_sweep_expression
+
+
+DEF = {"lr": 0.01, "bs": 32, "opt": "adam"}
+
+
+class TestSweepGrammar:
+    def test_list_axis(self):
+        axis = SweepAxis.parse("opt", "[adam, sgd, 'a,b']")
+        assert len(axis) == 3
+        assert [axis[i] for i in range(3)] == ["adam", "sgd", "a,b"]
+
+    def test_range_axis_is_lazy(self):
+        axis = SweepAxis.parse("n", "range(0,1000000000,1)")
+        assert isinstance(axis.values, range)
+        assert len(axis) == 1000000000
+        assert axis[999999999] == "999999999"
+
+    def test_linspace_and_logspace(self):
+        assert [SweepAxis.parse("x", "linspace(0,1,3)")[i] for i in range(3)] == ["0.0", "0.5", "1.0"]
+        assert float(SweepAxis.parse("x", "logspace(-3,-1,3)")[2]) == pytest.approx(0.1)
+
+    def test_random_axis_has_no_length(self):
+        axis = SweepAxis.parse("lr", "loguniform(1e-5,1e-2)")
+        assert axis.is_random
+        with pytest.raises(TypeError):
+            len(axis)
+
+    @pytest.mark.parametrize("expr", ["[]", "range(5,1)", "linspace(0,1)", "loguniform(0,1)", "randint(a,b)"])
+    def test_bad_expressions(self, expr):
+        with pytest.raises(FargvError):
+            SweepAxis.parse("x", expr)
+
+    def test_plain_values_are_not_expressions(self):
+        assert not is_sweep_expression("0.01")
+        assert not is_sweep_expression("(1,2)")
+        assert is_sweep_expression("choice(a,b)")
+
+
+class TestSweep:
+    def test_product_order_and_validation(self):
+        s = fargv.sweep(DEF, ["prog", "--lr=[1e-3,1e-4]", "--bs", "range(32,97,32)", "--opt=sgd"])
+        assert len(s) == 6
+        got = [(p.lr, p.bs, p.opt) for p in s]
+        assert got[:3] == [(0.001, 32, "sgd"), (0.001, 64, "sgd"), (0.001, 96, "sgd")]
+        assert all(isinstance(bs, int) for _, bs, _ in got)
+
+    def test_bad_value_fails_in_converter(self):
+        s = fargv.sweep(DEF, ["prog", "--bs=[32,big]"])
+        it = iter(s)
+        assert next(it).bs == 32
+        with pytest.raises((FargvError, ValueError)):
+            next(it)
+
+    def test_zip_groups(self):
+        argv = ["prog", "--lr=[0.1,0.2]", "--bs=[1,2]", "--opt=[a,b,c]", "--fargv_zip=lr,bs"]
+        s = fargv.sweep(DEF, argv)
+        assert len(s) == 6
+        assert {(p.lr, p.bs) for p in s} == {(0.1, 1), (0.2, 2)}
+
+    def test_zip_length_mismatch(self):
+        with pytest.raises(FargvError):
+            fargv.sweep(DEF, ["prog", "--lr=[0.1,0.2]", "--bs=[1,2,3]"], zip_groups=["lr,bs"])
+
+    def test_random_needs_samples(self):
+        with pytest.raises(FargvError):
+            fargv.sweep(DEF, ["prog", "--lr=uniform(0,1)"])
+
+    def test_random_sampling_is_seeded(self):
+        argv = ["prog", "--lr=uniform(0,1)", "--bs=randint(1,4)", "--fargv_samples=5"]
+        a = [(p.lr, p.bs) for p in fargv.sweep(DEF, argv)]
+        b = [(p.lr, p.bs) for p in fargv.sweep(DEF, argv)]
+        c = [(p.lr, p.bs) for p in fargv.sweep(DEF, argv + ["--fargv_seed=1"])]
+        assert a == b and a != c and len(a) == 5
+        assert all(0 <= lr <= 1 and 1 <= bs <= 4 for lr, bs in a)
+
+    def test_config_sweep_section(self, tmp_path):
+        cfg = tmp_path / "sweep.json"
+        cfg.write_text(json.dumps({"opt": "sgd", "fargv_sweep": {"lr": "[0.1,0.2]", "bs": "[1,2]"},
+                                   "fargv_zip": ["lr,bs"]}))
+        got = [(p.lr, p.bs, p.opt) for p in fargv.sweep(DEF, ["prog", f"--config={cfg}"])]
+        assert got == [(0.1, 1, "sgd"), (0.2, 2, "sgd")]
+        # a plain parse of the same file ignores the sweep directives
+        p, _ = fargv.parse(DEF, ["prog", f"--config={cfg}"])
+        assert (p.lr, p.bs, p.opt) == (0.01, 32, "sgd")
+
+    def test_cli_value_overrides_config_axis(self, tmp_path):
+        cfg = tmp_path / "sweep.json"
+        cfg.write_text(json.dumps({"fargv_sweep": {"lr": "[0.1,0.2]", "bs": "[1,2]"}}))
+        s = fargv.sweep(DEF, ["prog", f"--config={cfg}", "--lr=0.5"])
+        assert list(s.axes) == ["bs"]
+        assert [(p.lr, p.bs) for p in s] == [(0.5, 1), (0.5, 2)]
+
+    def test_no_axes_is_one_configuration(self):
+        assert [p.bs for p in fargv.sweep(DEF, ["prog", "--bs=7"])] == [7]
+
+
+class TestTaskIndex:
+    ARGV = ["prog", "--lr=[0.1,0.2,0.3]", "--bs=range(1,5)", "--opt=[a,b]"]
+
+    def test_assignment_matches_enumeration(self):
+        s = fargv.sweep(DEF, self.ARGV)
+        assert [s.assignment(i) for i in range(len(s))] == list(s.assignments())
+
+    def test_zip_assignment_matches_enumeration(self):
+        s = fargv.sweep(DEF, ["prog", "--lr=[0.1,0.2]", "--bs=range(1,5)", "--opt=[a,b]", "--fargv_zip=lr,opt"])
+        assert len(s) == 8
+        assert [s.assignment(i) for i in range(8)] == list(s.assignments())
+
+    def test_huge_grid_is_indexed_directly(self):
+        s = fargv.sweep(DEF, ["prog", "--lr=linspace(0,1,1000001)", "--bs=range(0,1000000)"])
+        assert s.total == 1000001 * 1000000
+        last = s.assignment(s.total - 1)
+        assert last == {"lr": "1.0", "bs": "999999"}
+
+    def test_task_index_flag(self):
+        s = fargv.sweep(DEF, self.ARGV + ["--fargv_task_index=5"])
+        assert len(s) == 1 and s.total == 24
+        (p,) = list(s)
+        assert (p.lr, p.bs, p.opt) == (0.1, 3, "b")
+
+    def test_slurm_env(self, monkeypatch):
+        monkeypatch.setenv("SLURM_ARRAY_TASK_ID", "23")
+        (p,) = list(fargv.sweep(DEF, self.ARGV))
+        assert (p.lr, p.bs, p.opt) == (0.3, 4, "b")
+        # without axes the env var is not ours to interpret
+        assert [q.bs for q in fargv.sweep(DEF, ["prog"])] == [32]
+
+    def test_random_task_index_matches_enumeration(self):
+        argv = ["prog", "--lr=uniform(0,1)", "--fargv_samples=10"]
+        full = list(fargv.sweep(DEF, argv).assignments())
+        assert list(fargv.sweep(DEF, argv, task_index=7).assignments()) == [full[7]]
+
+    def test_index_out_of_range(self):
+        with pytest.raises(FargvError):
+            fargv.sweep(DEF, self.ARGV + ["--fargv_task_index=24"])
+
+    def test_task_count(self, capsys):
+        with pytest.raises(SystemExit) as exc:
+            fargv.sweep(DEF, self.ARGV + ["--fargv_task_count", "--fargv_task_index=99"])
+        assert exc.value.code == 0
+        assert capsys.readouterr().out.strip() == "24"